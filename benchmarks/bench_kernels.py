@@ -0,0 +1,106 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 21:14:36
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 21:14:36
+# @ Description: Benchmark rolling kernels on every available backend
+"""
+
+"""
+Times rolling volatility, rolling beta and rolling max drawdown over a
+synthetic returns panel on each available kernel backend (and pandas for
+reference), and checks that the backends agree.
+
+    python benchmarks/bench_kernels.py --dates 750 --tickers 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer import kernels
+from volatility_analyzer.config import (
+    DEFAULT_ROLLING_BETA_WINDOW,
+    DEFAULT_ROLLING_VOLATILITY_WINDOW,
+    TRADING_DAYS_PER_YEAR,
+)
+
+
+def best_of(repeats, func, *args):
+    """Best wall time of several runs and the last result"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(
+        description="Benchmark rolling kernels on every available backend"
+    )
+    parser.add_argument("--dates", type=int, default=750)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0003, 0.015, (args.dates, args.tickers))
+    benchmark = rng.normal(0.0003, 0.01, args.dates)
+    log_wealth = np.cumsum(np.log1p(returns), axis=0)
+
+    cases = {
+        "rolling_std": (
+            kernels.rolling_std,
+            (returns, DEFAULT_ROLLING_VOLATILITY_WINDOW),
+        ),
+        "rolling_beta": (
+            kernels.rolling_beta,
+            (returns, benchmark, DEFAULT_ROLLING_BETA_WINDOW),
+        ),
+        "rolling_max_drawdown": (
+            kernels.rolling_max_drawdown,
+            (log_wealth, TRADING_DAYS_PER_YEAR),
+        ),
+    }
+
+    print(f"Panel: {args.dates} dates x {args.tickers} tickers")
+    results = {}
+    for backend in kernels.available_backends():
+        kernels.set_backend(backend)
+        print(f"\n[{backend}] {kernels.kernel_info()}")
+        for name, (func, func_args) in cases.items():
+            func(*func_args)  # Warm up (JIT compilation, page faults)
+            elapsed, result = best_of(args.repeats, func, *func_args)
+            results.setdefault(name, {})[backend] = result
+            print(f"  {name:<22} {elapsed * 1000:9.1f} ms")
+
+    frame = pd.DataFrame(returns)
+    market = pd.Series(benchmark)
+
+    def pandas_beta():
+        rolling = frame.rolling(DEFAULT_ROLLING_BETA_WINDOW)
+        variance = market.rolling(DEFAULT_ROLLING_BETA_WINDOW).var()
+        return rolling.cov(market).div(variance, axis=0)
+
+    def pandas_std():
+        return frame.rolling(DEFAULT_ROLLING_VOLATILITY_WINDOW).std()
+
+    pandas_cases = {"rolling_std": pandas_std, "rolling_beta": pandas_beta}
+    print("\n[pandas]")
+    for name, func in pandas_cases.items():
+        elapsed, _ = best_of(args.repeats, func)
+        print(f"  {name:<22} {elapsed * 1000:9.1f} ms")
+
+    if len(kernels.available_backends()) > 1:
+        print("\nMax abs difference between backends:")
+        for name, by_backend in results.items():
+            first, second = (np.asarray(r) for r in by_backend.values())
+            print(f"  {name:<22} {np.nanmax(np.abs(first - second)):.2e}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,34 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 14:48:12
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 14:48:12
+# @ Description:
+"""
+
+"""
+Example 5: Daily, Weekly and Monthly Beta
+"""
+
+import logging
+from volatility_analyzer import VolatilityAnalyzer
+
+
+def run_example():
+    logging.basicConfig(level=logging.INFO)
+    analyzer = VolatilityAnalyzer(years_of_data=5)
+
+    print("\n\n" + "=" * 80)
+    print("EXAMPLE 5: Daily, Weekly and Monthly Beta")
+    print("=" * 80)
+
+    # Daily closes are loaded once and resampled for each frequency
+    reports = analyzer.analyze_stock_frequencies(
+        "IRCTC.NS", "^NSEI", frequencies=("D", "W", "M")
+    )
+    for frequency, report in reports.items():
+        print(f"{frequency}: beta={report.beta_analysis.beta:.3f}")
+
+
+if __name__ == "__main__":
+    run_example()
@@ -19,6 +19,11 @@ setup(
         "yfinance",
         "matplotlib",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "jit": ["numba"],
+        "polars": ["polars"],
+    },
     entry_points={
         "console_scripts": [
             "volatility-analysis=volatility_analyzer.main:main",
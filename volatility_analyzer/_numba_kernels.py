@@ -0,0 +1,220 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 20:52:07
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 20:52:07
+# @ Description: Numba kernels behind volatility_analyzer.kernels (needs numba)
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from volatility_analyzer.kernels import _ZERO_VARIANCE_TOLERANCE
+
+# Every kernel fuses its work into one pass per series over running sums
+# or scans held in scalars (the drawdown scans keep four buffers of one
+# series), instead of one full-size temporary per NumPy operation. Each
+# has a serial driver (releases the GIL, for per-ticker calls from worker
+# threads) and a parallel driver that spreads series across cores.
+
+
+@njit(cache=True, nogil=True)
+def _column_mean(values, j):
+    total = 0.0
+    count = 0
+    for i in range(values.shape[0]):
+        v = values[i, j]
+        if not math.isnan(v):
+            total += v
+            count += 1
+    return total / count if count else 0.0
+
+
+@njit(cache=True, nogil=True)
+def _rolling_std_column(values, j, window, out):
+    n = values.shape[0]
+    shift = _column_mean(values, j)
+    s = 0.0
+    ss = 0.0
+    count = 0
+    for i in range(n):
+        v = values[i, j]
+        if not math.isnan(v):
+            d = v - shift
+            s += d
+            ss += d * d
+            count += 1
+        if i >= window:
+            v = values[i - window, j]
+            if not math.isnan(v):
+                d = v - shift
+                s -= d
+                ss -= d * d
+                count -= 1
+        if i >= window - 1 and count == window and window > 1:
+            variance = max(ss - s * s / count, 0.0) / (count - 1)
+            out[i, j] = math.sqrt(variance)
+        else:
+            out[i, j] = np.nan
+
+
+@njit(cache=True, nogil=True)
+def rolling_std(values, window):
+    out = np.empty(values.shape)
+    for j in range(values.shape[1]):
+        _rolling_std_column(values, j, window, out)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rolling_std_parallel(values, window):
+    out = np.empty(values.shape)
+    for j in prange(values.shape[1]):
+        _rolling_std_column(values, j, window, out)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_beta_column(y, x, j, window, beta, correlation):
+    n = y.shape[0]
+    y_total = 0.0
+    x_total = 0.0
+    pairs = 0
+    for i in range(n):
+        if not (math.isnan(y[i, j]) or math.isnan(x[i, j])):
+            y_total += y[i, j]
+            x_total += x[i, j]
+            pairs += 1
+    y_shift = y_total / pairs if pairs else 0.0
+    x_shift = x_total / pairs if pairs else 0.0
+
+    sx = sy = sxx = syy = sxy = 0.0
+    count = 0
+    for i in range(n):
+        if not (math.isnan(y[i, j]) or math.isnan(x[i, j])):
+            dy = y[i, j] - y_shift
+            dx = x[i, j] - x_shift
+            sx += dx
+            sy += dy
+            sxx += dx * dx
+            syy += dy * dy
+            sxy += dx * dy
+            count += 1
+        if i >= window:
+            k = i - window
+            if not (math.isnan(y[k, j]) or math.isnan(x[k, j])):
+                dy = y[k, j] - y_shift
+                dx = x[k, j] - x_shift
+                sx -= dx
+                sy -= dy
+                sxx -= dx * dx
+                syy -= dy * dy
+                sxy -= dx * dy
+                count -= 1
+
+        beta[i, j] = np.nan
+        correlation[i, j] = np.nan
+        if i >= window - 1 and count == window and window > 1:
+            var_x = sxx - sx * sx / count
+            if var_x > _ZERO_VARIANCE_TOLERANCE * sxx:
+                var_y = syy - sy * sy / count
+                cov = sxy - sx * sy / count
+                beta[i, j] = cov / var_x
+                product = var_x * var_y
+                if product > 0:
+                    correlation[i, j] = cov / math.sqrt(product)
+
+
+@njit(cache=True, nogil=True)
+def rolling_beta(y, x, window):
+    beta = np.empty(y.shape)
+    correlation = np.empty(y.shape)
+    for j in range(y.shape[1]):
+        _rolling_beta_column(y, x, j, window, beta, correlation)
+    return beta, correlation
+
+
+@njit(cache=True, parallel=True)
+def rolling_beta_parallel(y, x, window):
+    beta = np.empty(y.shape)
+    correlation = np.empty(y.shape)
+    for j in prange(y.shape[1]):
+        _rolling_beta_column(y, x, j, window, beta, correlation)
+    return beta, correlation
+
+
+@njit(cache=True, nogil=True)
+def _fmax(a, b):
+    return b if math.isnan(a) or b > a else a
+
+
+@njit(cache=True, nogil=True)
+def _fmin(a, b):
+    return b if math.isnan(a) or b < a else a
+
+
+@njit(cache=True, nogil=True)
+def _rolling_max_drawdown_column(x, j, window, out):
+    n = x.shape[0]
+    prefix_min = np.empty(n)
+    prefix_drawdown = np.empty(n)
+    suffix_max = np.empty(n)
+    suffix_drawdown = np.empty(n)
+
+    # Forward and backward scans inside each block of `window` bars
+    for start in range(0, n, window):
+        end = min(start + window, n)
+        high = low = worst = np.nan
+        for i in range(start, end):
+            v = x[i, j]
+            if not math.isnan(v):
+                high = _fmax(high, v)
+                low = _fmin(low, v)
+                worst = _fmin(worst, v - high)
+            prefix_min[i] = low
+            prefix_drawdown[i] = worst
+        high = low = worst = np.nan
+        for i in range(end - 1, start - 1, -1):
+            v = x[i, j]
+            if not math.isnan(v):
+                high = _fmax(high, v)
+                low = _fmin(low, v)
+                worst = _fmin(worst, low - v)
+            suffix_max[i] = high
+            suffix_drawdown[i] = worst
+
+    count = 0
+    for i in range(n):
+        if not math.isnan(x[i, j]):
+            count += 1
+        if i >= window and not math.isnan(x[i - window, j]):
+            count -= 1
+        out[i, j] = np.nan
+        if i >= window - 1 and count == window and window > 1:
+            first = i - window + 1
+            worst = suffix_drawdown[first]
+            if first % window != 0:
+                worst = min(
+                    worst,
+                    prefix_drawdown[i],
+                    prefix_min[i] - suffix_max[first],
+                )
+            out[i, j] = -math.expm1(min(worst, 0.0))
+
+
+@njit(cache=True, nogil=True)
+def rolling_max_drawdown(x, window):
+    out = np.empty(x.shape)
+    for j in range(x.shape[1]):
+        _rolling_max_drawdown_column(x, j, window, out)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rolling_max_drawdown_parallel(x, window):
+    out = np.empty(x.shape)
+    for j in prange(x.shape[1]):
+        _rolling_max_drawdown_column(x, j, window, out)
+    return out
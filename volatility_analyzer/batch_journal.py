@@ -0,0 +1,157 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 13:10:26
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 13:10:26
+# @ Description: Append-only journal that makes batch runs resumable
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: O_APPEND single writes are still atomic enough
+    fcntl = None
+
+from volatility_analyzer.data_models import BatchResult
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+JournalKey = Tuple[str, str]
+
+
+class BatchJournal:
+    """
+    Durable, append-only record of completed batch analyses.
+
+    Every result is appended as one JSON line with a single write on an
+    O_APPEND descriptor under an exclusive file lock and fsync'ed, so
+    several threads or processes can share one journal. On open, the
+    journal is replayed and the latest entry per (ticker, benchmark) wins;
+    a torn last line from a crash is ignored. Entries carry the settings
+    of the run that produced them (see VolatilityAnalyzer.batch_settings),
+    and a completed entry only counts for a run with the same settings.
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        """
+        Open (or create) a batch journal
+
+        Args:
+            path: Journal file path
+            fsync: Whether to fsync after every record
+        """
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._completed: Dict[JournalKey, Tuple[Optional[Dict], Dict]] = {}
+        self._failed: Dict[JournalKey, str] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._replay()
+
+    def _replay(self):
+        """Load the latest state of every key from disk"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"{self.path}:{line_number}: skipping torn entry")
+                    continue
+                self._apply(entry)
+
+        logger.info(
+            f"Journal {self.path}: {len(self._completed)} completed, "
+            f"{len(self._failed)} failed"
+        )
+
+    def _apply(self, entry: Dict):
+        key = (entry["ticker"], entry["benchmark"])
+        if entry["status"] == "ok":
+            self._completed[key] = (entry.get("settings"), entry["row"])
+            self._failed.pop(key, None)
+        elif key not in self._completed:
+            self._failed[key] = entry.get("error", "")
+
+    def _append(self, entry: Dict):
+        data = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+
+            # Terminate a line torn by a crashed writer so this entry stays intact
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b"\n":
+                data = b"\n" + data
+
+            os.write(fd, data)
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def record(self, result: BatchResult, settings: Optional[Dict] = None):
+        """
+        Durably record the outcome of one analysis
+
+        Args:
+            result: Completed or failed batch result
+            settings: JSON-serializable settings the result was computed with
+        """
+        entry = {
+            "ticker": result.ticker,
+            "benchmark": result.benchmark_ticker,
+            "settings": settings,
+            "status": "ok" if result.ok else "error",
+            "row": result.to_row() if result.ok else None,
+            "error": result.error,
+            "time": time.time(),
+        }
+        with self._lock:
+            self._append(entry)
+            self._apply(entry)
+
+    def completed_row(
+        self, ticker: str, benchmark_ticker: str, settings: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Result row of a completed analysis, or None if it must (re)run
+
+        Args:
+            ticker: Stock ticker symbol
+            benchmark_ticker: Benchmark ticker symbol
+            settings: Settings of the current run; a row computed with
+                different settings is not reused
+
+        Returns:
+            The journaled result row, or None
+        """
+        with self._lock:
+            completed = self._completed.get((ticker, benchmark_ticker))
+        if completed is None or completed[0] != settings:
+            return None
+        return completed[1]
+
+    @property
+    def completed_count(self) -> int:
+        with self._lock:
+            return len(self._completed)
+
+    @property
+    def failures(self) -> Dict[JournalKey, str]:
+        """Keys whose latest outcome is a failure, with their error"""
+        with self._lock:
+            return dict(self._failed)
@@ -0,0 +1,258 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 11:02:37
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 11:02:37
+# @ Description: In-memory caching and request coalescing utilities
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_nbytes(obj: Any) -> int:
+    """
+    Estimate the in-memory size of a cached object
+
+    Args:
+        obj: DataFrame, Series, ndarray, container or dataclass
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(obj, pd.DataFrame) else usage)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (bytes, bytearray, str)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(k) + estimate_nbytes(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(v) for v in obj)
+    if hasattr(obj, "__dataclass_fields__"):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(getattr(obj, name)) for name in obj.__dataclass_fields__
+        )
+    return sys.getsizeof(obj)
+
+
+class LRUByteCache:
+    """Thread-safe LRU cache bounded by the estimated byte size of its values"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize LRU cache
+
+        Args:
+            max_bytes: Memory budget for all cached values
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value and mark it as most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None):
+        """
+        Insert a value, evicting least recently used entries over budget
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            nbytes: Size of the value (estimated when None)
+        """
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            logger.debug(f"Not caching {key}: {nbytes} bytes exceeds budget")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self.current_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache usage counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` once per key among concurrent callers
+
+        Args:
+            key: Identity of the work
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            Result of the shared execution
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        return future.result()
+
+
+class RangeSingleFlight:
+    """
+    Coalesces concurrent loads of overlapping ranges of the same key.
+
+    A caller whose [start, end] range lies within a range already being
+    loaded for its key waits for that load and receives its result sliced
+    to the requested range. Other callers start their own load, which later
+    callers can join in turn.
+    """
+
+    def __init__(self, slice_result: Callable[[Any, Any, Any], Any]):
+        """
+        Initialize coalescer
+
+        Args:
+            slice_result: (result, start, end) -> the part of a loaded
+                result covering [start, end]
+        """
+        self.slice_result = slice_result
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, List[Tuple[Any, Any, Future]]] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, start: Any, end: Any, fn: Callable[[], Any]) -> Any:
+        """
+        Load [start, end] of a key, sharing a covering in-flight load
+
+        Args:
+            key: Identity of the data, e.g. (ticker, interval)
+            start: Start of the requested range
+            end: End of the requested range
+            fn: Zero-argument callable loading exactly [start, end]
+
+        Returns:
+            The loaded result, or a covering load's result sliced to
+            [start, end]
+        """
+        with self._lock:
+            loads = self._in_flight.setdefault(key, [])
+            for load_start, load_end, future in loads:
+                if load_start <= start and end <= load_end:
+                    self.coalesced += 1
+                    covering = (load_start, load_end, future)
+                    break
+            else:
+                covering = None
+                entry = (start, end, Future())
+                loads.append(entry)
+
+        if covering is not None:
+            load_start, load_end, future = covering
+            result = future.result()
+            if (load_start, load_end) == (start, end):
+                return result
+            return self.slice_result(result, start, end)
+
+        future = entry[2]
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                loads = self._in_flight.get(key, [])
+                loads.remove(entry)
+                if not loads:
+                    self._in_flight.pop(key, None)
+
+        return future.result()
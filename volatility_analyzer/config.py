@@ -11,6 +11,65 @@
 # ============================================================================
 
 TRADING_DAYS_PER_YEAR = 252  # Standard US market trading days
+TRADING_MINUTES_PER_SESSION = 375  # NSE regular session 09:15-15:30
+
+# ============================================================================
+# INTERVAL CONFIGURATION
+# ============================================================================
+
+DEFAULT_INTERVAL = "1d"
+
+# Bar length in minutes for the intraday intervals yfinance supports
+INTRADAY_INTERVAL_MINUTES = {
+    "1m": 1,
+    "2m": 2,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "60m": 60,
+    "90m": 90,
+    "1h": 60,
+}
+
+# How far back yfinance serves each intraday interval (days)
+INTRADAY_MAX_LOOKBACK_DAYS = {
+    "1m": 29,
+    "2m": 59,
+    "5m": 59,
+    "15m": 59,
+    "30m": 59,
+    "60m": 729,
+    "90m": 59,
+    "1h": 729,
+}
+
+INTRADAY_CHUNK_DAYS = 7  # Days of intraday bars fetched and processed at once
+
+# ============================================================================
+# RETURN FREQUENCY CONFIGURATION (resampled from daily closes)
+# ============================================================================
+
+DEFAULT_FREQUENCY = "D"
+
+# pandas resample rule per frequency (None = use daily closes as is)
+FREQUENCY_RESAMPLE_RULES = {
+    "D": None,
+    "W": "W-FRI",
+    "M": "ME",
+}
+
+PERIODS_PER_YEAR = {
+    "D": TRADING_DAYS_PER_YEAR,
+    "W": 52,
+    "M": 12,
+}
+
+# (rolling volatility window, rolling beta window) in periods
+FREQUENCY_ROLLING_WINDOWS = {
+    "D": (30, 60),  # ~1.5 and 3 months
+    "W": (13, 26),  # 1 quarter and 6 months
+    "M": (6, 12),  # 6 months and 1 year
+}
 
 # ============================================================================
 # DEFAULT ANALYSIS PARAMETERS
@@ -20,6 +79,66 @@ DEFAULT_YEARS_OF_DATA = 3
 DEFAULT_ROLLING_VOLATILITY_WINDOW = 30  # Days
 DEFAULT_ROLLING_BETA_WINDOW = 60  # Days
 
+# ============================================================================
+# COMPUTE KERNELS
+# ============================================================================
+
+# "auto" uses Numba kernels when numba is installed, else NumPy kernels
+DEFAULT_KERNEL_BACKEND = "auto"
+KERNEL_BACKEND_ENV_VAR = "VOLATILITY_ANALYZER_KERNELS"  # Overrides the default
+KERNEL_PARALLEL_MIN_SERIES = 64  # Panels this wide run across all cores
+
+# Backends of compare_multiple_stocks: "pandas" builds full per-stock
+# reports, "polars" runs the comparison metrics as lazy Polars queries
+COMPARISON_BACKENDS = ("pandas", "polars")
+DEFAULT_COMPARISON_BACKEND = "pandas"
+POLARS_STREAMING = True  # Collect Polars queries with the streaming engine
+
+# ============================================================================
+# BOOTSTRAP CONFIDENCE INTERVALS
+# ============================================================================
+
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+DEFAULT_BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_MAX_BATCH_MB = 64  # Memory for resampled arrays per vectorized step
+
+# ============================================================================
+# TAIL RISK (VaR / EXPECTED SHORTFALL)
+# ============================================================================
+
+DEFAULT_VAR_CONFIDENCE = 0.95
+DEFAULT_VAR_HORIZON_DAYS = 1
+DEFAULT_MC_SIMULATIONS = 10000  # Monte Carlo paths per series
+MC_MAX_BATCH_MB = 64  # Memory for one batch of simulated paths
+
+# ============================================================================
+# VOLATILITY REGIMES
+# ============================================================================
+
+VOLATILITY_REGIME_LOOKBACK_YEARS = 1  # Trailing history of rolling volatility
+VOLATILITY_REGIME_QUANTILES = (0.2, 0.8)  # Band around the median
+# (upper percentile, label) of current volatility within its trailing history
+VOLATILITY_REGIME_BANDS = (
+    (20, "low"),
+    (80, "normal"),
+    (95, "elevated"),
+    (100, "extreme"),
+)
+
+# ============================================================================
+# DRAWDOWNS
+# ============================================================================
+
+ROLLING_DRAWDOWN_WINDOW_YEARS = 1  # Rolling max drawdown window
+DRAWDOWN_MAX_BATCH_MB = 64  # Memory cap for one batch of panel scans
+
+# ============================================================================
+# FACTOR REGRESSION
+# ============================================================================
+
+MARKET_FACTOR = "Market"  # Factor name of the benchmark in factor regressions
+REGRESSION_MAX_BATCH_MB = 64  # Memory cap for one batch of window statistics
+
 # ============================================================================
 # CACHE CONFIGURATION
 # ============================================================================
@@ -43,3 +162,110 @@ BETA_THRESHOLDS = {
     "aggressive": 1.5,  # Beta 1.2-1.5
     # Beta > 1.5 = highly aggressive
 }
+
+# Categories above the last threshold
+VOLATILITY_TOP_CATEGORY = "very_high"
+BETA_TOP_CATEGORY = "highly_aggressive"
+
+# ============================================================================
+# PAIRWISE CORRELATION
+# ============================================================================
+
+DEFAULT_CORRELATION_WINDOW = 60  # Days
+CORRELATION_MAX_BATCH_MB = 64  # Memory cap for one batch of stock pairs
+
+# ============================================================================
+# GROUP AGGREGATION
+# ============================================================================
+
+# (upper bound, label) market-cap buckets in the currency of the caps given
+MARKET_CAP_BUCKETS = (
+    (2e9, "small"),
+    (1e10, "mid"),
+    (float("inf"), "large"),
+)
+GROUP_MAX_RETURN_CHUNKS = 64  # Member return chunks held before merging
+
+# ============================================================================
+# METRIC SNAPSHOT STORE
+# ============================================================================
+
+SNAPSHOT_PARTITION_PREFIX = "date="  # Directory of each snapshot date
+SNAPSHOT_AS_OF_BATCH_PARTITIONS = 32  # Partitions read per step of an as-of lookup
+
+# ============================================================================
+# COMPARISON PLOTS
+# ============================================================================
+
+COMPARISON_BAR_MAX_TICKERS = 50  # Larger universes get the density view
+LARGE_COMPARISON_TOP_N = 15  # Tickers in each top / bottom highlight panel
+LARGE_COMPARISON_HEXBIN_GRIDSIZE = 40
+LARGE_COMPARISON_HISTOGRAM_BINS = 50
+
+# ============================================================================
+# BATCH SCREENING CONFIGURATION
+# ============================================================================
+
+DEFAULT_SCREEN_WORKERS = 4  # Concurrent analyses in the screen command
+DEFAULT_PARQUET_ROW_GROUP_SIZE = 256  # Rows buffered per Parquet row group
+
+# ============================================================================
+# MEMORY BUDGET
+# ============================================================================
+
+# Fractions of a batch's memory budget at which concurrency halves (high)
+# or grows back by one (low)
+MEMORY_BUDGET_HIGH_WATERMARK = 0.9
+MEMORY_BUDGET_LOW_WATERMARK = 0.7
+
+# ============================================================================
+# SHARDED EXECUTION CONFIGURATION
+# ============================================================================
+
+DEFAULT_NUM_SHARDS = 8  # Shards a ticker universe is partitioned into
+DEFAULT_SHARD_FORMAT = "parquet"  # Columnar output format of each shard
+SHARD_LEASE_SECONDS = 6 * 60 * 60  # Idle time after which a running claim is stale
+
+# ============================================================================
+# WATCH MODE CONFIGURATION
+# ============================================================================
+
+DEFAULT_WATCH_POLL_SECONDS = 60 * 60  # Time between polls for new data
+WATCH_PROBE_DAYS = 7  # Recent days fetched to detect new or revised bars
+WATCH_PROBE_BATCH_SIZE = 100  # Tickers probed per bulk download
+
+# ============================================================================
+# ANALYSIS SERVER CONFIGURATION
+# ============================================================================
+
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_SERVER_MEMORY_BUDGET_MB = 512  # Warm cache budget for the service
+
+# ============================================================================
+# UPSTREAM FETCH SCHEDULING
+# ============================================================================
+
+FETCH_RATE_PER_SECOND = 2.0  # Maximum sustained requests per second
+FETCH_MIN_RATE_PER_SECOND = 0.1  # Floor when backing off after throttling
+FETCH_BURST = 5  # Requests allowed back to back
+FETCH_MAX_RETRIES = 4
+FETCH_BACKOFF_BASE_SECONDS = 0.5
+FETCH_BACKOFF_MAX_SECONDS = 30.0
+
+PRICE_DATA_HOST = "query1.finance.yahoo.com"
+QUOTE_DATA_HOST = "query2.finance.yahoo.com"
+DEFAULT_HOST_CONCURRENCY = 4
+FETCH_HOST_CONCURRENCY = {
+    PRICE_DATA_HOST: 4,
+    QUOTE_DATA_HOST: 2,
+}
+
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failures before skipping upstream
+CIRCUIT_RESET_SECONDS = 60  # Cool-down before a trial request
+# Log (in the cache directory) of the ranges the disk cache already holds;
+# reading those needs no rate limit token and works while upstream is down
+FETCH_RANGE_LOG_FILE = "fetched_ranges.jsonl"
+# Loaded price frames kept in memory; sub-ranges are served from them, and
+# they are the fallback while upstream is down
+FETCH_PRICE_CACHE_MB = 256
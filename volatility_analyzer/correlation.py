@@ -0,0 +1,271 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 23:58:16
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 23:58:16
+# @ Description: Rolling pairwise correlation of stocks and correlation clusters
+"""
+
+from itertools import combinations, product
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    CORRELATION_MAX_BATCH_MB,
+    DEFAULT_CORRELATION_WINDOW,
+)
+from volatility_analyzer.kernels import (
+    _ZERO_VARIANCE_TOLERANCE,
+    _centered,
+    _window_sums,
+)
+
+
+class CorrelationCalculator:
+    """
+    Rolling correlation and covariance between many stock pairs.
+
+    Every series is centered on its mean once, and its trailing window sums
+    (count, sum, sum of squares) are computed once and shared by all the
+    pairs it appears in; a pair only adds the window sums of its
+    cross-products. Pairs are processed in batches sized to a memory cap
+    and results are stored as float32, so thousands of pairs over years of
+    daily data stay cheap.
+
+    As with pandas rolling(window).corr(), a window yields a value only if
+    both series have a return on every bar of it.
+    """
+
+    @staticmethod
+    def block_pairs(
+        tickers: Sequence[str], others: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Pairs of a block of the universe
+
+        Args:
+            tickers: Tickers of the block
+            others: Second set of tickers; None pairs the block with itself
+                (each unordered pair once)
+
+        Returns:
+            List of (first, second) ticker pairs
+        """
+        if others is None:
+            return list(combinations(tickers, 2))
+        return [(a, b) for a, b in product(tickers, others) if a != b]
+
+    @staticmethod
+    def rolling_pairs(
+        returns_panel: pd.DataFrame,
+        pairs: Sequence[Tuple[str, str]],
+        window: int = DEFAULT_CORRELATION_WINDOW,
+        max_batch_mb: float = CORRELATION_MAX_BATCH_MB,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Rolling correlation and covariance of stock pairs
+
+        Args:
+            returns_panel: Date x ticker returns, NaN for missing bars
+            pairs: (first, second) ticker pairs, e.g. from block_pairs()
+            window: Rolling window in bars (ending at each date)
+            max_batch_mb: Memory cap for the working arrays of one batch
+                of pairs
+
+        Returns:
+            Tuple of (correlation, covariance) date x pair float32 frames
+            with (First, Second) column levels; covariance is per bar
+            (ddof=1). NaN unless both series are complete in the window or
+            when either is constant in it.
+        """
+        pairs = list(pairs)
+        columns = pd.MultiIndex.from_tuples(pairs, names=["First", "Second"])
+        n_dates = len(returns_panel)
+        correlation = np.full((n_dates, len(pairs)), np.nan, dtype=np.float32)
+        covariance = np.full((n_dates, len(pairs)), np.nan, dtype=np.float32)
+
+        if pairs and window >= 2 and n_dates >= window:
+            missing = sorted(
+                {t for pair in pairs for t in pair} - set(returns_panel.columns)
+            )
+            if missing:
+                raise KeyError(f"Tickers not in the returns panel: {missing}")
+            positions = returns_panel.columns.get_indexer(
+                [ticker for pair in pairs for ticker in pair]
+            )
+            first, second = positions[0::2], positions[1::2]
+
+            x = returns_panel.to_numpy(dtype=np.float64)
+            valid = np.isfinite(x)
+            d = _centered(x, valid)
+            complete = _window_sums(valid.astype(np.float64), window) == window
+            s = _window_sums(d, window)
+            ss = _window_sums(d * d, window)
+
+            # Cross-products, their cumulative sums and about six window
+            # arrays of the batch are alive at once
+            per_pair_bytes = 8 * 8 * n_dates
+            batch = max(1, int(max_batch_mb * 1024 * 1024 // per_pair_bytes))
+            for start in range(0, len(pairs), batch):
+                a = first[start:start + batch]
+                b = second[start:start + batch]
+                sxy = _window_sums(d[:, a] * d[:, b], window)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    cov = sxy - s[:, a] * s[:, b] / window
+                    var_a = ss[:, a] - s[:, a] * s[:, a] / window
+                    var_b = ss[:, b] - s[:, b] * s[:, b] / window
+                    usable = (
+                        complete[:, a]
+                        & complete[:, b]
+                        & (var_a > _ZERO_VARIANCE_TOLERANCE * ss[:, a])
+                        & (var_b > _ZERO_VARIANCE_TOLERANCE * ss[:, b])
+                    )
+                    cols = slice(start, start + len(a))
+                    r = np.clip(cov / np.sqrt(var_a * var_b), -1.0, 1.0)
+                    correlation[window - 1:, cols] = np.where(usable, r, np.nan)
+                    covariance[window - 1:, cols] = np.where(
+                        complete[:, a] & complete[:, b], cov / (window - 1), np.nan
+                    )
+
+        return (
+            pd.DataFrame(correlation, index=returns_panel.index, columns=columns),
+            pd.DataFrame(covariance, index=returns_panel.index, columns=columns),
+        )
+
+    @staticmethod
+    def correlation_matrix(
+        returns_panel: pd.DataFrame,
+        window: int = DEFAULT_CORRELATION_WINDOW,
+        end=None,
+    ) -> pd.DataFrame:
+        """
+        Correlation matrix of one window, e.g. the latest
+
+        Args:
+            returns_panel: Date x ticker returns, NaN for missing bars
+            window: Window length in bars
+            end: Last date of the window (None = last date of the panel)
+
+        Returns:
+            Ticker x ticker correlation matrix of the tickers with a return
+            on every bar of the window and some variation in it
+        """
+        panel = returns_panel if end is None else returns_panel.loc[:end]
+        recent = panel.iloc[-window:]
+        recent = recent.loc[:, recent.notna().all() & (recent.std() > 0)]
+        d = recent.to_numpy(dtype=np.float64)
+        d = d - d.mean(axis=0)
+        covariance = d.T @ d
+        scale = np.sqrt(np.diag(covariance))
+        correlation = np.clip(covariance / np.outer(scale, scale), -1, 1)
+        np.fill_diagonal(correlation, 1.0)
+        return pd.DataFrame(correlation, index=recent.columns, columns=recent.columns)
+
+    @staticmethod
+    def linkage(correlation: pd.DataFrame) -> np.ndarray:
+        """
+        Average-linkage hierarchical clustering of a correlation matrix
+
+        Distances are sqrt((1 - correlation) / 2), 0 for perfectly and 1
+        for perfectly inversely correlated stocks. Each step merges the
+        two closest clusters and updates the distances to the merged one
+        as size-weighted averages (Lance-Williams), O(n^2) per merge.
+
+        Args:
+            correlation: Ticker x ticker correlation matrix
+
+        Returns:
+            (n - 1) x 4 linkage matrix in scipy's format: merged cluster
+            ids (tickers are 0..n-1, the cluster of step k is n + k), the
+            merge distance and the merged cluster's size
+        """
+        n = len(correlation)
+        distance = np.sqrt(
+            np.clip((1.0 - correlation.to_numpy(dtype=np.float64)) / 2, 0, 1)
+        )
+        np.fill_diagonal(distance, np.inf)
+        sizes = np.ones(n)
+        ids = np.arange(n)
+        merges = np.empty((max(n - 1, 0), 4))
+
+        for step in range(n - 1):
+            i, j = divmod(int(np.argmin(distance)), n)
+            i, j = min(i, j), max(i, j)
+            merges[step] = (
+                min(ids[i], ids[j]),
+                max(ids[i], ids[j]),
+                distance[i, j],
+                sizes[i] + sizes[j],
+            )
+            # Cluster j joins i; row / column j leave the search
+            merged = (sizes[i] * distance[i] + sizes[j] * distance[j]) / (
+                sizes[i] + sizes[j]
+            )
+            distance[i, :] = merged
+            distance[:, i] = merged
+            distance[i, i] = np.inf
+            distance[j, :] = np.inf
+            distance[:, j] = np.inf
+            sizes[i] += sizes[j]
+            ids[i] = n + step
+        return merges
+
+    @staticmethod
+    def cluster(correlation: pd.DataFrame, n_clusters: int) -> pd.Series:
+        """
+        Correlation clusters of stocks
+
+        Args:
+            correlation: Ticker x ticker correlation matrix, e.g. from
+                correlation_matrix()
+            n_clusters: Number of clusters to cut the tree into
+
+        Returns:
+            Cluster number (0 for the largest) per ticker, ordered by
+            cluster and then by the tree's leaf order so that correlated
+            stocks sit next to each other
+        """
+        n = len(correlation)
+        merges = CorrelationCalculator.linkage(correlation)
+        n_clusters = min(max(n_clusters, 1), max(n, 1))
+
+        # Replay the merges up to the cut, pointing each id at its parent
+        parent = np.arange(2 * n - 1 if n else 0)
+        for step in range(n - n_clusters):
+            left, right = merges[step, :2].astype(int)
+            parent[left] = parent[right] = n + step
+
+        def root(node: int) -> int:
+            while parent[node] != node:
+                node = parent[node]
+            return node
+
+        roots = np.array([root(leaf) for leaf in range(n)])
+        order = CorrelationCalculator._leaf_order(merges, n)
+        # Number clusters by size, largest first
+        unique, counts = np.unique(roots, return_counts=True)
+        by_size = unique[np.argsort(-counts, kind="stable")]
+        rank = {r: k for k, r in enumerate(by_size)}
+        labels = pd.Series(
+            [rank[r] for r in roots], index=correlation.index, name="Cluster"
+        )
+        ordered = labels.iloc[order]
+        return ordered.iloc[np.argsort(ordered.to_numpy(), kind="stable")]
+
+    @staticmethod
+    def _leaf_order(merges: np.ndarray, n: int) -> List[int]:
+        """Leaves left to right as in a dendrogram of the linkage"""
+        if n <= 1:
+            return list(range(n))
+        order = []
+        stack = [2 * n - 2]
+        while stack:
+            node = stack.pop()
+            if node < n:
+                order.append(node)
+            else:
+                left, right = merges[node - n, :2].astype(int)
+                stack.extend((right, left))
+        return order
@@ -6,31 +6,322 @@
 # @ Description: Data fetching and caching logic
 """
 
+import json
+import os
+import threading
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 from yf_cache import YFinanceDataDownloader
 
+from volatility_analyzer.caching import (
+    LRUByteCache,
+    RangeSingleFlight,
+    estimate_nbytes,
+)
+from volatility_analyzer.config import (
+    PRICE_DATA_HOST,
+    QUOTE_DATA_HOST,
+    DEFAULT_HOST_CONCURRENCY,
+    FETCH_PRICE_CACHE_MB,
+    FETCH_RANGE_LOG_FILE,
+    DEFAULT_INTERVAL,
+    INTRADAY_INTERVAL_MINUTES,
+    WATCH_PROBE_BATCH_SIZE,
+)
+from volatility_analyzer.fetch_scheduler import FetchScheduler, UpstreamUnavailableError
 from volatility_analyzer.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+class FetchedRangeLog:
+    """
+    Date ranges a disk-caching downloader already holds.
+
+    A disk-cache-first downloader such as yf_cache answers a range it once
+    returned from its files, without a network request. Every range loaded
+    through it is appended here as one JSON line (a single O_APPEND write,
+    so processes sharing the cache directory can share the log) and the
+    log is replayed on open; overlapping ranges of a ticker are merged.
+    Losing a line only costs a scheduled request later.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a range log
+
+        Args:
+            path: Log file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # (ticker, interval) -> disjoint (start, end) ranges
+        self._ranges: Dict[Tuple[str, str], List[Tuple]] = {}
+        self._replay()
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._apply(entry)
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue  # Torn line of a crashed writer
+
+    def _apply(self, entry: Dict):
+        if entry.get("forget"):
+            if entry["ticker"] is None:
+                self._ranges.clear()
+            else:
+                for key in [k for k in self._ranges if k[0] == entry["ticker"]]:
+                    del self._ranges[key]
+            return
+
+        key = (entry["ticker"], entry["interval"])
+        start, end = pd.Timestamp(entry["start"]), pd.Timestamp(entry["end"])
+        kept = []
+        for loaded_start, loaded_end in self._ranges.get(key, []):
+            if loaded_start <= end and start <= loaded_end:
+                start, end = min(start, loaded_start), max(end, loaded_end)
+            else:
+                kept.append((loaded_start, loaded_end))
+        self._ranges[key] = kept + [(start, end)]
+
+    def _append(self, entry: Dict):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        data = (json.dumps(entry) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def covers(
+        self, ticker: str, interval: str, start: pd.Timestamp, end: pd.Timestamp
+    ) -> bool:
+        """Whether [start, end] lies inside one range already loaded"""
+        with self._lock:
+            ranges = self._ranges.get((ticker, interval), [])
+            return any(first <= start and end <= last for first, last in ranges)
+
+    def add(self, ticker: str, interval: str, start: pd.Timestamp, end: pd.Timestamp):
+        """Record a range the downloader has loaded (and stored)"""
+        entry = {
+            "ticker": ticker,
+            "interval": interval,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        }
+        with self._lock:
+            self._apply(entry)
+            self._append(entry)
+
+    def forget(self, ticker: Optional[str] = None):
+        """Drop the ranges of a ticker (None = all), e.g. after clearing its files"""
+        entry = {"ticker": ticker, "forget": True}
+        with self._lock:
+            self._apply(entry)
+            self._append(entry)
+
+
 class DataFetcher:
     """Fetches stock and benchmark data with caching"""
 
-    def __init__(self, cache_dir: str = "yfinance_data"):
+    def __init__(
+        self,
+        cache_dir: str = "yfinance_data",
+        downloader=None,
+        fetch_names: bool = True,
+        scheduler: Optional[FetchScheduler] = None,
+        disk_cached: Optional[bool] = None,
+    ):
         """
         Initialize data fetcher
 
         Args:
             cache_dir: Directory for caching data
+            downloader: Object exposing get_data(ticker, start, end, interval)
+                and clear_cache(ticker); defaults to a cached yfinance downloader
+            fetch_names: Whether to look up long names from yfinance
+                (disable for offline data sources)
+            scheduler: Rate limit / retry / circuit breaker policy applied to
+                every upstream call
+            disk_cached: Whether the downloader answers a range it once
+                returned from disk, so such reads skip the scheduler
+                (default: True for the built-in yf_cache downloader)
+        """
+        if disk_cached is None:
+            disk_cached = downloader is None
+        # The built-in downloader wraps yfinance, whose bulk download can
+        # fetch fresh bars of many tickers in one call
+        self._bulk_yfinance = downloader is None
+        if downloader is None:
+            downloader = YFinanceDataDownloader(cache_dir=cache_dir, log_level="ERROR")
+        self.downloader = downloader
+        self.fetch_names = fetch_names
+        self.scheduler = scheduler or FetchScheduler()
+        self._names: Dict[str, str] = {}
+
+        # (start, end, frame) of the widest range loaded per (ticker,
+        # interval); also served while the upstream circuit is open
+        self._frames = LRUByteCache(FETCH_PRICE_CACHE_MB * 1024 * 1024)
+
+        # Concurrent requests for a range being loaded wait for that load
+        self._in_flight = RangeSingleFlight(self._slice_frame)
+
+        # Ranges the downloader's disk cache holds; they are read without
+        # a rate limit token and even while the upstream circuit is open
+        self._stored: Optional[FetchedRangeLog] = None
+        if disk_cached:
+            self._stored = FetchedRangeLog(
+                os.path.join(cache_dir, FETCH_RANGE_LOG_FILE)
+            )
+
+    @staticmethod
+    def _slice_frame(
+        data: pd.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pd.DataFrame:
+        """Slice a date-sorted price frame to [start of start_date's day, end_date]"""
+        # Upstream returns bars from the start of the requested day, so a
+        # time of day on start_date must not drop that day's bar
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date)
+        tz = getattr(data.index, "tz", None)
+        if tz is not None:
+            start = start.tz_localize(tz) if start.tzinfo is None else start
+            end = end.tz_localize(tz) if end.tzinfo is None else end
+        first = data.index.searchsorted(start, side="left")
+        last = data.index.searchsorted(end, side="right")
+        return data.iloc[first:last]
+
+    def _cached_range(
+        self, ticker: str, interval: str, start: pd.Timestamp, end: pd.Timestamp
+    ) -> Optional[pd.DataFrame]:
+        """Slice of a loaded frame whose range covers [start, end], if any"""
+        entry = self._frames.get((ticker, interval))
+        if entry is None:
+            return None
+        loaded_start, loaded_end, data = entry
+        if loaded_start <= start and end <= loaded_end:
+            return self._slice_frame(data, start, end)
+        return None
+
+    def _remember(
+        self,
+        ticker: str,
+        interval: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        data: pd.DataFrame,
+    ):
+        """Keep a loaded frame, merged with a loaded range it overlaps"""
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        entry = self._frames.get((ticker, interval))
+        if entry is not None and entry[0] <= end and start <= entry[1]:
+            loaded_start, loaded_end, loaded = entry
+            # The new download wins on dates both ranges hold
+            merged = pd.concat([loaded, data])
+            data = merged[~merged.index.duplicated(keep="last")].sort_index()
+            start, end = min(start, loaded_start), max(end, loaded_end)
+        self._frames.put(
+            (ticker, interval), (start, end, data), nbytes=estimate_nbytes(data)
+        )
+
+    def _download(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> pd.DataFrame:
         """
-        self.downloader = YFinanceDataDownloader(cache_dir=cache_dir, log_level="ERROR")
+        Load a price range once, serving sub-ranges from memory
+
+        A range inside one already loaded for the same ticker and interval
+        (e.g. two years out of a loaded three) is sliced from memory by
+        binary search on the dates. A range inside one being downloaded
+        (e.g. a benchmark shared by many concurrent stocks) waits for that
+        download and gets its slice, so concurrent analyses over the same
+        period share one download (and one cache file read) per ticker.
+        """
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date)
+        cached = self._cached_range(ticker, interval, start, end)
+        if cached is not None:
+            return cached
+        return self._in_flight.do(
+            (ticker, interval),
+            start,
+            end,
+            lambda: self._load(ticker, start_date, end_date, interval),
+        )
+
+    def _load(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> pd.DataFrame:
+        """
+        Read a range the disk cache holds directly, else download it through
+        the scheduler, falling back to the last good frame
+
+        Raises:
+            UpstreamUnavailableError: Upstream is down and nothing is cached
+        """
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date)
+        if self._stored is not None and self._stored.covers(
+            ticker, interval, start, end
+        ):
+            try:
+                data = self.downloader.get_data(
+                    ticker, start_date, end_date, interval=interval
+                )
+            except Exception as e:
+                logger.warning(f"Could not read stored {ticker} data: {e}")
+            else:
+                if not data.empty:
+                    self._remember(ticker, interval, start, end, data)
+                    return data
+
+        try:
+            data = self.scheduler.call(
+                PRICE_DATA_HOST,
+                self.downloader.get_data,
+                ticker,
+                start_date,
+                end_date,
+                interval=interval,
+            )
+        except UpstreamUnavailableError as e:
+            entry = self._frames.get((ticker, interval))
+            if entry is None:
+                raise
+            stale = self._slice_frame(entry[2], start_date, end_date)
+            if stale.empty:
+                raise
+            logger.warning(f"Serving cached {ticker} data, upstream unavailable: {e}")
+            return stale
+
+        if not data.empty:
+            self._remember(ticker, interval, start, end, data)
+            if self._stored is not None:
+                self._stored.add(ticker, interval, start, end)
+        return data
 
     def fetch_stock_data(
-        self, ticker: str, start_date: datetime, end_date: datetime
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = DEFAULT_INTERVAL,
     ) -> pd.DataFrame:
         """
         Fetch stock data with caching
@@ -39,11 +330,12 @@ class DataFetcher:
             ticker: Stock ticker symbol
             start_date: Start date for data
             end_date: End date for data
+            interval: yfinance bar interval
 
         Returns:
             DataFrame with stock price data
         """
-        return self.downloader.get_data(ticker, start_date, end_date, interval="1d")
+        return self._download(ticker, start_date, end_date, interval)
 
     def fetch_benchmark_data(
         self, benchmark_ticker: str, start_date: datetime, end_date: datetime
@@ -60,33 +352,134 @@ class DataFetcher:
             Tuple of (DataFrame with benchmark data, actual ticker used)
         """
         try:
-            data = self.downloader.get_data(
-                benchmark_ticker, start_date, end_date, interval="1d"
-            )
+            data = self._download(benchmark_ticker, start_date, end_date)
 
             if data.empty:
                 raise ValueError("Empty benchmark data")
 
             return data, benchmark_ticker
 
+        except UpstreamUnavailableError:
+            # Throttling is not a bad benchmark, never substitute another index
+            raise
+
         except Exception as e:
             logger.warning(f"Could not download {benchmark_ticker}: {e}")
 
             # Final fallback to Nifty 50
             logger.warning("Using Nifty 50 as final fallback")
-            data = self.downloader.get_data(
-                "^NSEI", start_date, end_date, interval="1d"
-            )
+            data = self._download("^NSEI", start_date, end_date)
             return data, "^NSEI"
 
+    def fetch_recent_bars(
+        self,
+        tickers: Sequence[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = DEFAULT_INTERVAL,
+        batch_size: int = WATCH_PROBE_BATCH_SIZE,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fresh upstream bars of many tickers, bypassing the in-memory cache
+
+        With the built-in downloader every batch of tickers is one yfinance
+        bulk download, i.e. one scheduled call; other downloaders are asked
+        ticker by ticker.
+
+        Args:
+            tickers: Ticker symbols
+            start_date: Start date for data
+            end_date: End date for data
+            interval: yfinance bar interval
+            batch_size: Tickers per bulk download
+
+        Returns:
+            Price frame per ticker; tickers that failed or have no bars are
+            missing
+        """
+        frames: Dict[str, pd.DataFrame] = {}
+        if not self._bulk_yfinance:
+            for ticker in tickers:
+                try:
+                    data = self.scheduler.call(
+                        PRICE_DATA_HOST,
+                        self.downloader.get_data,
+                        ticker,
+                        start_date,
+                        end_date,
+                        interval=interval,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not fetch recent {ticker} bars: {e}")
+                    continue
+                if not data.empty:
+                    frames[ticker] = data
+            return frames
+
+        threads = self.scheduler.host_concurrency.get(
+            PRICE_DATA_HOST, DEFAULT_HOST_CONCURRENCY
+        )
+        tickers = list(tickers)
+        for offset in range(0, len(tickers), batch_size):
+            batch = tickers[offset:offset + batch_size]
+            try:
+                data = self.scheduler.call(
+                    PRICE_DATA_HOST,
+                    yf.download,
+                    batch,
+                    start=start_date,
+                    end=end_date,
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=threads,
+                    progress=False,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Could not fetch recent bars of {len(batch)} tickers: {e}"
+                )
+                continue
+            if data is None or data.empty:
+                continue
+            available = set(data.columns.get_level_values(0))
+            for ticker in batch:
+                if ticker in available:
+                    bars = data[ticker].dropna(how="all")
+                    if not bars.empty:
+                        frames[ticker] = bars
+        return frames
+
     def get_stock_name(self, ticker: str) -> str:
-        """Get stock long name from yfinance"""
-        try:
-            info = yf.Ticker(ticker)
-            return info.info.get("longName", ticker)
-        except:
+        """Get stock long name from yfinance, remembered for the process"""
+        if not self.fetch_names:
             return ticker
 
+        name = self._names.get(ticker)
+        if name is None:
+            try:
+                name = self.scheduler.call(
+                    QUOTE_DATA_HOST,
+                    lambda: yf.Ticker(ticker).info.get("longName", ticker),
+                )
+            except Exception as e:
+                # Not remembered, so the lookup is retried on the next call
+                logger.warning(f"Could not fetch name for {ticker}: {e}")
+                return ticker
+            self._names[ticker] = name
+        return name
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Usage counters of the in-memory price cache"""
+        return {**self._frames.stats(), "coalesced": self._in_flight.coalesced}
+
     def clear_cache(self, ticker: Optional[str] = None):
         """Clear cached data"""
         self.downloader.clear_cache(ticker)
+        if self._stored is not None:
+            self._stored.forget(ticker)
+        if ticker is None:
+            self._frames.clear()
+        else:
+            for interval in (DEFAULT_INTERVAL, *INTRADAY_INTERVAL_MINUTES):
+                self._frames.pop((ticker, interval))
@@ -7,13 +7,254 @@
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
+from volatility_analyzer.config import DEFAULT_VAR_CONFIDENCE, MARKET_FACTOR
 from volatility_analyzer.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Result records hold plain numbers; these columns are percentages (e.g.
+# 23.41 means 23.41%) shown with the given number of decimals
+PERCENT_DECIMALS: Dict[str, int] = {
+    "Stock_Volatility_Annual": 2,
+    "Benchmark_Volatility_Annual": 2,
+    "Stock_Returns_Mean": 4,
+    "Benchmark_Returns_Mean": 4,
+    "Stock_Volatility_CI_Low": 2,
+    "Stock_Volatility_CI_High": 2,
+    "Factor_Alpha_Annual": 2,
+    "Residual_Volatility_Annual": 2,
+    "Max_Drawdown": 2,
+    "Current_Drawdown": 2,
+    "Rolling_Volatility_Median": 2,
+    "Volatility_Equal_Weighted": 2,
+    "Volatility_Cap_Weighted": 2,
+    "Volatility_Dispersion": 2,
+    "Index_Volatility_Equal_Weighted": 2,
+    "Index_Volatility_Cap_Weighted": 2,
+}
+# Plain numeric columns and their displayed decimals
+NUMBER_DECIMALS: Dict[str, int] = {
+    "Beta": 3,
+    "R_Squared": 3,
+    "Volatility_Ratio": 2,
+    "Beta_CI_Low": 3,
+    "Beta_CI_High": 3,
+    "R_Squared_CI_Low": 3,
+    "R_Squared_CI_High": 3,
+    "Factor_Alpha_T": 2,
+    "Factor_R_Squared": 3,
+    "Drawdown_Periods": 0,
+    "Recovery_Periods": 0,
+    "Longest_Underwater_Periods": 0,
+    "Volatility_Percentile": 1,
+    "Members": 0,
+    "Index_Members": 0,
+    "Market_Cap": 0,
+    "Beta_Equal_Weighted": 3,
+    "Beta_Cap_Weighted": 3,
+    "Beta_Dispersion": 3,
+    "R_Squared_Equal_Weighted": 3,
+    "R_Squared_Cap_Weighted": 3,
+    "R_Squared_Dispersion": 3,
+}
+TEXT_COLUMNS = (
+    "Stock",
+    "Ticker",
+    "Benchmark",
+    "Benchmark_Ticker",
+    "Period",
+    "Interval",
+    "Frequency",
+    "Drawdown_Peak",
+    "Drawdown_Trough",
+    "Drawdown_Recovery",
+    "Volatility_Regime",
+    "Group",
+    "Volatility_Category",
+    "Beta_Category",
+)
+INTEGER_COLUMNS = ("Data_Points",)
+_TAIL_RISK_PREFIXES = ("VaR_", "ES_")
+_FACTOR_PREFIXES = {"Factor_Beta_": 3, "Factor_T_": 2}
+
+# Columns of AnalysisReport.to_record(), in record order; the optional
+# sections are present only when their analysis produced a result
+_REPORT_COLUMNS = (
+    "Stock",
+    "Ticker",
+    "Benchmark",
+    "Benchmark_Ticker",
+    "Period",
+    "Stock_Volatility_Annual",
+    "Benchmark_Volatility_Annual",
+    "Beta",
+    "R_Squared",
+    "Volatility_Ratio",
+    "Data_Points",
+    "Interval",
+    "Frequency",
+    "Stock_Returns_Mean",
+    "Benchmark_Returns_Mean",
+)
+_CONFIDENCE_INTERVAL_COLUMNS = (
+    "Beta_CI_Low",
+    "Beta_CI_High",
+    "R_Squared_CI_Low",
+    "R_Squared_CI_High",
+    "Stock_Volatility_CI_Low",
+    "Stock_Volatility_CI_High",
+)
+_TAIL_RISK_METHODS = ("Historical", "Parametric", "Monte_Carlo")
+_DRAWDOWN_COLUMNS = (
+    "Max_Drawdown",
+    "Current_Drawdown",
+    "Drawdown_Peak",
+    "Drawdown_Trough",
+    "Drawdown_Recovery",
+    "Drawdown_Periods",
+    "Recovery_Periods",
+    "Longest_Underwater_Periods",
+)
+_REGIME_COLUMNS = (
+    "Volatility_Regime",
+    "Volatility_Percentile",
+    "Rolling_Volatility_Median",
+)
+
+
+def record_columns(
+    factor_names: Sequence[str] = (MARKET_FACTOR,),
+    bootstrap: bool = False,
+    var_confidence: float = DEFAULT_VAR_CONFIDENCE,
+) -> List[str]:
+    """
+    Every column a result record can hold, in record order
+
+    Records of different stocks hold different subsets (e.g. no regime for
+    a short history), so writers that fix their columns up front use this
+    full set and leave the missing values empty.
+
+    Args:
+        factor_names: Factors of the factor regression, market first
+        bootstrap: Whether records carry bootstrap confidence intervals
+        var_confidence: Confidence level of the tail risk columns
+
+    Returns:
+        List of column names
+    """
+    level = f"{var_confidence * 100:g}"
+    columns = list(_REPORT_COLUMNS)
+    if bootstrap:
+        columns += _CONFIDENCE_INTERVAL_COLUMNS
+    for method in _TAIL_RISK_METHODS:
+        columns += [f"VaR_{level}_{method}", f"ES_{level}_{method}"]
+    columns += ["Factor_Alpha_Annual", "Factor_Alpha_T"]
+    for name in factor_names:
+        columns += [f"Factor_Beta_{name}", f"Factor_T_{name}"]
+    columns += ["Factor_R_Squared", "Residual_Volatility_Annual"]
+    columns += _DRAWDOWN_COLUMNS
+    columns += _REGIME_COLUMNS
+    return columns
+
+
+def column_dtype(column: str) -> str:
+    """Storage type of a result column (string, int64 or float64)"""
+    if column in TEXT_COLUMNS:
+        return "string"
+    if column in INTEGER_COLUMNS:
+        return "int64"
+    return "float64"
+
+
+def _percent_decimals(column: str) -> Optional[int]:
+    if column in PERCENT_DECIMALS:
+        return PERCENT_DECIMALS[column]
+    if column.startswith(_TAIL_RISK_PREFIXES):
+        return 2
+    return None
+
+
+def _number_decimals(column: str) -> Optional[int]:
+    if column in NUMBER_DECIMALS:
+        return NUMBER_DECIMALS[column]
+    for prefix, decimals in _FACTOR_PREFIXES.items():
+        if column.startswith(prefix):
+            return decimals
+    return None
+
+
+def format_record(record: dict) -> dict:
+    """
+    Display formatting of a numeric result record
+
+    Args:
+        record: Record as produced by AnalysisReport.to_record()
+
+    Returns:
+        Dictionary with percentages as "xx.xx%" strings and rounded numbers
+    """
+    formatted = {}
+    for column, value in record.items():
+        decimals = _percent_decimals(column)
+        if decimals is not None and value is not None:
+            formatted[column] = f"{value:.{decimals}f}%"
+        elif _number_decimals(column) is not None and value is not None:
+            formatted[column] = round(value, _number_decimals(column))
+        else:
+            formatted[column] = value
+    return formatted
+
+
+def records_to_frame(
+    records: Iterable[dict], columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Typed DataFrame of result records
+
+    Text columns stay strings, Data_Points is an integer and every other
+    column is float64, so tables can be sorted, joined and exported
+    without parsing.
+
+    Args:
+        records: Records as produced by AnalysisReport.to_record()
+        columns: Columns of the frame, e.g. record_columns(); records
+            lacking one hold NaN / None (default: the records' own columns)
+
+    Returns:
+        DataFrame with one row per record
+    """
+    df = pd.DataFrame.from_records(list(records))
+    if columns is not None:
+        missing = [column for column in columns if column not in df.columns]
+        for column in missing:
+            df[column] = None
+        df = df[list(dict.fromkeys([*columns, *df.columns]))]
+    for column in df.columns:
+        dtype = column_dtype(column)
+        if dtype == "string":
+            continue
+        if dtype == "int64":
+            df[column] = df[column].astype(np.int64)
+        else:
+            df[column] = df[column].astype(np.float64)
+    return df
+
+
+def format_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Display copy of a typed results frame (percent strings, rounding)"""
+    display = df.copy()
+    for column in display.columns:
+        decimals = _percent_decimals(column)
+        if decimals is not None:
+            display[column] = display[column].map(lambda v, d=decimals: f"{v:.{d}f}%")
+        elif _number_decimals(column) is not None:
+            display[column] = display[column].round(_number_decimals(column))
+    return display
+
 
 @dataclass
 class StockMetrics:
@@ -69,6 +310,135 @@ class BetaAnalysisResult:
             return "Moves inversely to market (defensive)"
 
 
+@dataclass
+class BootstrapIntervals:
+    """Block-bootstrap confidence intervals for the headline metrics"""
+
+    confidence: float
+    n_resamples: int
+    block_size: int
+    beta: Tuple[float, float]
+    r_squared: Tuple[float, float]
+    volatility_annual: Tuple[float, float]  # Percentage
+
+    def __str__(self):
+        return (
+            f"{self.confidence * 100:.0f}% CI "
+            f"(block bootstrap, {self.n_resamples} resamples, block={self.block_size})"
+        )
+
+
+@dataclass
+class TailRiskMetrics:
+    """Value-at-Risk and Expected Shortfall (positive loss percentages)"""
+
+    confidence: float
+    horizon_days: int
+    historical_var: float
+    historical_es: float
+    parametric_var: float
+    parametric_es: float
+    monte_carlo_var: float
+    monte_carlo_es: float
+
+    def to_record(self) -> dict:
+        """Flat numeric record keyed by confidence level and method"""
+        level = f"{self.confidence * 100:g}"
+        return {
+            f"VaR_{level}_Historical": self.historical_var,
+            f"ES_{level}_Historical": self.historical_es,
+            f"VaR_{level}_Parametric": self.parametric_var,
+            f"ES_{level}_Parametric": self.parametric_es,
+            f"VaR_{level}_Monte_Carlo": self.monte_carlo_var,
+            f"ES_{level}_Monte_Carlo": self.monte_carlo_es,
+        }
+
+    def to_dict(self) -> dict:
+        """Convert to flat dictionary keyed by confidence level and method"""
+        return format_record(self.to_record())
+
+
+@dataclass
+class FactorRegressionResult:
+    """OLS of stock returns on an intercept and one or more factors"""
+
+    factor_names: Tuple[str, ...]
+    alpha_annual: float  # Percentage
+    alpha_t_stat: float
+    betas: Dict[str, float]
+    beta_t_stats: Dict[str, float]
+    r_squared: float
+    residual_volatility_annual: float  # Idiosyncratic volatility, percentage
+    n_obs: int
+    window: int
+    rolling: pd.DataFrame  # Rolling fit, columns as in regression_panels()
+
+    def to_record(self) -> dict:
+        """Flat numeric record of the full-period fit"""
+        record = {
+            "Factor_Alpha_Annual": self.alpha_annual,
+            "Factor_Alpha_T": self.alpha_t_stat,
+        }
+        for name in self.factor_names:
+            record[f"Factor_Beta_{name}"] = self.betas[name]
+            record[f"Factor_T_{name}"] = self.beta_t_stats[name]
+        record["Factor_R_Squared"] = self.r_squared
+        record["Residual_Volatility_Annual"] = self.residual_volatility_annual
+        return record
+
+
+@dataclass
+class DrawdownMetrics:
+    """Peak-to-trough losses of the compounded returns (positive percentages)"""
+
+    max_drawdown: float
+    current_drawdown: float
+    peak_date: str
+    trough_date: str
+    recovery_date: Optional[str]  # None while still below the peak
+    drawdown_periods: int  # Bars from peak to trough
+    recovery_periods: Optional[int]  # Bars from trough back to the peak
+    longest_underwater_periods: int
+    window: int
+    drawdown: pd.Series  # Loss from the running peak at every bar
+    rolling_max_drawdown: pd.Series
+
+    def to_record(self) -> dict:
+        """Flat record of the full-period drawdown statistics"""
+        return {
+            "Max_Drawdown": self.max_drawdown,
+            "Current_Drawdown": self.current_drawdown,
+            "Drawdown_Peak": self.peak_date,
+            "Drawdown_Trough": self.trough_date,
+            "Drawdown_Recovery": self.recovery_date,
+            "Drawdown_Periods": self.drawdown_periods,
+            "Recovery_Periods": self.recovery_periods,
+            "Longest_Underwater_Periods": self.longest_underwater_periods,
+        }
+
+
+@dataclass
+class VolatilityRegime:
+    """Current rolling volatility within its own trailing distribution"""
+
+    label: str  # e.g. "low", "normal", "elevated", "extreme"
+    current_volatility: float  # Percentage
+    percentile: float  # 0-100
+    median: float  # Trailing median of rolling volatility, percentage
+    low_band: float
+    high_band: float
+    window: int
+    rolling_percentile: pd.Series
+
+    def to_record(self) -> dict:
+        """Flat record of the current regime"""
+        return {
+            "Volatility_Regime": self.label,
+            "Volatility_Percentile": self.percentile,
+            "Rolling_Volatility_Median": self.median,
+        }
+
+
 @dataclass
 class AnalysisReport:
     """Complete analysis report for a stock"""
@@ -82,27 +452,94 @@ class AnalysisReport:
     volatility_ratio: float
     rolling_volatility: pd.Series
     rolling_metrics: pd.DataFrame
+    interval: str = "1d"
+    frequency: str = "D"
+    confidence_intervals: Optional[BootstrapIntervals] = None
+    tail_risk: Optional[TailRiskMetrics] = None
+    factor_regression: Optional[FactorRegressionResult] = None
+    drawdown: Optional[DrawdownMetrics] = None
+    volatility_regime: Optional[VolatilityRegime] = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary format"""
-        return {
+    def to_record(self) -> dict:
+        """
+        Numeric result record
+
+        Percentages are plain floats (23.41 for 23.41%) at full precision;
+        see format_record() for display formatting.
+        """
+        result = {
             "Stock": self.stock_metrics.name,
             "Ticker": self.stock_metrics.ticker,
             "Benchmark": self.benchmark_metrics.name,
             "Benchmark_Ticker": self.benchmark_metrics.ticker,
             "Period": f"{self.period_start} to {self.period_end}",
-            "Stock_Volatility_Annual": f"{self.stock_metrics.volatility_annual:.2f}%",
-            "Benchmark_Volatility_Annual": f"{self.benchmark_metrics.volatility_annual:.2f}%",
-            "Beta": round(self.beta_analysis.beta, 3),
-            "R_Squared": round(self.beta_analysis.r_squared, 3),
-            "Volatility_Ratio": round(self.volatility_ratio, 2),
-            "Data_Points": self.data_points,
-            "Stock_Returns_Mean": f"{self.stock_metrics.returns_mean:.4f}%",
-            "Benchmark_Returns_Mean": f"{self.benchmark_metrics.returns_mean:.4f}%",
+            "Stock_Volatility_Annual": float(self.stock_metrics.volatility_annual),
+            "Benchmark_Volatility_Annual": float(
+                self.benchmark_metrics.volatility_annual
+            ),
+            "Beta": float(self.beta_analysis.beta),
+            "R_Squared": float(self.beta_analysis.r_squared),
+            "Volatility_Ratio": float(self.volatility_ratio),
+            "Data_Points": int(self.data_points),
+            "Interval": self.interval,
+            "Frequency": self.frequency,
+            "Stock_Returns_Mean": float(self.stock_metrics.returns_mean),
+            "Benchmark_Returns_Mean": float(self.benchmark_metrics.returns_mean),
         }
 
+        ci = self.confidence_intervals
+        if ci is not None:
+            result.update(
+                {
+                    "Beta_CI_Low": float(ci.beta[0]),
+                    "Beta_CI_High": float(ci.beta[1]),
+                    "R_Squared_CI_Low": float(ci.r_squared[0]),
+                    "R_Squared_CI_High": float(ci.r_squared[1]),
+                    "Stock_Volatility_CI_Low": float(ci.volatility_annual[0]),
+                    "Stock_Volatility_CI_High": float(ci.volatility_annual[1]),
+                }
+            )
+
+        if self.tail_risk is not None:
+            result.update(self.tail_risk.to_record())
+
+        if self.factor_regression is not None:
+            result.update(self.factor_regression.to_record())
+
+        if self.drawdown is not None:
+            result.update(self.drawdown.to_record())
+
+        if self.volatility_regime is not None:
+            result.update(self.volatility_regime.to_record())
+
+        return result
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return format_record(self.to_record())
+
+    def _regime_lines(self) -> List[str]:
+        regime = self.volatility_regime
+        if regime is None:
+            return []
+        return [
+            f"Volatility Regime: {regime.label} (current rolling volatility "
+            f"{regime.current_volatility:.2f}% at the {regime.percentile:.0f}th "
+            f"percentile of the last {regime.window} periods, median "
+            f"{regime.median:.2f}%)"
+        ]
+
     def log_report(self):
         """Log formatted analysis report"""
+        if self.interval != "1d":
+            data_unit, period_label = f"{self.interval} bars", f"{self.interval} Bar"
+        elif self.frequency == "W":
+            data_unit, period_label = "weeks", "Weekly"
+        elif self.frequency == "M":
+            data_unit, period_label = "months", "Monthly"
+        else:
+            data_unit, period_label = "trading days", "Daily"
+
         report_lines = [
             "=" * 60,
             "VOLATILITY & BETA ANALYSIS REPORT",
@@ -110,20 +547,103 @@ class AnalysisReport:
             f"Stock: {self.stock_metrics.name} ({self.stock_metrics.ticker})",
             f"Benchmark: {self.benchmark_metrics.name}",
             f"Analysis Period: {self.period_start} to {self.period_end}",
-            f"Data Points: {self.data_points} trading days",
+            f"Data Points: {self.data_points} {data_unit}",
             "\n--- VOLATILITY ANALYSIS ---",
             f"Stock Annualized Volatility: {self.stock_metrics.volatility_annual:.2f}%",
             f"Benchmark Annualized Volatility: {self.benchmark_metrics.volatility_annual:.2f}%",
             f"Volatility Ratio (Stock/Benchmark): {self.volatility_ratio:.2f}x",
+            *self._regime_lines(),
             "\n--- BETA ANALYSIS ---",
             f"Beta: {self.beta_analysis.beta:.3f}",
             f"R-squared: {self.beta_analysis.r_squared:.3f} "
             f"({self.beta_analysis.r_squared * 100:.1f}% of moves explained by benchmark)",
             "\nBeta Interpretation:",
             f"  → {self.beta_analysis.interpretation()}",
+        ]
+
+        ci = self.confidence_intervals
+        if ci is not None:
+            report_lines += [
+                f"\n--- CONFIDENCE INTERVALS: {ci} ---",
+                f"Beta: [{ci.beta[0]:.3f}, {ci.beta[1]:.3f}]",
+                f"R-squared: [{ci.r_squared[0]:.3f}, {ci.r_squared[1]:.3f}]",
+                f"Stock Annualized Volatility: "
+                f"[{ci.volatility_annual[0]:.2f}%, {ci.volatility_annual[1]:.2f}%]",
+            ]
+
+        tail = self.tail_risk
+        if tail is not None:
+            report_lines += [
+                f"\n--- TAIL RISK ({tail.confidence * 100:g}%, "
+                f"{tail.horizon_days}-period horizon) ---",
+                f"Historical VaR / ES: {tail.historical_var:.2f}% / {tail.historical_es:.2f}%",
+                f"Parametric VaR / ES: {tail.parametric_var:.2f}% / {tail.parametric_es:.2f}%",
+                f"Monte Carlo VaR / ES: {tail.monte_carlo_var:.2f}% / {tail.monte_carlo_es:.2f}%",
+            ]
+
+        factors = self.factor_regression
+        if factors is not None:
+            report_lines += [
+                f"\n--- FACTOR REGRESSION ({', '.join(factors.factor_names)}) ---",
+                f"Alpha (annualized): {factors.alpha_annual:.2f}% "
+                f"(t={factors.alpha_t_stat:.2f})",
+                *[
+                    f"Beta {name}: {factors.betas[name]:.3f} "
+                    f"(t={factors.beta_t_stats[name]:.2f})"
+                    for name in factors.factor_names
+                ],
+                f"R-squared: {factors.r_squared:.3f}",
+                f"Residual (idiosyncratic) Volatility: "
+                f"{factors.residual_volatility_annual:.2f}%",
+            ]
+
+        drawdown = self.drawdown
+        if drawdown is not None:
+            recovery = (
+                f"{drawdown.recovery_date} ({drawdown.recovery_periods} periods)"
+                if drawdown.recovery_date is not None
+                else "not recovered"
+            )
+            report_lines += [
+                "\n--- DRAWDOWNS ---",
+                f"Max Drawdown: {drawdown.max_drawdown:.2f}% "
+                f"({drawdown.peak_date} to {drawdown.trough_date}, "
+                f"{drawdown.drawdown_periods} periods)",
+                f"Recovery: {recovery}",
+                f"Longest Underwater Stretch: "
+                f"{drawdown.longest_underwater_periods} periods",
+                f"Current Drawdown: {drawdown.current_drawdown:.2f}%",
+            ]
+
+        report_lines += [
             "\n--- RETURNS ---",
-            f"Stock Avg Daily Return: {self.stock_metrics.returns_mean:.4f}%",
-            f"Benchmark Avg Daily Return: {self.benchmark_metrics.returns_mean:.4f}%",
+            f"Stock Avg {period_label} Return: {self.stock_metrics.returns_mean:.4f}%",
+            f"Benchmark Avg {period_label} Return: {self.benchmark_metrics.returns_mean:.4f}%",
             "=" * 60,
         ]
         logger.info("\n".join(report_lines))
+
+
+@dataclass
+class BatchResult:
+    """Outcome of analyzing one ticker inside a batch run"""
+
+    ticker: str
+    benchmark_ticker: str
+    report: Optional[AnalysisReport] = None
+    error: Optional[str] = None
+    row: Optional[dict] = None  # Result record from a journal or worker process
+
+    @property
+    def ok(self) -> bool:
+        """Whether the analysis completed successfully"""
+        return self.report is not None or self.row is not None
+
+    @property
+    def resumed(self) -> bool:
+        """Whether only the result record is available (journal or worker process)"""
+        return self.report is None and self.row is not None
+
+    def to_row(self) -> dict:
+        """Numeric result record of a successful analysis"""
+        return self.report.to_record() if self.report is not None else self.row
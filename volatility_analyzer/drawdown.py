@@ -0,0 +1,146 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 19:04:52
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 19:04:52
+# @ Description: Drawdown analytics with a vectorized O(n) rolling max drawdown
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    TRADING_DAYS_PER_YEAR,
+    DRAWDOWN_MAX_BATCH_MB,
+)
+from volatility_analyzer import kernels
+from volatility_analyzer.data_models import DrawdownMetrics
+
+
+class DrawdownCalculator:
+    """
+    Drawdown statistics of compounded returns.
+
+    Drawdowns are measured on the log wealth index x = cumsum(log(1 + r)),
+    where the loss from a peak u to a later bar s is x_s - x_u. Building
+    the index from returns (rather than raw closes) gives the same numbers
+    in every code path, including worker processes that only see returns.
+    """
+
+    @staticmethod
+    def rolling_max_drawdown(log_wealth, window: int) -> np.ndarray:
+        """
+        Largest peak-to-trough loss inside every trailing window
+
+        Runs in O(n) per series on the active kernel backend; see
+        kernels.rolling_max_drawdown.
+
+        Args:
+            log_wealth: (dates,) or (dates x series) log wealth index, NaN
+                for missing bars
+            window: Window length in bars
+
+        Returns:
+            Array shaped like the input with the maximum drawdown as a
+            positive loss fraction; NaN until a window of valid bars exists
+        """
+        return kernels.rolling_max_drawdown(log_wealth, window)
+
+    @staticmethod
+    def rolling_drawdown_panel(
+        returns_panel: pd.DataFrame,
+        window: int = TRADING_DAYS_PER_YEAR,
+        max_batch_mb: float = DRAWDOWN_MAX_BATCH_MB,
+    ) -> pd.DataFrame:
+        """
+        Rolling maximum drawdown of every ticker in a returns panel
+
+        Args:
+            returns_panel: Date x ticker returns; a missing bar carries the
+                wealth index forward
+            window: Rolling window in bars
+            max_batch_mb: Memory cap for one batch of tickers
+
+        Returns:
+            Date x ticker maximum drawdown (positive %)
+        """
+        log_wealth = np.log1p(returns_panel).cumsum().ffill().to_numpy()
+        n_dates, n_tickers = log_wealth.shape
+
+        # The block scans hold about ten arrays of the batch's size
+        per_ticker_bytes = 8 * 10 * max(n_dates, 1)
+        batch = max(1, int(max_batch_mb * 1024 * 1024 // per_ticker_bytes))
+        result = np.empty_like(log_wealth)
+        for start in range(0, n_tickers, batch):
+            cols = slice(start, start + batch)
+            result[:, cols] = DrawdownCalculator.rolling_max_drawdown(
+                log_wealth[:, cols], window
+            )
+
+        return pd.DataFrame(
+            result * 100, index=returns_panel.index, columns=returns_panel.columns
+        )
+
+    @staticmethod
+    def calculate_drawdown(
+        returns: pd.Series, window: int = TRADING_DAYS_PER_YEAR
+    ) -> Optional[DrawdownMetrics]:
+        """
+        Full-period and rolling drawdown analysis of one return series
+
+        Args:
+            returns: Series of returns
+            window: Rolling max drawdown window in bars
+
+        Returns:
+            DrawdownMetrics, or None without returns
+        """
+        returns = returns.dropna()
+        if returns.empty:
+            return None
+
+        index = returns.index
+        x = np.cumsum(np.log1p(returns.to_numpy(dtype=np.float64)))
+        # The wealth index starts at 1 (log 0) before the first return
+        peak = np.maximum.accumulate(np.maximum(x, 0.0))
+        underwater = x - peak
+        drawdown = pd.Series(-np.expm1(underwater) * 100, index=index)
+
+        def date(position: int) -> str:
+            return str(index[max(position, 0)].date())
+
+        trough = int(np.argmin(underwater))
+        at_peak = np.flatnonzero(underwater[: trough + 1] == 0)
+        peak_position = int(at_peak[-1]) if len(at_peak) else -1
+
+        recovery_position = None
+        if underwater[trough] < 0:
+            recovered = np.flatnonzero(underwater[trough:] == 0)
+            if len(recovered):
+                recovery_position = trough + int(recovered[0])
+
+        # Longest stretch of consecutive bars below the running peak
+        bounds = np.concatenate(([-1], np.flatnonzero(underwater == 0), [len(x)]))
+        longest_underwater = int(np.max(np.diff(bounds) - 1))
+
+        return DrawdownMetrics(
+            max_drawdown=float(drawdown.iloc[trough]),
+            current_drawdown=float(drawdown.iloc[-1]),
+            peak_date=date(peak_position),
+            trough_date=date(trough),
+            recovery_date=(
+                date(recovery_position) if recovery_position is not None else None
+            ),
+            drawdown_periods=trough - peak_position,
+            recovery_periods=(
+                recovery_position - trough if recovery_position is not None else None
+            ),
+            longest_underwater_periods=longest_underwater,
+            window=window,
+            drawdown=drawdown,
+            rolling_max_drawdown=pd.Series(
+                DrawdownCalculator.rolling_max_drawdown(x, window) * 100, index=index
+            ),
+        )
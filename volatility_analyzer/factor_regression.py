@@ -0,0 +1,234 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 17:42:16
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 17:42:16
+# @ Description: Batched rolling multi-factor OLS from cumulative sufficient statistics
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    TRADING_DAYS_PER_YEAR,
+    DEFAULT_ROLLING_BETA_WINDOW,
+    REGRESSION_MAX_BATCH_MB,
+)
+from volatility_analyzer.data_models import FactorRegressionResult
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over every trailing window along axis 0 (len - window + 1 rows)"""
+    cumulative = np.cumsum(values, axis=0)
+    sums = cumulative[window - 1 :].copy()
+    sums[1:] -= cumulative[:-window]
+    return sums
+
+
+class FactorRegressionCalculator:
+    """
+    Solve many OLS regressions of returns on factors at once.
+
+    For y = a + X b + e, every window needs only the sufficient statistics
+    Z'Z, Z'y, y'y, sum(y) and n (Z = [1, X]). These are computed for all
+    windows from cumulative sums, then every (window, ticker) normal
+    equation is inverted in one batched call, so the cost does not depend
+    on the number of least-squares solves. Observations where the stock or
+    any factor is NaN are dropped per ticker through a 0/1 weight.
+    """
+
+    @staticmethod
+    def rolling_ols(
+        y,
+        X,
+        window: int,
+        max_batch_mb: float = REGRESSION_MAX_BATCH_MB,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Rolling OLS of each return series on shared factors
+
+        Args:
+            y: (dates,) or (dates x tickers) returns, NaN allowed
+            X: (dates,) or (dates x factors) factor returns, NaN allowed
+            window: Window length in observations (ending at each date)
+            max_batch_mb: Memory cap for one batch of tickers
+
+        Returns:
+            Dictionary of arrays over (dates x tickers [x coefficients]):
+            'coefficients' and 't_stats' (intercept first), 'r_squared',
+            'residual_std' (per period) and 'n_obs'; NaN before the first
+            full window or with too few observations
+        """
+        y = np.asarray(y, dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
+        single = y.ndim == 1
+        y = y[:, None] if single else y
+        X = X[:, None] if X.ndim == 1 else X
+
+        n_dates, n_tickers = y.shape
+        n_coef = X.shape[1] + 1
+        if len(X) != n_dates:
+            raise ValueError("Returns and factors must have the same length")
+
+        Z = np.column_stack([np.ones(n_dates), X])
+        factor_valid = np.isfinite(Z).all(axis=1)
+        Z = np.where(factor_valid[:, None], Z, 0.0)
+        valid = np.isfinite(y) & factor_valid[:, None]
+        y = np.where(valid, y, 0.0)
+        weights = valid.astype(np.float64)
+        outer = Z[:, :, None] * Z[:, None, :]
+
+        result = {
+            "coefficients": np.full((n_dates, n_tickers, n_coef), np.nan),
+            "t_stats": np.full((n_dates, n_tickers, n_coef), np.nan),
+            "r_squared": np.full((n_dates, n_tickers), np.nan),
+            "residual_std": np.full((n_dates, n_tickers), np.nan),
+            "n_obs": np.zeros((n_dates, n_tickers)),
+        }
+        if n_dates < window:
+            return {k: v[:, 0] for k, v in result.items()} if single else result
+
+        # Cumulative and windowed statistics per ticker, plus the inverses
+        per_ticker_bytes = 8 * n_dates * (3 * n_coef * n_coef + 3 * n_coef + 6)
+        batch = max(1, int(max_batch_mb * 1024 * 1024 // per_ticker_bytes))
+        eye = np.eye(n_coef)
+
+        for start in range(0, n_tickers, batch):
+            cols = slice(start, min(start + batch, n_tickers))
+            w, yc = weights[:, cols], y[:, cols]
+
+            zz = _window_sums(w[:, :, None, None] * outer[:, None], window)
+            zy = _window_sums(Z[:, None, :] * yc[:, :, None], window)
+            yy = _window_sums(yc * yc, window)
+            sy = _window_sums(yc, window)
+            n = _window_sums(w, window)
+
+            dof = n - n_coef
+            usable = dof > 0
+            zz[~usable] = eye
+            try:
+                inverse = np.linalg.inv(zz)
+            except np.linalg.LinAlgError:
+                inverse = np.linalg.pinv(zz)
+
+            coef = np.einsum("wnij,wnj->wni", inverse, zy)
+            rss = np.maximum(yy - np.einsum("wni,wni->wn", coef, zy), 0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tss = yy - sy * sy / n
+                sigma2 = rss / dof
+                se = np.sqrt(
+                    sigma2[..., None] * np.diagonal(inverse, axis1=-2, axis2=-1)
+                )
+                t_stats = coef / se
+                r_squared = 1 - rss / tss
+
+            coef[~usable] = np.nan
+            t_stats[~usable] = np.nan
+            r_squared[~usable] = np.nan
+            sigma2[~usable] = np.nan
+
+            rows = slice(window - 1, None)
+            result["coefficients"][rows, cols] = coef
+            result["t_stats"][rows, cols] = t_stats
+            result["r_squared"][rows, cols] = r_squared
+            result["residual_std"][rows, cols] = np.sqrt(sigma2)
+            result["n_obs"][rows, cols] = n
+
+        return {k: v[:, 0] for k, v in result.items()} if single else result
+
+    @staticmethod
+    def regression_panels(
+        returns_panel: pd.DataFrame,
+        factor_returns: pd.DataFrame,
+        window: int = DEFAULT_ROLLING_BETA_WINDOW,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Rolling factor exposures of every ticker in a returns panel
+
+        Args:
+            returns_panel: Date x ticker returns
+            factor_returns: Date x factor returns
+            window: Rolling window in periods
+            trading_days: Periods per year for annualization
+
+        Returns:
+            Dictionary of date x ticker panels: 'Alpha_Annual' (%),
+            'Beta_<factor>' per factor, 'R_Squared' and
+            'Residual_Volatility' (annualized %)
+        """
+        factors = factor_returns.reindex(returns_panel.index)
+        fit = FactorRegressionCalculator.rolling_ols(
+            returns_panel.values, factors.values, window
+        )
+
+        def panel(values):
+            return pd.DataFrame(
+                values, index=returns_panel.index, columns=returns_panel.columns
+            )
+
+        alpha = fit["coefficients"][..., 0] * trading_days * 100
+        panels = {"Alpha_Annual": panel(alpha)}
+        for i, name in enumerate(factor_returns.columns, start=1):
+            panels[f"Beta_{name}"] = panel(fit["coefficients"][..., i])
+        panels["R_Squared"] = panel(fit["r_squared"])
+        panels["Residual_Volatility"] = panel(
+            fit["residual_std"] * np.sqrt(trading_days) * 100
+        )
+        return panels
+
+    @staticmethod
+    def calculate_factor_regression(
+        stock_returns: pd.Series,
+        factor_returns: pd.DataFrame,
+        window: int = DEFAULT_ROLLING_BETA_WINDOW,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ) -> Optional[FactorRegressionResult]:
+        """
+        Full-period and rolling factor regression of one stock
+
+        Args:
+            stock_returns: Series of stock returns
+            factor_returns: Date x factor returns (e.g. market and sector)
+            window: Rolling window in periods
+            trading_days: Periods per year for annualization
+
+        Returns:
+            FactorRegressionResult, or None without enough common dates
+        """
+        aligned = pd.concat([stock_returns.rename(None), factor_returns], axis=1)
+        aligned = aligned.dropna()
+        factor_names = tuple(str(c) for c in factor_returns.columns)
+        if len(aligned) <= len(factor_names) + 1:
+            return None
+
+        y = aligned.iloc[:, 0].values
+        X = aligned.iloc[:, 1:].values
+        full = FactorRegressionCalculator.rolling_ols(y, X, len(aligned))
+        coef, t_stats = full["coefficients"][-1], full["t_stats"][-1]
+
+        rolling = FactorRegressionCalculator.regression_panels(
+            aligned.iloc[:, [0]], aligned.iloc[:, 1:], window, trading_days
+        )
+        rolling = pd.DataFrame(
+            {name: frame.iloc[:, 0] for name, frame in rolling.items()}
+        )
+
+        return FactorRegressionResult(
+            factor_names=factor_names,
+            alpha_annual=float(coef[0] * trading_days * 100),
+            alpha_t_stat=float(t_stats[0]),
+            betas={name: float(coef[i]) for i, name in enumerate(factor_names, 1)},
+            beta_t_stats={
+                name: float(t_stats[i]) for i, name in enumerate(factor_names, 1)
+            },
+            r_squared=float(full["r_squared"][-1]),
+            residual_volatility_annual=float(
+                full["residual_std"][-1] * np.sqrt(trading_days) * 100
+            ),
+            n_obs=int(full["n_obs"][-1]),
+            window=window,
+            rolling=rolling,
+        )
@@ -0,0 +1,322 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 12:05:48
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 12:05:48
+# @ Description: Rate limiting, retry and circuit breaking for upstream fetches
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from volatility_analyzer.config import (
+    FETCH_RATE_PER_SECOND,
+    FETCH_MIN_RATE_PER_SECOND,
+    FETCH_BURST,
+    FETCH_MAX_RETRIES,
+    FETCH_BACKOFF_BASE_SECONDS,
+    FETCH_BACKOFF_MAX_SECONDS,
+    FETCH_HOST_CONCURRENCY,
+    DEFAULT_HOST_CONCURRENCY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS,
+)
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised when upstream is throttling or failing and no retry is left"""
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception signals upstream throttling (HTTP 429)"""
+    message = str(error).lower()
+    return (
+        "ratelimit" in type(error).__name__.lower()
+        or "too many requests" in message
+        or "rate limit" in message
+        or "429" in message
+    )
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether an exception is transient and worth retrying"""
+    return not isinstance(error, (ValueError, KeyError, TypeError))
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an adjustable refill rate"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+            clock: Monotonic time source
+            sleep: Sleep function used while waiting for tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available and consume them"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            self._sleep(wait_time)
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping tokens accrued so far"""
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+
+class CircuitBreaker:
+    """
+    Stops calls to an unhealthy upstream for a cool-down period.
+
+    After `failure_threshold` consecutive failures the circuit opens; once
+    `reset_timeout` seconds pass a single trial call is let through
+    (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.state = self.CLOSED
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected"""
+        with self._lock:
+            return (
+                self.state == self.OPEN
+                and self._clock() - self._opened_at < self.reset_timeout
+            )
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to upstream now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """Record a successful call"""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = self.CLOSED
+
+    def release(self):
+        """End a call that says nothing about upstream health (state unchanged)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit when over threshold"""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit opened after {self._failures} consecutive failures"
+                    )
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class FetchScheduler:
+    """
+    Schedules upstream calls under a shared rate limit.
+
+    Calls pass a per-host circuit breaker and concurrency cap, then draw a
+    token from a shared bucket. Transient failures are retried with full
+    jitter exponential backoff. The bucket rate is halved on throttling
+    responses and recovers additively on success (AIMD), so the scheduler
+    settles near the highest rate upstream accepts.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = FETCH_RATE_PER_SECOND,
+        burst: float = FETCH_BURST,
+        max_retries: int = FETCH_MAX_RETRIES,
+        backoff_base: float = FETCH_BACKOFF_BASE_SECONDS,
+        backoff_max: float = FETCH_BACKOFF_MAX_SECONDS,
+        host_concurrency: Optional[Dict[str, int]] = None,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize fetch scheduler
+
+        Args:
+            rate_per_second: Target (maximum) request rate
+            burst: Requests allowed back to back before rate limiting applies
+            max_retries: Retries for a transient failure
+            backoff_base: First backoff ceiling in seconds
+            backoff_max: Largest backoff ceiling in seconds
+            host_concurrency: Concurrent calls allowed per host
+            failure_threshold: Consecutive failures that open a host circuit
+            reset_timeout: Seconds a circuit stays open before a trial call
+            clock: Monotonic time source
+            sleep: Sleep function (replaceable in tests)
+            rng: Random generator for backoff jitter
+        """
+        self.max_rate = rate_per_second
+        self.min_rate = min(FETCH_MIN_RATE_PER_SECOND, rate_per_second)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.host_concurrency = dict(FETCH_HOST_CONCURRENCY)
+        self.host_concurrency.update(host_concurrency or {})
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self.bucket = TokenBucket(rate_per_second, burst, clock=clock, sleep=sleep)
+
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _host_state(self, host: str):
+        with self._lock:
+            if host not in self._breakers:
+                limit = self.host_concurrency.get(host, DEFAULT_HOST_CONCURRENCY)
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+                self._breakers[host] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, clock=self._clock
+                )
+            return self._semaphores[host], self._breakers[host]
+
+    def is_available(self, host: str) -> bool:
+        """Whether the host circuit is not open"""
+        _, breaker = self._host_state(host)
+        return not breaker.is_open
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for a zero-based attempt"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return self._rng.uniform(0, ceiling)
+
+    def _on_throttled(self):
+        new_rate = max(self.min_rate, self.bucket.rate / 2)
+        if new_rate < self.bucket.rate:
+            logger.warning(f"Upstream throttling, lowering rate to {new_rate:.2f}/s")
+        self.bucket.set_rate(new_rate)
+
+    def _on_success(self):
+        if self.bucket.rate < self.max_rate:
+            self.bucket.set_rate(
+                min(self.max_rate, self.bucket.rate + self.max_rate / 10)
+            )
+
+    def call(self, host: str, fn: Callable, *args, **kwargs):
+        """
+        Run an upstream call under the rate limit, retry and circuit policies
+
+        Args:
+            host: Upstream host the call is attributed to
+            fn: Callable performing the request
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+
+        Raises:
+            UpstreamUnavailableError: Circuit open or transient retries exhausted
+        """
+        semaphore, breaker = self._host_state(host)
+        if not breaker.allow_request():
+            raise UpstreamUnavailableError(f"Circuit open for {host}")
+
+        with semaphore:
+            attempt = 0
+            while True:
+                self.bucket.acquire()
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    if not is_retryable_error(e):
+                        # A bad argument or a bug, not an upstream outage:
+                        # neither closes nor trips the circuit
+                        breaker.release()
+                        raise
+
+                    breaker.record_failure()
+                    if is_rate_limit_error(e):
+                        self._on_throttled()
+
+                    if attempt >= self.max_retries or not breaker.allow_request():
+                        raise UpstreamUnavailableError(
+                            f"{host} unavailable after {attempt + 1} attempts: {e}"
+                        ) from e
+
+                    delay = self.backoff_delay(attempt)
+                    logger.debug(f"Retrying {host} in {delay:.2f}s after: {e}")
+                    self._sleep(delay)
+                    attempt += 1
+                    continue
+
+                breaker.record_success()
+                self._on_success()
+                return result
@@ -0,0 +1,214 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 22:31:09
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 22:31:09
+# @ Description: Sector and market-cap group aggregates of batch results
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    DEFAULT_FREQUENCY,
+    GROUP_MAX_RETURN_CHUNKS,
+    MARKET_CAP_BUCKETS,
+    TRADING_DAYS_PER_YEAR,
+)
+from volatility_analyzer.data_models import BatchResult
+
+# Record column aggregated -> prefix of its group columns
+GROUP_METRICS = {
+    "Stock_Volatility_Annual": "Volatility",
+    "Beta": "Beta",
+    "R_Squared": "R_Squared",
+}
+
+
+def market_cap_buckets(
+    market_caps: Dict[str, float],
+    buckets: Tuple[Tuple[float, str], ...] = MARKET_CAP_BUCKETS,
+) -> Dict[str, str]:
+    """
+    Market-cap bucket of every ticker
+
+    Args:
+        market_caps: Market capitalization keyed by ticker
+        buckets: (upper bound, label) pairs in ascending order
+
+    Returns:
+        Dictionary mapping ticker to bucket label (tickers without a
+        finite market cap are left out)
+    """
+    tickers = [t for t, cap in market_caps.items() if np.isfinite(cap)]
+    caps = np.array([market_caps[t] for t in tickers], dtype=np.float64)
+    bounds = np.array([bound for bound, _ in buckets], dtype=np.float64)
+    labels = np.array([label for _, label in buckets])
+    positions = np.searchsorted(bounds, caps, side="right")
+    return dict(zip(tickers, labels[np.minimum(positions, len(labels) - 1)].tolist()))
+
+
+class GroupAggregator:
+    """
+    Aggregates batch results by group (e.g. sector or market-cap bucket).
+
+    Results are added as a batch streams past. Each member keeps one row of
+    metrics, and its returns are folded straight into per-(group, date)
+    sums, so memory grows with groups x dates rather than members x dates.
+    to_frame() computes every group's equal- and cap-weighted averages,
+    dispersion and group-index volatility in one grouped pass.
+
+    The group indexes are rebalanced every period: the equal-weighted index
+    return is the mean of the members' returns that period, and the
+    cap-weighted one weights them by the given (current) market caps.
+    """
+
+    def __init__(
+        self,
+        groups: Dict[str, str],
+        market_caps: Optional[Dict[str, float]] = None,
+        periods_per_year: int = TRADING_DAYS_PER_YEAR,
+    ):
+        """
+        Initialize aggregator
+
+        Args:
+            groups: Group name keyed by ticker; other tickers are ignored
+            market_caps: Market capitalization keyed by ticker, the weights
+                of cap-weighted aggregates (members without one get none)
+            periods_per_year: Return periods per year of member returns
+        """
+        self.groups = groups
+        self.market_caps = market_caps or {}
+        self.periods_per_year = periods_per_year
+        self._members: Dict[str, dict] = {}
+        self._return_chunks: List[pd.DataFrame] = []
+        self._index_members: Dict[str, int] = {}
+
+    def add(self, result: BatchResult):
+        """
+        Add one batch result
+
+        Full reports also contribute their returns to the group index;
+        rows restored from a journal, computed in worker processes or by
+        the polars backend count toward the metric aggregates only.
+
+        Args:
+            result: BatchResult of a ticker (failures are ignored)
+        """
+        group = self.groups.get(result.ticker)
+        if group is None or not result.ok:
+            return
+
+        row = result.to_row()
+        self._members[result.ticker] = {
+            "Group": group,
+            **{column: row.get(column, np.nan) for column in GROUP_METRICS},
+        }
+
+        report = result.report
+        if report is not None and report.frequency == DEFAULT_FREQUENCY:
+            stock_returns = report.beta_analysis.aligned_data["Stock"]
+            self.add_returns(result.ticker, stock_returns)
+
+    def add_returns(self, ticker: str, returns: pd.Series):
+        """
+        Fold a member's returns into its group index
+
+        Args:
+            ticker: Member ticker
+            returns: Its per-period returns
+        """
+        group = self.groups.get(ticker)
+        returns = returns.dropna()
+        if group is None or returns.empty:
+            return
+
+        weight = self.market_caps.get(ticker, np.nan)
+        has_weight = float(np.isfinite(weight))
+        values = returns.to_numpy(dtype=np.float64)
+        chunk = pd.DataFrame(
+            {
+                "count": 1.0,
+                "sum": values,
+                "weight": has_weight * np.nan_to_num(weight),
+                "weighted_sum": has_weight * np.nan_to_num(weight) * values,
+            },
+            index=pd.MultiIndex.from_arrays(
+                [np.full(len(values), group, dtype=object), returns.index],
+                names=["Group", "Date"],
+            ),
+        )
+        self._return_chunks.append(chunk)
+        self._index_members[group] = self._index_members.get(group, 0) + 1
+
+        if len(self._return_chunks) >= GROUP_MAX_RETURN_CHUNKS:
+            self._return_chunks = [self._merged_returns()]
+
+    def _merged_returns(self) -> pd.DataFrame:
+        """Per-(group, date) return sums of all chunks added so far"""
+        return pd.concat(self._return_chunks).groupby(level=[0, 1]).sum()
+
+    def _index_volatility(self) -> pd.DataFrame:
+        if not self._return_chunks:
+            return pd.DataFrame(
+                columns=[
+                    "Index_Volatility_Equal_Weighted",
+                    "Index_Volatility_Cap_Weighted",
+                ]
+            )
+
+        sums = self._merged_returns()
+        self._return_chunks = [sums]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index_returns = pd.DataFrame(
+                {
+                    "Index_Volatility_Equal_Weighted": sums["sum"] / sums["count"],
+                    "Index_Volatility_Cap_Weighted": sums["weighted_sum"]
+                    / sums["weight"].where(sums["weight"] > 0),
+                }
+            )
+        annualize = np.sqrt(self.periods_per_year) * 100
+        return index_returns.groupby(level="Group").std() * annualize
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Aggregates of every group
+
+        Returns:
+            DataFrame with one row per group: Group, Members, Market_Cap,
+            equal- and cap-weighted averages and dispersion (cross-sectional
+            standard deviation) of volatility, beta and R-squared, the
+            annualized volatility of the equal- and cap-weighted group
+            indexes, and Index_Members (members whose returns built them)
+        """
+        members = pd.DataFrame.from_dict(self._members, orient="index")
+        if members.empty:
+            return pd.DataFrame(columns=["Group", "Members"])
+
+        weights = members.index.map(lambda t: self.market_caps.get(t, np.nan))
+        members["Market_Cap"] = np.asarray(weights, dtype=np.float64)
+        grouped = members.groupby("Group")
+
+        columns = {
+            "Members": grouped.size(),
+            "Market_Cap": grouped["Market_Cap"].sum(min_count=1),
+        }
+        group = members["Group"]
+        for metric, prefix in GROUP_METRICS.items():
+            values = members[metric].astype(np.float64)
+            weight = members["Market_Cap"].where(values.notna())
+            weighted = (values * weight).groupby(group).sum(min_count=1)
+            total_weight = weight.groupby(group).sum(min_count=1)
+            columns[f"{prefix}_Equal_Weighted"] = values.groupby(group).mean()
+            columns[f"{prefix}_Cap_Weighted"] = weighted / total_weight
+            columns[f"{prefix}_Dispersion"] = values.groupby(group).std()
+
+        summary = pd.DataFrame(columns).join(self._index_volatility(), how="left")
+        summary["Index_Members"] = (
+            pd.Series(self._index_members, dtype=np.int64)
+            .reindex(summary.index, fill_value=0)
+        )
+        return summary.rename_axis("Group").reset_index()
@@ -0,0 +1,200 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 14:02:51
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 14:02:51
+# @ Description: Streaming per-session statistics for intraday analysis
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.data_models import (
+    StockMetrics,
+    BenchmarkMetrics,
+    BetaAnalysisResult,
+)
+
+
+def _variance(n, total, total_sq):
+    """Sample variance from count, sum and sum of squares"""
+    return (total_sq - total * total / n) / (n - 1)
+
+
+def _covariance(n, sum_x, sum_y, sum_xy):
+    """Sample covariance from count, sums and sum of products"""
+    return (sum_xy - sum_x * sum_y / n) / (n - 1)
+
+
+class SessionStatsAccumulator:
+    """
+    Accumulates intraday returns into per-session sufficient statistics.
+
+    Chunks of bar returns are reduced to one row per session (counts, sums,
+    sums of squares and cross products, log growth), so memory grows with
+    the number of sessions rather than the number of bars. Full-period and
+    rolling (in sessions) metrics are derived from these sums.
+    """
+
+    def __init__(self, annualization_factor: int):
+        """
+        Initialize accumulator
+
+        Args:
+            annualization_factor: Bar returns per year for the interval
+        """
+        self.annualization_factor = annualization_factor
+        self._chunks: List[pd.DataFrame] = []
+        self._sessions: pd.DataFrame = None
+
+    @staticmethod
+    def _session_sums(returns: pd.Series, prefix: str) -> pd.DataFrame:
+        sessions = returns.index.normalize()
+        grouped = pd.DataFrame(
+            {
+                f"n_{prefix}": 1.0,
+                f"sum_{prefix}": returns.values,
+                f"sumsq_{prefix}": returns.values**2,
+            },
+            index=sessions,
+        ).groupby(level=0)
+        return grouped.sum()
+
+    def add(self, stock_returns: pd.Series, benchmark_returns: pd.Series):
+        """
+        Fold one chunk of intraday returns into the session statistics
+
+        Args:
+            stock_returns: Stock bar returns for the chunk
+            benchmark_returns: Benchmark bar returns for the chunk
+        """
+        aligned = pd.concat([stock_returns, benchmark_returns], axis=1, join="inner")
+        aligned.columns = ["Stock", "Benchmark"]
+        x = aligned["Benchmark"].values
+        y = aligned["Stock"].values
+
+        cross = pd.DataFrame(
+            {
+                "n": 1.0,
+                "sx": x,
+                "sy": y,
+                "sxx": x * x,
+                "syy": y * y,
+                "sxy": x * y,
+                "log_s": np.log1p(y),
+                "log_b": np.log1p(x),
+            },
+            index=aligned.index.normalize(),
+        ).groupby(level=0).sum()
+
+        chunk = pd.concat(
+            [
+                self._session_sums(stock_returns, "s"),
+                self._session_sums(benchmark_returns, "b"),
+                cross,
+            ],
+            axis=1,
+        ).fillna(0.0)
+
+        self._chunks.append(chunk)
+        self._sessions = None
+
+    @property
+    def sessions(self) -> pd.DataFrame:
+        """Per-session sums (a session split across chunks is merged)"""
+        if self._sessions is None:
+            if not self._chunks:
+                raise ValueError("No intraday data accumulated")
+            merged = pd.concat(self._chunks).groupby(level=0).sum().sort_index()
+            self._chunks = [merged]
+            self._sessions = merged
+        return self._sessions
+
+    @property
+    def aligned_bars(self) -> int:
+        """Number of aligned stock/benchmark bars"""
+        return int(self.sessions["n"].sum())
+
+    def _annualized_vol(self, variance):
+        return np.sqrt(variance * self.annualization_factor) * 100
+
+    def stock_metrics(self, ticker: str, name: str) -> StockMetrics:
+        """Full-period stock metrics from the session sums"""
+        totals = self.sessions[["n_s", "sum_s", "sumsq_s"]].sum()
+        variance = _variance(*totals.values)
+        return StockMetrics(
+            ticker=ticker,
+            name=name,
+            volatility_annual=self._annualized_vol(variance),
+            returns_mean=totals["sum_s"] / totals["n_s"] * 100,
+            returns_std=np.sqrt(variance),
+        )
+
+    def benchmark_metrics(self, ticker: str, name: str) -> BenchmarkMetrics:
+        """Full-period benchmark metrics from the session sums"""
+        totals = self.sessions[["n_b", "sum_b", "sumsq_b"]].sum()
+        return BenchmarkMetrics(
+            ticker=ticker,
+            name=name,
+            volatility_annual=self._annualized_vol(_variance(*totals.values)),
+            returns_mean=totals["sum_b"] / totals["n_b"] * 100,
+        )
+
+    def session_returns(self) -> pd.DataFrame:
+        """Compounded aligned Stock/Benchmark return of every session"""
+        return pd.DataFrame(
+            {
+                "Stock": np.expm1(self.sessions["log_s"]),
+                "Benchmark": np.expm1(self.sessions["log_b"]),
+            }
+        )
+
+    def beta_analysis(self) -> BetaAnalysisResult:
+        """
+        Full-period beta from aligned bar returns
+
+        `aligned_data` holds compounded per-session returns, which keeps the
+        result bounded while still supporting the scatter plot.
+        """
+        t = self.sessions[["n", "sx", "sy", "sxx", "syy", "sxy"]].sum()
+        var_x = _variance(t["n"], t["sx"], t["sxx"])
+        var_y = _variance(t["n"], t["sy"], t["syy"])
+        cov = _covariance(t["n"], t["sx"], t["sy"], t["sxy"])
+
+        beta = cov / var_x if var_x != 0 else np.nan
+        if not np.isnan(beta):
+            correlation = cov / np.sqrt(var_x * var_y)
+            r_squared = correlation**2
+        else:
+            correlation = np.nan
+            r_squared = np.nan
+
+        return BetaAnalysisResult(
+            beta=beta,
+            r_squared=r_squared,
+            correlation=correlation,
+            aligned_data=self.session_returns(),
+        )
+
+    def rolling_volatility(self, window_sessions: int) -> pd.Series:
+        """Annualized stock volatility over a trailing window of sessions"""
+        sums = self.sessions[["n_s", "sum_s", "sumsq_s"]].rolling(window_sessions).sum()
+        variance = _variance(sums["n_s"], sums["sum_s"], sums["sumsq_s"])
+        return self._annualized_vol(variance)
+
+    def rolling_beta(self, window_sessions: int) -> pd.DataFrame:
+        """Beta and R-squared over a trailing window of sessions"""
+        sums = (
+            self.sessions[["n", "sx", "sy", "sxx", "syy", "sxy"]]
+            .rolling(window_sessions)
+            .sum()
+        )
+        var_x = _variance(sums["n"], sums["sx"], sums["sxx"])
+        var_y = _variance(sums["n"], sums["sy"], sums["syy"])
+        cov = _covariance(sums["n"], sums["sx"], sums["sy"], sums["sxy"])
+
+        rolling_beta = (cov / var_x).where(var_x != 0)
+        rolling_r2 = (cov**2 / (var_x * var_y)).where(var_x != 0)
+        return pd.DataFrame({"Rolling_Beta": rolling_beta, "Rolling_R2": rolling_r2})
@@ -0,0 +1,339 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 20:31:44
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 20:31:44
+# @ Description: Rolling kernels with an optional Numba backend and NumPy fallback
+"""
+
+import os
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from volatility_analyzer.config import (
+    DEFAULT_KERNEL_BACKEND,
+    KERNEL_BACKEND_ENV_VAR,
+    KERNEL_PARALLEL_MIN_SERIES,
+)
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+KERNEL_BACKENDS = ("numba", "numpy")
+
+# Variances below this fraction of the window's sum of squares are
+# rounding noise of a constant window and treated as zero
+_ZERO_VARIANCE_TOLERANCE = 1e-12
+
+_backend: Optional[str] = None
+_numba_kernels = None
+_backend_lock = threading.Lock()
+# Numba's default threading layer must not run parallel kernels from
+# several Python threads at once
+_parallel_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------------
+# Backend selection
+# ----------------------------------------------------------------------------
+
+
+def _load_numba():
+    """Compile (or load from the on-disk cache) the Numba kernels"""
+    global _numba_kernels
+    if _numba_kernels is None:
+        from volatility_analyzer import _numba_kernels as kernels
+
+        _numba_kernels = kernels
+    return _numba_kernels
+
+
+def _numba_available() -> bool:
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Kernel backends usable in this environment"""
+    return KERNEL_BACKENDS if _numba_available() else ("numpy",)
+
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Select the kernel backend
+
+    Args:
+        name: "numba", "numpy" or "auto" (Numba when installed)
+
+    Returns:
+        Name of the backend now in use; a requested but unavailable
+        backend falls back to NumPy with a warning
+    """
+    global _backend
+    name = name.lower()
+    if name not in KERNEL_BACKENDS + ("auto",):
+        raise ValueError(
+            f"Unknown kernel backend '{name}', use one of "
+            f"{', '.join(KERNEL_BACKENDS + ('auto',))}"
+        )
+
+    with _backend_lock:
+        if name in ("auto", "numba") and _numba_available():
+            _load_numba()
+            _backend = "numba"
+        else:
+            if name == "numba":
+                logger.warning(
+                    "Numba kernels requested but numba is not installed, "
+                    "using NumPy kernels (pip install numba)"
+                )
+            _backend = "numpy"
+    logger.info(f"Using {_backend} kernels")
+    return _backend
+
+
+def get_backend() -> str:
+    """
+    Name of the kernel backend in use
+
+    Resolved on first use from the environment variable named by
+    KERNEL_BACKEND_ENV_VAR ("numba", "numpy" or "auto").
+    """
+    if _backend is None:
+        set_backend(os.environ.get(KERNEL_BACKEND_ENV_VAR, DEFAULT_KERNEL_BACKEND))
+    return _backend
+
+
+def _as_panel(values) -> Tuple[np.ndarray, bool]:
+    x = np.asarray(values, dtype=np.float64)
+    single = x.ndim == 1
+    return (x[:, None] if single else x), single
+
+
+def _run_numba(name: str, *arrays):
+    """Run a Numba kernel, in parallel across series for wide panels"""
+    kernels = _load_numba()
+    if arrays[0].shape[1] >= KERNEL_PARALLEL_MIN_SERIES:
+        with _parallel_lock:
+            return getattr(kernels, f"{name}_parallel")(*arrays)
+    return getattr(kernels, name)(*arrays)
+
+
+# ----------------------------------------------------------------------------
+# NumPy implementations
+# ----------------------------------------------------------------------------
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over every trailing window along axis 0 (len - window + 1 rows)"""
+    cumulative = np.cumsum(values, axis=0)
+    sums = cumulative[window - 1 :].copy()
+    sums[1:] -= cumulative[:-window]
+    return sums
+
+
+def _centered(x: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Values minus their column mean (0 where missing) for stable sums"""
+    counts = valid.sum(axis=0)
+    means = np.where(valid, x, 0.0).sum(axis=0) / np.maximum(counts, 1)
+    return np.where(valid, x - means, 0.0)
+
+
+def _numpy_rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    result = np.full(x.shape, np.nan)
+    if window < 2 or len(x) < window:
+        return result
+
+    valid = np.isfinite(x)
+    d = _centered(x, valid)
+    n = _window_sums(valid.astype(np.float64), window)
+    s = _window_sums(d, window)
+    ss = _window_sums(d * d, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.maximum(ss - s * s / n, 0.0) / (n - 1)
+    result[window - 1 :] = np.where(n == window, np.sqrt(variance), np.nan)
+    return result
+
+
+def _numpy_rolling_beta(
+    y: np.ndarray, x: np.ndarray, window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    beta = np.full(y.shape, np.nan)
+    correlation = np.full(y.shape, np.nan)
+    if window < 2 or len(y) < window:
+        return beta, correlation
+
+    valid = np.isfinite(y) & np.isfinite(x)
+    dy, dx = _centered(y, valid), _centered(x, valid)
+    n = _window_sums(valid.astype(np.float64), window)
+    sx, sy = _window_sums(dx, window), _window_sums(dy, window)
+    sxx = _window_sums(dx * dx, window)
+    syy = _window_sums(dy * dy, window)
+    sxy = _window_sums(dx * dy, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        cov = sxy - sx * sy / n
+        usable = (n == window) & (var_x > _ZERO_VARIANCE_TOLERANCE * sxx)
+        beta[window - 1 :] = np.where(usable, cov / var_x, np.nan)
+        product = var_x * var_y
+        correlation[window - 1 :] = np.where(
+            usable & (product > 0), cov / np.sqrt(product), np.nan
+        )
+    return beta, correlation
+
+
+def _blocks(values: np.ndarray, window: int) -> np.ndarray:
+    """View (dates x series) as (blocks x window x series), NaN padded"""
+    n_dates, n_series = values.shape
+    n_blocks = -(-n_dates // window)
+    padded = np.full((n_blocks * window, n_series), np.nan)
+    padded[:n_dates] = values
+    return padded.reshape(n_blocks, window, n_series)
+
+
+def _flat(blocks: np.ndarray, n_dates: int) -> np.ndarray:
+    return blocks.reshape(-1, blocks.shape[-1])[:n_dates]
+
+
+def _numpy_rolling_max_drawdown(x: np.ndarray, window: int) -> np.ndarray:
+    n_dates = len(x)
+    result = np.full(x.shape, np.nan)
+    if window < 2 or n_dates < window:
+        return result
+
+    blocks = _blocks(x, window)
+    with np.errstate(invalid="ignore"):
+        prefix_max = np.fmax.accumulate(blocks, axis=1)
+        prefix_min = np.fmin.accumulate(blocks, axis=1)
+        prefix_drawdown = np.fmin.accumulate(blocks - prefix_max, axis=1)
+
+        reverse = blocks[:, ::-1]
+        suffix_max = np.fmax.accumulate(reverse, axis=1)[:, ::-1]
+        suffix_min = np.fmin.accumulate(reverse, axis=1)[:, ::-1]
+        suffix_drawdown = np.fmin.accumulate(
+            (suffix_min - blocks)[:, ::-1], axis=1
+        )[:, ::-1]
+
+    starts = np.arange(n_dates - window + 1)
+    ends = starts + window - 1
+    suffix_drawdown = _flat(suffix_drawdown, n_dates)[starts]
+    with np.errstate(invalid="ignore"):
+        worst = np.fmin(
+            np.fmin(suffix_drawdown, _flat(prefix_drawdown, n_dates)[ends]),
+            _flat(prefix_min, n_dates)[ends] - _flat(suffix_max, n_dates)[starts],
+        )
+    # A window starting on a block boundary is exactly one block
+    aligned = (starts % window == 0)[:, None]
+    worst = np.where(aligned, suffix_drawdown, worst)
+
+    valid = np.cumsum(np.isfinite(x), axis=0)
+    counts = valid[ends] - np.vstack([np.zeros((1, x.shape[1])), valid[:-window]])
+    worst = np.where(counts == window, worst, np.nan)
+
+    result[window - 1 :] = -np.expm1(np.minimum(worst, 0.0))
+    return result
+
+
+# ----------------------------------------------------------------------------
+# Public kernels
+# ----------------------------------------------------------------------------
+
+
+def rolling_std(values, window: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation (ddof=1)
+
+    Args:
+        values: (dates,) or (dates x series) values, NaN allowed
+        window: Window length in bars (ending at each date)
+
+    Returns:
+        Array shaped like the input; NaN unless all bars of the window
+        are valid (as pandas rolling(window).std())
+    """
+    x, single = _as_panel(values)
+    if get_backend() == "numba":
+        result = _run_numba("rolling_std", np.ascontiguousarray(x), window)
+    else:
+        result = _numpy_rolling_std(x, window)
+    return result[:, 0] if single else result
+
+
+def rolling_beta(y, x, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling beta and correlation of y on x in one fused pass
+
+    Args:
+        y: (dates,) or (dates x series) returns, NaN allowed
+        x: (dates,) benchmark returns shared by all series, or an array
+            shaped like y
+        window: Window length in bars (ending at each date)
+
+    Returns:
+        Tuple of (beta, correlation) arrays shaped like y; NaN unless all
+        bars of the window are valid or when x is constant in the window
+    """
+    y, single = _as_panel(y)
+    x = np.asarray(x, dtype=np.float64)
+    x = np.broadcast_to(x[:, None] if x.ndim == 1 else x, y.shape)
+    if get_backend() == "numba":
+        beta, correlation = _run_numba(
+            "rolling_beta", np.ascontiguousarray(y), x, window
+        )
+    else:
+        beta, correlation = _numpy_rolling_beta(y, x, window)
+    if single:
+        return beta[:, 0], correlation[:, 0]
+    return beta, correlation
+
+
+def rolling_max_drawdown(log_wealth, window: int) -> np.ndarray:
+    """
+    Largest peak-to-trough loss inside every trailing window
+
+    Uses the van Herk/Gil-Werman decomposition: the series is cut into
+    blocks of `window` bars, so every window is a suffix of one block
+    followed by a prefix of the next. Running maxima, minima and drawdowns
+    of block prefixes (forward scans) and suffixes (backward scans)
+    combine into the answer for each window:
+
+        min(suffix drawdown, prefix drawdown, prefix min - suffix max)
+
+    The NumPy backend runs the scans as ufunc accumulations over a
+    (blocks x window x series) array; the Numba backend runs them as loops
+    per series. Either way the cost is O(n) per series.
+
+    Args:
+        log_wealth: (dates,) or (dates x series) log wealth index, NaN for
+            missing bars
+        window: Window length in bars
+
+    Returns:
+        Array shaped like the input with the maximum drawdown as a positive
+        loss fraction; NaN until a window of valid bars exists
+    """
+    x, single = _as_panel(log_wealth)
+    if get_backend() == "numba":
+        result = _run_numba("rolling_max_drawdown", np.ascontiguousarray(x), window)
+    else:
+        result = _numpy_rolling_max_drawdown(x, window)
+    return result[:, 0] if single else result
+
+
+def kernel_info() -> dict:
+    """Backend in use and what is available, e.g. for logs and benchmarks"""
+    info = {"backend": get_backend(), "available": list(available_backends())}
+    if info["backend"] == "numba":
+        import numba
+
+        info["numba_version"] = numba.__version__
+        info["threads"] = numba.get_num_threads()
+    return info
+
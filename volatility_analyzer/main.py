@@ -0,0 +1,915 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 10:15:43
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 10:15:43
+# @ Description: Command line entry point for volatility analysis
+"""
+
+import argparse
+import functools
+import logging
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from volatility_analyzer.config import (
+    DEFAULT_INTERVAL,
+    INTRADAY_INTERVAL_MINUTES,
+    DEFAULT_YEARS_OF_DATA,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_SCREEN_WORKERS,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    DEFAULT_SERVER_MEMORY_BUDGET_MB,
+    DEFAULT_NUM_SHARDS,
+    DEFAULT_SHARD_FORMAT,
+    DEFAULT_WATCH_POLL_SECONDS,
+    VOLATILITY_THRESHOLDS,
+    BETA_THRESHOLDS,
+    VOLATILITY_TOP_CATEGORY,
+    BETA_TOP_CATEGORY,
+)
+from volatility_analyzer.batch_journal import BatchJournal
+from volatility_analyzer.logging_config import setup_logging, get_logger
+from volatility_analyzer.memory import MemoryTracker
+from volatility_analyzer.data_models import format_frame, records_to_frame
+from volatility_analyzer.group_aggregation import GroupAggregator, market_cap_buckets
+from volatility_analyzer.result_writers import (
+    SUPPORTED_FORMATS,
+    create_result_writer,
+    write_table,
+)
+from volatility_analyzer.screening import ScreeningIndex
+from volatility_analyzer.snapshot_store import SNAPSHOT_METRICS, SnapshotStore
+from volatility_analyzer.server import AnalysisService, create_server
+from volatility_analyzer.sharding import ShardCoordinator, run_shards_locally
+from volatility_analyzer.volatility_analyzer import VolatilityAnalyzer
+from volatility_analyzer.watcher import UniverseWatcher
+
+logger = get_logger(__name__)
+
+
+def read_ticker_file(
+    path: str, default_benchmark: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily read (ticker, benchmark) pairs from a text file
+
+    Each line holds a ticker and a benchmark separated by a comma or
+    whitespace. Blank lines, `#` comments and a `ticker,benchmark` header
+    are skipped. Lines with only a ticker use `default_benchmark`.
+
+    Args:
+        path: Input file path ("-" reads from stdin)
+        default_benchmark: Benchmark for lines without one
+
+    Yields:
+        Tuples of (stock ticker, benchmark ticker)
+    """
+    handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            fields = [f.strip() for f in line.replace(",", " ").split()]
+            if line_number == 1 and fields[0].lower() == "ticker":
+                continue
+
+            if len(fields) >= 2:
+                yield fields[0], fields[1]
+            elif default_benchmark:
+                yield fields[0], default_benchmark
+            else:
+                logger.warning(
+                    f"{path}:{line_number}: no benchmark for {fields[0]}, skipping"
+                )
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def read_group_file(path: str) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """
+    Read ticker groups and market caps from a text file
+
+    Each line holds a ticker, its group and optionally its market cap,
+    separated by commas (groups may contain spaces). Blank lines, `#`
+    comments and a `ticker,...` header are skipped.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Tuple of (group per ticker, market cap per ticker)
+    """
+    groups, market_caps = {}, {}
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            fields = [f.strip() for f in line.split(",")]
+            if line_number == 1 and fields[0].lower() == "ticker":
+                continue
+
+            ticker = fields[0]
+            if len(fields) >= 2 and fields[1]:
+                groups[ticker] = fields[1]
+            if len(fields) >= 3 and fields[2]:
+                try:
+                    market_caps[ticker] = float(fields[2])
+                except ValueError:
+                    logger.warning(
+                        f"{path}:{line_number}: bad market cap for {ticker}"
+                    )
+    return groups, market_caps
+
+
+def _group_aggregator(args: argparse.Namespace) -> Optional[GroupAggregator]:
+    """Aggregator for the screen's --groups options, if any"""
+    if not args.groups:
+        return None
+    groups, market_caps = read_group_file(args.groups)
+    if args.group_by == "market-cap":
+        groups = market_cap_buckets(market_caps)
+    return GroupAggregator(groups, market_caps)
+
+
+def run_screen(args: argparse.Namespace) -> int:
+    """Stream analysis rows for every ticker in the input file"""
+    analyzer = VolatilityAnalyzer(
+        years_of_data=args.years,
+        cache_dir=args.cache_dir,
+        verbose=False,
+        bootstrap_resamples=args.bootstrap,
+        random_seed=args.seed,
+        factor_tickers=args.factor,
+        memory_tracker=MemoryTracker() if args.memory_report else None,
+    )
+    ticker_items = read_ticker_file(args.input, args.default_benchmark)
+    journal = BatchJournal(args.journal) if args.journal else None
+    aggregator = _group_aggregator(args)
+    snapshot_rows = [] if args.snapshot_dir else None
+
+    succeeded = 0
+    failed = 0
+    start = time.perf_counter()
+
+    with create_result_writer(
+        args.output, args.format, columns=analyzer.record_columns()
+    ) as writer:
+        for result in analyzer.iter_stock_results(
+            ticker_items,
+            max_workers=args.workers,
+            max_in_flight=args.max_in_flight,
+            journal=journal,
+            interval=args.interval,
+            memory_budget_mb=args.memory_budget_mb,
+        ):
+            if result.ok:
+                row = result.to_row()
+                writer.write(row)
+                if snapshot_rows is not None:
+                    snapshot_rows.append(row)
+                succeeded += 1
+            else:
+                logger.warning(f"Error analyzing {result.ticker}: {result.error}")
+                failed += 1
+            if aggregator is not None:
+                aggregator.add(result)
+
+    if aggregator is not None:
+        if args.group_output:
+            group_output, group_format = args.group_output, None
+        else:
+            root, extension = os.path.splitext(args.output)
+            group_output, group_format = f"{root}.groups{extension}", args.format
+        write_table(aggregator.to_frame(), group_output, group_format)
+        print(f"Group aggregates -> {group_output}", file=sys.stderr)
+
+    if snapshot_rows:
+        SnapshotStore(args.snapshot_dir).append(
+            records_to_frame(snapshot_rows), snapshot_date=analyzer.end_date
+        )
+        print(
+            f"Snapshot of {analyzer.end_date.date()} -> {args.snapshot_dir}",
+            file=sys.stderr,
+        )
+
+    if analyzer.memory_tracker is not None:
+        analyzer.memory_tracker.stop()
+        report = analyzer.memory_tracker.report().round(2)
+        print(report.to_string(index=False), file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Screened {succeeded + failed} tickers in {elapsed:.1f}s "
+        f"({succeeded} ok, {failed} failed) -> {args.output}",
+        file=sys.stderr,
+    )
+    return 0 if succeeded or not failed else 1
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """Run the analysis HTTP service until interrupted"""
+    analyzer = VolatilityAnalyzer(
+        years_of_data=args.years, cache_dir=args.cache_dir, verbose=False
+    )
+    service = AnalysisService(
+        analyzer, memory_budget_mb=args.memory_budget_mb, max_workers=args.workers
+    )
+    server = create_server(service, host=args.host, port=args.port)
+
+    host, port = server.server_address[:2]
+    print(f"Serving volatility analysis on http://{host}:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    """Keep a results table current, reanalyzing only tickers whose data changed"""
+    analyzer = VolatilityAnalyzer(
+        years_of_data=args.years,
+        cache_dir=args.cache_dir,
+        verbose=False,
+        factor_tickers=args.factor,
+    )
+    watcher = UniverseWatcher(
+        analyzer,
+        read_ticker_file(args.input, args.default_benchmark),
+        output_path=args.output,
+        state_path=args.state,
+        max_workers=args.workers,
+        interval=args.interval,
+    )
+
+    def report(results):
+        failed = sum(1 for result in results if not result.ok)
+        print(
+            f"Poll {watcher.polls}: reanalyzed {len(results)} of "
+            f"{len(watcher.ticker_items)} tickers ({failed} failed) -> {args.output}",
+            file=sys.stderr,
+        )
+
+    watcher.on_update = report
+    try:
+        watcher.run(poll_seconds=args.poll_seconds, max_polls=args.max_polls)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _query_ranges(args: argparse.Namespace) -> Dict[str, Tuple[float, float]]:
+    """(low, high) range per column from the query's --min / --max options"""
+    ranges: Dict[str, list] = {}
+    for option, position in (("min", 0), ("max", 1)):
+        for condition in getattr(args, option) or []:
+            column, separator, value = condition.partition("=")
+            if not separator:
+                raise ValueError(f"--{option} expects COLUMN=VALUE, got '{condition}'")
+            ranges.setdefault(column.strip(), [None, None])[position] = float(value)
+    return {column: tuple(bounds) for column, bounds in ranges.items()}
+
+
+def run_query(args: argparse.Namespace) -> int:
+    """Screen a results table by volatility / beta category and value ranges"""
+    try:
+        ranges = _query_ranges(args)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    index = ScreeningIndex.from_file(args.input)
+    try:
+        matches = index.screen(
+            volatility=args.volatility,
+            beta=args.beta,
+            sort_by=args.sort_by,
+            ascending=args.ascending,
+            **ranges,
+        )
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 1
+    if args.limit is not None:
+        matches = matches.head(args.limit)
+
+    if args.output:
+        write_table(matches, args.output)
+        print(
+            f"{len(matches)} of {len(index)} rows -> {args.output}", file=sys.stderr
+        )
+    else:
+        print(format_frame(matches).to_string(index=False))
+        print(f"{len(matches)} of {len(index)} rows", file=sys.stderr)
+    return 0
+
+
+def _print_or_write(table, args: argparse.Namespace):
+    """Write a query result to --output, or print it"""
+    if args.output:
+        write_table(table, args.output)
+        print(f"{len(table)} rows -> {args.output}", file=sys.stderr)
+    else:
+        print(format_frame(table).to_string(index=False))
+
+
+def run_snapshot_as_of(args: argparse.Namespace) -> int:
+    """Print the latest stored metrics of tickers as of a date"""
+    store = SnapshotStore(args.store)
+    _print_or_write(store.as_of(args.date, tickers=args.tickers), args)
+    return 0
+
+
+def run_snapshot_history(args: argparse.Namespace) -> int:
+    """Print the stored metric history of tickers"""
+    store = SnapshotStore(args.store)
+    history = store.history(args.tickers, start=args.start, end=args.end)
+    if args.metric:
+        history = history.pivot(
+            index="Snapshot_Date", columns="Ticker", values=args.metric
+        ).reset_index()
+        history.columns.name = None
+    _print_or_write(history, args)
+    return 0
+
+
+def run_snapshot_compact(args: argparse.Namespace) -> int:
+    """Merge the files of each snapshot date into one"""
+    compacted = SnapshotStore(args.store).compact(start=args.start, end=args.end)
+    print(f"Compacted {compacted} partitions of {args.store}", file=sys.stderr)
+    return 0
+
+
+def _shard_analyzer_factory(args: argparse.Namespace):
+    """Picklable factory for the analyzer of a shard worker"""
+    return functools.partial(
+        VolatilityAnalyzer,
+        years_of_data=args.years,
+        cache_dir=args.cache_dir,
+        verbose=False,
+        bootstrap_resamples=args.bootstrap,
+        random_seed=args.seed,
+        factor_tickers=args.factor,
+    )
+
+
+def _print_shard_stats(stats: List[dict]):
+    for shard in stats:
+        print(
+            f"Shard {shard['shard']}: {shard['succeeded']} ok, "
+            f"{shard['failed']} failed in {shard['seconds']:.1f}s",
+            file=sys.stderr,
+        )
+
+
+def run_shard_run(args: argparse.Namespace) -> int:
+    """Claim and run shards of a ticker file, as one node of a sharded batch"""
+    coordinator = ShardCoordinator(args.output_dir, args.num_shards, args.format)
+    analyzer = _shard_analyzer_factory(args)()
+
+    stats = coordinator.run_available(
+        analyzer,
+        lambda: read_ticker_file(args.input, args.default_benchmark),
+        shard_indices=args.shard,
+        max_workers=args.workers,
+        interval=args.interval,
+    )
+    _print_shard_stats(stats)
+
+    pending = coordinator.pending_shards()
+    print(
+        f"Ran {len(stats)} shards; {len(pending)} of {args.num_shards} still pending",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _write_merged(coordinator: ShardCoordinator, args: argparse.Namespace) -> int:
+    rows = coordinator.merge(allow_partial=getattr(args, "allow_partial", False))
+    if rows.empty:
+        print("No shard results to merge", file=sys.stderr)
+        return 1
+
+    rows = records_to_frame(rows.to_dict("records"))
+    write_table(rows, args.output)
+
+    comparison = VolatilityAnalyzer.build_comparison_table(rows.to_dict("records"))
+    print(format_frame(comparison).to_string(index=False), file=sys.stderr)
+    print(f"Merged {len(rows)} rows -> {args.output}", file=sys.stderr)
+    return 0
+
+
+def _merge_shards(args: argparse.Namespace) -> int:
+    coordinator = ShardCoordinator(args.output_dir, args.num_shards, args.format)
+    try:
+        return _write_merged(coordinator, args)
+    except RuntimeError as e:
+        print(f"{e} (use --allow-partial to merge anyway)", file=sys.stderr)
+        return 1
+
+
+def run_shard_merge(args: argparse.Namespace) -> int:
+    """Merge completed shard outputs into the final comparison table"""
+    return _merge_shards(args)
+
+
+def run_shard_local(args: argparse.Namespace) -> int:
+    """Run all shards with several local processes, then merge"""
+    stats = run_shards_locally(
+        read_ticker_file(args.input, args.default_benchmark),
+        args.output_dir,
+        num_shards=args.num_shards,
+        processes=args.processes,
+        fmt=args.format,
+        analyzer_factory=_shard_analyzer_factory(args),
+        max_workers=args.workers,
+        interval=args.interval,
+    )
+    _print_shard_stats(stats)
+    return _merge_shards(args)
+
+
+def _add_data_arguments(parser: argparse.ArgumentParser):
+    """Add the data window and cache arguments shared by subcommands"""
+    parser.add_argument(
+        "--years",
+        type=int,
+        default=DEFAULT_YEARS_OF_DATA,
+        help=f"Years of history (default: {DEFAULT_YEARS_OF_DATA})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Price data cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
+    parser = argparse.ArgumentParser(
+        prog="volatility-analysis",
+        description="Stock Market Volatility and Beta Analysis Tool",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging verbosity (default: WARNING)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    screen = subparsers.add_parser(
+        "screen",
+        help="Analyze a ticker file and stream one result row per ticker",
+    )
+    screen.add_argument(
+        "input", help="File of 'TICKER,BENCHMARK' lines ('-' for stdin)"
+    )
+    screen.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Output file (.jsonl, .csv, .parquet, .arrow)",
+    )
+    screen.add_argument(
+        "--format",
+        choices=SUPPORTED_FORMATS,
+        default=None,
+        help="Output format (inferred from the output extension by default)",
+    )
+    screen.add_argument(
+        "--default-benchmark",
+        default=None,
+        help="Benchmark for input lines that only list a ticker",
+    )
+    screen.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SCREEN_WORKERS,
+        help=f"Concurrent analyses (default: {DEFAULT_SCREEN_WORKERS})",
+    )
+    screen.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Maximum analyses held in memory (default: 2x workers)",
+    )
+    screen.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=None,
+        help="Process memory budget; fewer analyses run at once as it is neared",
+    )
+    screen.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace allocations and print peak / retained memory per stage",
+    )
+    screen.add_argument(
+        "--interval",
+        default=DEFAULT_INTERVAL,
+        choices=[DEFAULT_INTERVAL, *INTRADAY_INTERVAL_MINUTES],
+        help=f"Bar interval (default: {DEFAULT_INTERVAL})",
+    )
+    screen.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Add block-bootstrap confidence intervals from N resamples",
+    )
+    screen.add_argument(
+        "--seed", type=int, default=None, help="Random seed for the bootstrap"
+    )
+    screen.add_argument(
+        "--factor",
+        action="append",
+        default=[],
+        metavar="TICKER",
+        help="Extra regression factor, e.g. a sector index (repeatable)",
+    )
+    screen.add_argument(
+        "--groups",
+        default=None,
+        metavar="FILE",
+        help="File of 'TICKER,GROUP[,MARKET_CAP]' lines; adds group aggregates",
+    )
+    screen.add_argument(
+        "--group-by",
+        choices=["group", "market-cap"],
+        default="group",
+        help="Aggregate by the file's groups or by market-cap bucket",
+    )
+    screen.add_argument(
+        "--group-output",
+        default=None,
+        help="Group aggregates file (default: output name with '.groups')",
+    )
+    screen.add_argument(
+        "--snapshot-dir",
+        default=None,
+        metavar="DIR",
+        help="Also append the metrics to this snapshot store",
+    )
+    screen.add_argument(
+        "--journal",
+        default=None,
+        help="Checkpoint journal; rerunning with it skips completed tickers",
+    )
+    _add_data_arguments(screen)
+    screen.set_defaults(handler=run_screen)
+
+    watch = subparsers.add_parser(
+        "watch",
+        help="Poll for new data and reanalyze only the tickers that changed",
+    )
+    watch.add_argument(
+        "input", help="File of 'TICKER,BENCHMARK' lines ('-' for stdin)"
+    )
+    watch.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Results table kept current (.jsonl, .csv, .parquet, .arrow)",
+    )
+    watch.add_argument(
+        "--state",
+        default=None,
+        help="Data version state file (default: <output>.state.json)",
+    )
+    watch.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=DEFAULT_WATCH_POLL_SECONDS,
+        help=f"Seconds between polls (default: {DEFAULT_WATCH_POLL_SECONDS})",
+    )
+    watch.add_argument(
+        "--max-polls",
+        type=int,
+        default=None,
+        help="Exit after this many polls (default: run until interrupted)",
+    )
+    watch.add_argument(
+        "--default-benchmark",
+        default=None,
+        help="Benchmark for input lines that only list a ticker",
+    )
+    watch.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SCREEN_WORKERS,
+        help=f"Concurrent analyses (default: {DEFAULT_SCREEN_WORKERS})",
+    )
+    watch.add_argument(
+        "--interval",
+        default=DEFAULT_INTERVAL,
+        choices=[DEFAULT_INTERVAL, *INTRADAY_INTERVAL_MINUTES],
+        help=f"Bar interval (default: {DEFAULT_INTERVAL})",
+    )
+    watch.add_argument(
+        "--factor",
+        action="append",
+        default=[],
+        metavar="TICKER",
+        help="Extra regression factor, e.g. a sector index (repeatable)",
+    )
+    _add_data_arguments(watch)
+    watch.set_defaults(handler=run_watch)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a local HTTP service that keeps analysis data warm in memory",
+    )
+    serve.add_argument(
+        "--host",
+        default=DEFAULT_SERVER_HOST,
+        help=f"Interface to bind (default: {DEFAULT_SERVER_HOST})",
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_SERVER_PORT,
+        help=f"Port to bind (default: {DEFAULT_SERVER_PORT})",
+    )
+    serve.add_argument(
+        "--memory-budget-mb",
+        type=int,
+        default=DEFAULT_SERVER_MEMORY_BUDGET_MB,
+        help=f"Warm cache budget in MB (default: {DEFAULT_SERVER_MEMORY_BUDGET_MB})",
+    )
+    serve.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SCREEN_WORKERS,
+        help=f"Concurrent analyses per comparison (default: {DEFAULT_SCREEN_WORKERS})",
+    )
+    _add_data_arguments(serve)
+    serve.set_defaults(handler=run_serve)
+
+    query = subparsers.add_parser(
+        "query",
+        help="Screen a results table by volatility / beta category and ranges",
+    )
+    query.add_argument(
+        "input", help="Results file (.jsonl, .csv, .parquet, .arrow)"
+    )
+    query.add_argument(
+        "--volatility",
+        nargs="+",
+        choices=[*VOLATILITY_THRESHOLDS, VOLATILITY_TOP_CATEGORY],
+        default=None,
+        help="Keep stocks in any of these volatility categories",
+    )
+    query.add_argument(
+        "--beta",
+        nargs="+",
+        choices=[*BETA_THRESHOLDS, BETA_TOP_CATEGORY],
+        default=None,
+        help="Keep stocks in any of these beta categories",
+    )
+    query.add_argument(
+        "--min",
+        action="append",
+        metavar="COLUMN=VALUE",
+        help="Keep rows with COLUMN >= VALUE (repeatable)",
+    )
+    query.add_argument(
+        "--max",
+        action="append",
+        metavar="COLUMN=VALUE",
+        help="Keep rows with COLUMN < VALUE (repeatable)",
+    )
+    query.add_argument(
+        "--sort-by",
+        default=None,
+        help="Sort matches by this column (default: file order)",
+    )
+    query.add_argument(
+        "--ascending",
+        action="store_true",
+        help="Sort ascending instead of descending",
+    )
+    query.add_argument(
+        "--limit", type=int, default=None, help="Keep at most this many rows"
+    )
+    query.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write matches here instead of printing them",
+    )
+    query.set_defaults(handler=run_query)
+
+    snapshot = subparsers.add_parser(
+        "snapshot",
+        help="Query or compact a store of daily metric snapshots",
+    )
+    snapshot_commands = snapshot.add_subparsers(
+        dest="snapshot_command", required=True
+    )
+
+    def add_store_arguments(sub: argparse.ArgumentParser, output: bool = True):
+        sub.add_argument("store", help="Snapshot store directory")
+        if output:
+            sub.add_argument(
+                "--tickers",
+                nargs="+",
+                default=None,
+                help="Only these tickers (default: all)",
+            )
+            sub.add_argument(
+                "-o",
+                "--output",
+                default=None,
+                help="Write the result here instead of printing it",
+            )
+
+    snapshot_as_of = snapshot_commands.add_parser(
+        "as-of", help="Latest metrics of every ticker on or before a date"
+    )
+    add_store_arguments(snapshot_as_of)
+    snapshot_as_of.add_argument(
+        "--date", default=None, help="Point in time, YYYY-MM-DD (default: latest)"
+    )
+    snapshot_as_of.set_defaults(handler=run_snapshot_as_of)
+
+    snapshot_history = snapshot_commands.add_parser(
+        "history", help="Metric history of tickers between two dates"
+    )
+    add_store_arguments(snapshot_history)
+    snapshot_history.add_argument(
+        "--metric",
+        choices=SNAPSHOT_METRICS,
+        default=None,
+        help="Show one metric as a date x ticker table",
+    )
+
+    snapshot_compact = snapshot_commands.add_parser(
+        "compact", help="Merge the files of each snapshot date into one"
+    )
+    add_store_arguments(snapshot_compact, output=False)
+    for sub in (snapshot_history, snapshot_compact):
+        sub.add_argument("--start", default=None, help="First date, YYYY-MM-DD")
+        sub.add_argument("--end", default=None, help="Last date, YYYY-MM-DD")
+    snapshot_history.set_defaults(handler=run_snapshot_history)
+    snapshot_compact.set_defaults(handler=run_snapshot_compact)
+
+    shard = subparsers.add_parser(
+        "shard",
+        help="Run a batch as deterministic shards on several processes or nodes",
+    )
+    shard_commands = shard.add_subparsers(dest="shard_command", required=True)
+
+    def add_layout_arguments(sub: argparse.ArgumentParser):
+        sub.add_argument(
+            "--output-dir",
+            required=True,
+            help="Directory (shared between nodes) holding shard outputs",
+        )
+        sub.add_argument(
+            "--num-shards",
+            type=int,
+            default=DEFAULT_NUM_SHARDS,
+            help=f"Number of shards (default: {DEFAULT_NUM_SHARDS})",
+        )
+        sub.add_argument(
+            "--format",
+            choices=SUPPORTED_FORMATS,
+            default=DEFAULT_SHARD_FORMAT,
+            help=f"Shard output format (default: {DEFAULT_SHARD_FORMAT})",
+        )
+
+    def add_run_arguments(sub: argparse.ArgumentParser):
+        sub.add_argument(
+            "input", help="File of 'TICKER,BENCHMARK' lines, the full universe"
+        )
+        add_layout_arguments(sub)
+        sub.add_argument(
+            "--default-benchmark",
+            default=None,
+            help="Benchmark for input lines that only list a ticker",
+        )
+        sub.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Concurrent analyses within a shard (default: 1)",
+        )
+        sub.add_argument(
+            "--interval",
+            default=DEFAULT_INTERVAL,
+            choices=[DEFAULT_INTERVAL, *INTRADAY_INTERVAL_MINUTES],
+            help=f"Bar interval (default: {DEFAULT_INTERVAL})",
+        )
+        sub.add_argument(
+            "--bootstrap",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Add block-bootstrap confidence intervals from N resamples",
+        )
+        sub.add_argument(
+            "--seed", type=int, default=None, help="Random seed for the bootstrap"
+        )
+        sub.add_argument(
+            "--factor",
+            action="append",
+            default=[],
+            metavar="TICKER",
+            help="Extra regression factor, e.g. a sector index (repeatable)",
+        )
+        _add_data_arguments(sub)
+
+    shard_run = shard_commands.add_parser(
+        "run", help="Claim and run pending shards (start one per node)"
+    )
+    add_run_arguments(shard_run)
+    shard_run.add_argument(
+        "--shard",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Only consider these shard indices (default: any pending shard)",
+    )
+    shard_run.set_defaults(handler=run_shard_run)
+
+    shard_merge = shard_commands.add_parser(
+        "merge", help="Merge completed shards into one result file"
+    )
+    add_layout_arguments(shard_merge)
+    shard_merge.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Merged file (.jsonl, .csv, .parquet, .arrow)",
+    )
+    shard_merge.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Merge even if some shards have not completed",
+    )
+    shard_merge.set_defaults(handler=run_shard_merge)
+
+    shard_local = shard_commands.add_parser(
+        "local", help="Run every shard with local processes, then merge"
+    )
+    add_run_arguments(shard_local)
+    shard_local.add_argument(
+        "--processes",
+        type=int,
+        default=2,
+        help="Worker processes (default: 2)",
+    )
+    shard_local.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Merged file (.jsonl, .csv, .parquet, .arrow)",
+    )
+    shard_local.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Merge even if some shards are held by another running worker",
+    )
+    shard_local.set_defaults(handler=run_shard_local)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the volatility-analysis command line tool
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "interval", DEFAULT_INTERVAL) in INTRADAY_INTERVAL_MINUTES and (
+        getattr(args, "bootstrap", 0) or getattr(args, "factor", None)
+    ):
+        parser.error("--bootstrap and --factor require daily (1d) bars")
+
+    # Logs go to stderr so that "-o /dev/stdout" style pipelines stay clean
+    setup_logging(level=getattr(logging, args.log_level), stream=sys.stderr)
+
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-20 00:21:05
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-20 00:21:05
+# @ Description: Per-stage memory accounting and a memory budget for batches
+"""
+
+import gc
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from volatility_analyzer.config import (
+    MEMORY_BUDGET_HIGH_WATERMARK,
+    MEMORY_BUDGET_LOW_WATERMARK,
+)
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def current_memory_bytes() -> Optional[int]:
+    """
+    Memory currently used by this process
+
+    Returns:
+        Resident set size where the platform exposes it (Linux), else the
+        memory traced by tracemalloc when tracing, else None
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
+
+class _Stage:
+    __slots__ = ("name", "start", "peak")
+
+    def __init__(self, name: str, start: int):
+        self.name = name
+        self.start = start
+        self.peak = start
+
+
+class MemoryTracker:
+    """
+    Peak and retained memory of each analysis stage, from tracemalloc.
+
+    A stage records the traced memory when it starts, the highest traced
+    memory while it runs (peak) and the traced memory when it ends; peak
+    minus start is the stage's peak growth and end minus start what it left
+    allocated (retained), e.g. fetched frames or a report's aligned data.
+    Stages nest: an outer stage's peak includes its inner stages.
+
+    tracemalloc counts every thread, so with concurrent workers a stage's
+    numbers include what other workers allocated meanwhile; run one worker
+    for exact attribution. Tracing slows Python allocations down, so track
+    memory when investigating rather than in every run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active: List[_Stage] = []
+        self._stats: Dict[str, dict] = {}
+        self._started_tracing = False
+
+    def start(self):
+        """Start tracing allocations (if nothing traces them yet)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        """Stop tracing, if this tracker started it"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _reset_peak(self, peak: int):
+        """Carry the peak so far into every active stage, then reset it"""
+        for stage in self._active:
+            stage.peak = max(stage.peak, peak)
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Account the memory of a block of work
+
+        Args:
+            name: Stage name; calls with the same name are aggregated
+        """
+        self.start()
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._reset_peak(peak)
+            stage = _Stage(name, current)
+            self._active.append(stage)
+        try:
+            yield
+        finally:
+            with self._lock:
+                current, peak = tracemalloc.get_traced_memory()
+                self._reset_peak(peak)
+                self._active.remove(stage)
+                stats = self._stats.setdefault(
+                    name, {"calls": 0, "peak": 0, "peak_total": 0, "retained": 0}
+                )
+                stats["calls"] += 1
+                stats["peak"] = max(stats["peak"], stage.peak - stage.start)
+                stats["peak_total"] += stage.peak - stage.start
+                stats["retained"] += current - stage.start
+
+    def report(self) -> pd.DataFrame:
+        """
+        Memory of every stage seen so far
+
+        Returns:
+            DataFrame with one row per stage (in first-seen order): Stage,
+            Calls, Peak_MB (largest peak growth of one call), Mean_Peak_MB
+            and Retained_MB (allocations left behind by all calls)
+        """
+        mb = 1024 * 1024
+        with self._lock:
+            rows = [
+                {
+                    "Stage": name,
+                    "Calls": stats["calls"],
+                    "Peak_MB": stats["peak"] / mb,
+                    "Mean_Peak_MB": stats["peak_total"] / stats["calls"] / mb,
+                    "Retained_MB": stats["retained"] / mb,
+                }
+                for name, stats in self._stats.items()
+            ]
+        return pd.DataFrame(
+            rows,
+            columns=["Stage", "Calls", "Peak_MB", "Mean_Peak_MB", "Retained_MB"],
+        )
+
+    def reset(self):
+        """Forget the stages recorded so far"""
+        with self._lock:
+            self._stats.clear()
+
+
+class MemoryBudget:
+    """
+    Limit on concurrent analyses that keeps process memory under a budget.
+
+    The batch engine asks for the current limit before starting each
+    analysis. Above MEMORY_BUDGET_HIGH_WATERMARK of the budget the limit
+    halves (down to one analysis at a time), and halves again only once the
+    analyses in flight have drained to the new limit, so memory can settle
+    first; below MEMORY_BUDGET_LOW_WATERMARK it grows back by one up to the
+    configured maximum.
+    """
+
+    def __init__(self, budget_mb: float, max_in_flight: int):
+        """
+        Initialize budget
+
+        Args:
+            budget_mb: Memory budget of the whole process
+            max_in_flight: Limit while memory is comfortably under budget
+        """
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.max_in_flight = max(1, max_in_flight)
+        self.limit = self.max_in_flight
+        self._warned = False
+
+    def update(self, in_flight: int) -> int:
+        """
+        Adjust the limit to the memory in use now
+
+        Args:
+            in_flight: Analyses currently running or unconsumed
+
+        Returns:
+            Number of analyses that may be in flight
+        """
+        used = current_memory_bytes()
+        if used is None:
+            if not self._warned:
+                logger.warning("Memory use is not measurable here, budget ignored")
+                self._warned = True
+            return self.limit
+
+        if used > MEMORY_BUDGET_HIGH_WATERMARK * self.budget_bytes:
+            if self.limit > 1 and in_flight <= self.limit:
+                gc.collect()
+                self.limit = max(1, self.limit // 2)
+                logger.info(
+                    f"Memory at {used / 1024 / 1024:.0f} MB, "
+                    f"lowering concurrency to {self.limit}"
+                )
+            elif self.limit == 1 and used > self.budget_bytes and not self._warned:
+                logger.warning(
+                    f"Memory at {used / 1024 / 1024:.0f} MB exceeds the budget "
+                    "even with one analysis at a time"
+                )
+                self._warned = True
+        elif used < MEMORY_BUDGET_LOW_WATERMARK * self.budget_bytes:
+            self.limit = min(self.max_in_flight, self.limit + 1)
+        return self.limit
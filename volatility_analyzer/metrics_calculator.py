@@ -6,30 +6,110 @@
 # @ Description: Calculate volatility, beta, and other financial metrics
 """
 
+import math
 import pandas as pd
 import numpy as np
-from typing import Tuple
-from volatility_analyzer.config import TRADING_DAYS_PER_YEAR
+from typing import Dict, Optional, Tuple
+from volatility_analyzer.config import (
+    TRADING_DAYS_PER_YEAR,
+    TRADING_MINUTES_PER_SESSION,
+    DEFAULT_INTERVAL,
+    INTRADAY_INTERVAL_MINUTES,
+    DEFAULT_FREQUENCY,
+    FREQUENCY_RESAMPLE_RULES,
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_BOOTSTRAP_CONFIDENCE,
+    BOOTSTRAP_MAX_BATCH_MB,
+)
 from volatility_analyzer.data_models import (
     StockMetrics,
     BenchmarkMetrics,
     BetaAnalysisResult,
+    BootstrapIntervals,
+    FactorRegressionResult,
+    DrawdownMetrics,
+    VolatilityRegime,
 )
+from volatility_analyzer import kernels
+from volatility_analyzer.drawdown import DrawdownCalculator
+from volatility_analyzer.factor_regression import FactorRegressionCalculator
+from volatility_analyzer.order_statistics import OrderStatisticsCalculator
 
 
 class MetricsCalculator:
     """Calculate financial metrics from price and return data"""
 
     @staticmethod
-    def calculate_returns(price_data: pd.DataFrame) -> pd.Series:
+    def is_intraday(interval: str) -> bool:
+        """Whether a yfinance interval is shorter than one session"""
+        return interval in INTRADAY_INTERVAL_MINUTES
+
+    @staticmethod
+    def bars_per_session(interval: str) -> int:
+        """
+        Number of bars in one trading session
+
+        Args:
+            interval: yfinance interval string (e.g. "1d", "5m", "1h")
+
+        Returns:
+            Bars per session (1 for daily data)
+        """
+        if interval == DEFAULT_INTERVAL:
+            return 1
+        if interval not in INTRADAY_INTERVAL_MINUTES:
+            raise ValueError(f"Unsupported interval '{interval}'")
+        return math.ceil(TRADING_MINUTES_PER_SESSION / INTRADAY_INTERVAL_MINUTES[interval])
+
+    @staticmethod
+    def returns_per_session(interval: str) -> int:
+        """
+        Number of bar returns in one trading session
+
+        calculate_returns() drops the first bar of every intraday session
+        (its return would span the overnight gap), so a session of n bars
+        yields n - 1 returns.
+
+        Args:
+            interval: yfinance interval string (e.g. "1d", "5m", "1h")
+
+        Returns:
+            Returns per session (1 for daily data)
+        """
+        bars = MetricsCalculator.bars_per_session(interval)
+        if interval == DEFAULT_INTERVAL:
+            return bars
+        return max(1, bars - 1)
+
+    @staticmethod
+    def annualization_factor(interval: str = DEFAULT_INTERVAL) -> int:
         """
-        Calculate daily returns from price data
+        Number of return periods per year for an interval
+
+        Args:
+            interval: yfinance interval string
+
+        Returns:
+            Sessions per year x returns per session
+        """
+        return TRADING_DAYS_PER_YEAR * MetricsCalculator.returns_per_session(interval)
+
+    @staticmethod
+    def calculate_returns(
+        price_data: pd.DataFrame, interval: str = DEFAULT_INTERVAL
+    ) -> pd.Series:
+        """
+        Calculate per-bar returns from price data
+
+        For intraday intervals the first bar of every session is dropped, so
+        overnight gaps are not counted as bar returns.
 
         Args:
             price_data: DataFrame with 'Close' prices
+            interval: yfinance interval of the prices
 
         Returns:
-            Series of daily returns
+            Series of returns
         """
         prices = price_data["Close"]
 
@@ -37,8 +117,45 @@ class MetricsCalculator:
         if prices.index.has_duplicates:
             prices = prices[~prices.index.duplicated(keep="first")]
 
-        returns = prices.pct_change().dropna()
-        return returns
+        returns = prices.pct_change()
+
+        if MetricsCalculator.is_intraday(interval):
+            sessions = prices.index.normalize()
+            same_session = np.concatenate(
+                [[False], np.asarray(sessions[1:] == sessions[:-1])]
+            )
+            returns = returns[same_session]
+
+        return returns.dropna()
+
+    @staticmethod
+    def resample_prices(
+        price_data: pd.DataFrame, frequency: str = DEFAULT_FREQUENCY
+    ) -> pd.DataFrame:
+        """
+        Resample daily prices to period-end closes
+
+        Returns computed from period-end closes are the daily returns
+        compounded over each period.
+
+        Args:
+            price_data: DataFrame with daily 'Close' prices
+            frequency: "D", "W" or "M"
+
+        Returns:
+            DataFrame with one 'Close' per period
+        """
+        if frequency not in FREQUENCY_RESAMPLE_RULES:
+            raise ValueError(f"Unsupported frequency '{frequency}'")
+
+        rule = FREQUENCY_RESAMPLE_RULES[frequency]
+        if rule is None:
+            return price_data
+
+        closes = price_data["Close"]
+        if closes.index.has_duplicates:
+            closes = closes[~closes.index.duplicated(keep="first")]
+        return closes.resample(rule).last().dropna().to_frame("Close")
 
     @staticmethod
     def calculate_volatility(
@@ -60,7 +177,10 @@ class MetricsCalculator:
 
     @staticmethod
     def calculate_stock_metrics(
-        ticker: str, name: str, returns: pd.Series
+        ticker: str,
+        name: str,
+        returns: pd.Series,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
     ) -> StockMetrics:
         """
         Calculate stock metrics from returns
@@ -69,11 +189,12 @@ class MetricsCalculator:
             ticker: Stock ticker
             name: Stock name
             returns: Daily returns series
+            trading_days: Return periods in a year
 
         Returns:
             StockMetrics object
         """
-        volatility = MetricsCalculator.calculate_volatility(returns)
+        volatility = MetricsCalculator.calculate_volatility(returns, trading_days)
         mean_return = returns.mean() * 100
         std_return = returns.std()
 
@@ -87,7 +208,10 @@ class MetricsCalculator:
 
     @staticmethod
     def calculate_benchmark_metrics(
-        ticker: str, name: str, returns: pd.Series
+        ticker: str,
+        name: str,
+        returns: pd.Series,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
     ) -> BenchmarkMetrics:
         """
         Calculate benchmark metrics from returns
@@ -96,11 +220,12 @@ class MetricsCalculator:
             ticker: Benchmark ticker
             name: Benchmark name
             returns: Daily returns series
+            trading_days: Return periods in a year
 
         Returns:
             BenchmarkMetrics object
         """
-        volatility = MetricsCalculator.calculate_volatility(returns)
+        volatility = MetricsCalculator.calculate_volatility(returns, trading_days)
         mean_return = returns.mean() * 100
 
         return BenchmarkMetrics(
@@ -169,8 +294,14 @@ class MetricsCalculator:
         Returns:
             Series of rolling annualized volatility
         """
-        rolling_std = returns.rolling(window=window_days).std()
-        rolling_vol = rolling_std * np.sqrt(trading_days) * 100
+        rolling_std = kernels.rolling_std(
+            returns.to_numpy(dtype=np.float64), window_days
+        )
+        rolling_vol = pd.Series(
+            rolling_std * np.sqrt(trading_days) * 100,
+            index=returns.index,
+            name=returns.name,
+        )
         return rolling_vol
 
     @staticmethod
@@ -180,6 +311,8 @@ class MetricsCalculator:
         """
         Calculate rolling beta over time
 
+        Each row uses the `window_days` returns before it.
+
         Args:
             stock_returns: Series of stock returns
             benchmark_returns: Series of benchmark returns
@@ -193,33 +326,282 @@ class MetricsCalculator:
         )
         aligned_data.columns = ["Stock", "Benchmark"]
 
-        rolling_beta = []
-        rolling_corr = []
-
-        for i in range(len(aligned_data)):
-            if i < window_days:
-                rolling_beta.append(np.nan)
-                rolling_corr.append(np.nan)
-            else:
-                window = aligned_data.iloc[i - window_days : i]
-                covariance = window["Stock"].cov(window["Benchmark"])
-                benchmark_variance = window["Benchmark"].var()
-
-                if benchmark_variance != 0:
-                    beta = covariance / benchmark_variance
-                    corr = window["Stock"].corr(window["Benchmark"])
-                else:
-                    beta = np.nan
-                    corr = np.nan
-
-                rolling_beta.append(beta)
-                rolling_corr.append(corr)
+        rolling_beta, rolling_corr = kernels.rolling_beta(
+            aligned_data["Stock"].to_numpy(dtype=np.float64),
+            aligned_data["Benchmark"].to_numpy(dtype=np.float64),
+            window_days,
+        )
 
+        # Kernels return windows ending at each row; shift to the prior window
         result = pd.DataFrame(
             {"Rolling_Beta": rolling_beta, "Rolling_Correlation": rolling_corr},
             index=aligned_data.index,
-        )
+        ).shift(1)
 
         result["Rolling_R2"] = result["Rolling_Correlation"] ** 2
 
         return result[["Rolling_Beta", "Rolling_R2"]]
+
+    @staticmethod
+    def calculate_rolling_volatility_panel(
+        returns_panel: pd.DataFrame,
+        window_days: int = 30,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ) -> pd.DataFrame:
+        """
+        Rolling annualized volatility of every ticker in a returns panel
+
+        Args:
+            returns_panel: DataFrame of returns, one column per ticker
+            window_days: Rolling window in periods
+            trading_days: Periods per year for annualization
+
+        Returns:
+            Date x ticker rolling annualized volatility (%)
+        """
+        rolling_std = kernels.rolling_std(
+            returns_panel.to_numpy(dtype=np.float64), window_days
+        )
+        return pd.DataFrame(
+            rolling_std * np.sqrt(trading_days) * 100,
+            index=returns_panel.index,
+            columns=returns_panel.columns,
+        )
+
+    @staticmethod
+    def calculate_rolling_beta_panel(
+        returns_panel: pd.DataFrame,
+        benchmark_returns: pd.Series,
+        window_days: int = 60,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Rolling beta and R-squared of every ticker against one benchmark
+
+        Args:
+            returns_panel: DataFrame of returns, one column per ticker
+            benchmark_returns: Series of benchmark returns
+            window_days: Rolling window in periods
+
+        Returns:
+            Dictionary of date x ticker panels 'Rolling_Beta' and
+            'Rolling_R2', each row using the `window_days` returns before it
+        """
+        benchmark = benchmark_returns.reindex(returns_panel.index)
+        rolling_beta, rolling_corr = kernels.rolling_beta(
+            returns_panel.to_numpy(dtype=np.float64),
+            benchmark.to_numpy(dtype=np.float64),
+            window_days,
+        )
+
+        def panel(values):
+            return pd.DataFrame(
+                values, index=returns_panel.index, columns=returns_panel.columns
+            ).shift(1)
+
+        return {
+            "Rolling_Beta": panel(rolling_beta),
+            "Rolling_R2": panel(rolling_corr**2),
+        }
+
+    @staticmethod
+    def calculate_bootstrap_intervals(
+        aligned_data: pd.DataFrame,
+        n_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+        confidence: float = DEFAULT_BOOTSTRAP_CONFIDENCE,
+        block_size: Optional[int] = None,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+        rng: Optional[np.random.Generator] = None,
+    ) -> BootstrapIntervals:
+        """
+        Moving-block bootstrap confidence intervals for beta, R-squared and
+        annualized volatility
+
+        Resamples are drawn as a (resamples x observations) index array built
+        from random block starts, and all statistics are reduced along the
+        observation axis in one vectorized step per memory-bounded batch.
+
+        Args:
+            aligned_data: DataFrame with aligned 'Stock' and 'Benchmark' returns
+            n_resamples: Number of bootstrap resamples
+            confidence: Two-sided confidence level
+            block_size: Block length (defaults to n ** (1/3)), preserving
+                short-range autocorrelation and volatility clustering
+            trading_days: Return periods in a year
+            rng: Seeded numpy Generator for reproducible intervals
+
+        Returns:
+            BootstrapIntervals object
+        """
+        rng = rng or np.random.default_rng()
+        stock = aligned_data["Stock"].to_numpy(dtype=np.float64)
+        benchmark = aligned_data["Benchmark"].to_numpy(dtype=np.float64)
+        n = len(stock)
+        if n < 3:
+            raise ValueError("Bootstrap needs at least 3 aligned observations")
+
+        block_size = block_size or max(1, int(round(n ** (1 / 3))))
+        block_size = min(block_size, n)
+        n_blocks = -(-n // block_size)
+        offsets = np.arange(block_size)
+
+        # Two float64 resample arrays plus the int64 index array per row
+        row_bytes = n * 8 * 3
+        batch_rows = max(1, int(BOOTSTRAP_MAX_BATCH_MB * 1024 * 1024 // row_bytes))
+
+        betas, r_squared, variances = [], [], []
+        for batch_start in range(0, n_resamples, batch_rows):
+            rows = min(batch_rows, n_resamples - batch_start)
+            starts = rng.integers(0, n - block_size + 1, size=(rows, n_blocks))
+            idx = (starts[:, :, None] + offsets).reshape(rows, -1)[:, :n]
+
+            x = benchmark[idx]
+            y = stock[idx]
+            x -= x.mean(axis=1, keepdims=True)
+            y -= y.mean(axis=1, keepdims=True)
+
+            sxx = np.einsum("ij,ij->i", x, x)
+            syy = np.einsum("ij,ij->i", y, y)
+            sxy = np.einsum("ij,ij->i", x, y)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                betas.append(np.where(sxx > 0, sxy / sxx, np.nan))
+                r_squared.append(np.where(sxx * syy > 0, sxy**2 / (sxx * syy), np.nan))
+            variances.append(syy / (n - 1))
+
+        tail = (1 - confidence) / 2 * 100
+        percentiles = [tail, 100 - tail]
+
+        def interval(samples):
+            low, high = np.nanpercentile(np.concatenate(samples), percentiles)
+            return float(low), float(high)
+
+        volatility_samples = [np.sqrt(v * trading_days) * 100 for v in variances]
+
+        return BootstrapIntervals(
+            confidence=confidence,
+            n_resamples=n_resamples,
+            block_size=block_size,
+            beta=interval(betas),
+            r_squared=interval(r_squared),
+            volatility_annual=interval(volatility_samples),
+        )
+
+    @staticmethod
+    def calculate_factor_regression(
+        stock_returns: pd.Series,
+        factor_returns: pd.DataFrame,
+        window_days: int = 60,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ) -> Optional[FactorRegressionResult]:
+        """
+        Regress stock returns on one or more factors (e.g. market, sector)
+
+        Args:
+            stock_returns: Series of stock returns
+            factor_returns: DataFrame of factor returns, one column per factor
+            window_days: Rolling window for the time-varying fit
+            trading_days: Periods per year for annualization
+
+        Returns:
+            FactorRegressionResult with alpha, betas, t-stats, R-squared and
+            residual volatility, or None without enough observations
+        """
+        return FactorRegressionCalculator.calculate_factor_regression(
+            stock_returns, factor_returns, window_days, trading_days
+        )
+
+    @staticmethod
+    def calculate_factor_panels(
+        returns_panel: pd.DataFrame,
+        factor_returns: pd.DataFrame,
+        window_days: int = 60,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Rolling factor regressions of every ticker in a returns panel
+
+        Args:
+            returns_panel: DataFrame of returns, one column per ticker
+            factor_returns: DataFrame of factor returns, one column per factor
+            window_days: Rolling window in periods
+            trading_days: Periods per year for annualization
+
+        Returns:
+            Dictionary of date x ticker panels ('Alpha_Annual',
+            'Beta_<factor>', 'R_Squared', 'Residual_Volatility')
+        """
+        return FactorRegressionCalculator.regression_panels(
+            returns_panel, factor_returns, window_days, trading_days
+        )
+
+    @staticmethod
+    def calculate_drawdown(
+        returns: pd.Series, window_days: int = TRADING_DAYS_PER_YEAR
+    ) -> Optional[DrawdownMetrics]:
+        """
+        Drawdown analysis of a return series
+
+        Args:
+            returns: Series of returns
+            window_days: Rolling max drawdown window in periods
+
+        Returns:
+            DrawdownMetrics with max and current drawdown, peak, trough and
+            recovery dates, durations and the rolling max drawdown, or None
+            without returns
+        """
+        return DrawdownCalculator.calculate_drawdown(returns, window_days)
+
+    @staticmethod
+    def calculate_drawdown_panel(
+        returns_panel: pd.DataFrame, window_days: int = TRADING_DAYS_PER_YEAR
+    ) -> pd.DataFrame:
+        """
+        Rolling max drawdown of every ticker in a returns panel
+
+        Args:
+            returns_panel: DataFrame of returns, one column per ticker
+            window_days: Rolling window in periods
+
+        Returns:
+            Date x ticker rolling max drawdown (positive %)
+        """
+        return DrawdownCalculator.rolling_drawdown_panel(returns_panel, window_days)
+
+    @staticmethod
+    def calculate_volatility_regime(
+        rolling_volatility: pd.Series, window_days: int = TRADING_DAYS_PER_YEAR
+    ) -> Optional[VolatilityRegime]:
+        """
+        Classify current volatility against its trailing distribution
+
+        Args:
+            rolling_volatility: Rolling annualized volatility (%)
+            window_days: Trailing history in periods
+
+        Returns:
+            VolatilityRegime with label, percentile and median, or None
+            before a full window of history is available
+        """
+        return OrderStatisticsCalculator.calculate_volatility_regime(
+            rolling_volatility, window_days
+        )
+
+    @staticmethod
+    def calculate_volatility_percentile_panel(
+        rolling_volatility: pd.DataFrame, window_days: int = TRADING_DAYS_PER_YEAR
+    ) -> pd.DataFrame:
+        """
+        Trailing percentile rank (0-100) of every ticker's rolling volatility
+
+        Args:
+            rolling_volatility: DataFrame of rolling volatility, one column
+                per ticker
+            window_days: Trailing history in periods
+
+        Returns:
+            Date x ticker percentile ranks
+        """
+        return OrderStatisticsCalculator.rolling_percentile_rank_panel(
+            rolling_volatility, window_days
+        )
@@ -0,0 +1,360 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 19:46:18
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 19:46:18
+# @ Description: Rolling quantiles and percentile ranks from Fenwick trees
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    TRADING_DAYS_PER_YEAR,
+    VOLATILITY_REGIME_BANDS,
+    VOLATILITY_REGIME_QUANTILES,
+)
+from volatility_analyzer.data_models import VolatilityRegime
+
+
+class _FenwickPanel:
+    """
+    One Fenwick (binary indexed) tree of value counts per series.
+
+    Values of each series are replaced by their 1-based rank in that
+    series' sorted values, so every tree covers ranks 1..n. Updates and
+    queries touch O(log n) nodes and are applied to all series at once
+    with NumPy fancy indexing.
+    """
+
+    def __init__(self, n_series: int, size: int):
+        self.size = size
+        self.levels = max(size.bit_length(), 1)
+        # Trees are interleaved in one flat array (node-major), so walks
+        # that visit the same node in many series read adjacent memory.
+        # Node 0 stays empty for prefix queries and node size + 1 absorbs
+        # updates that walk past the end
+        self.stride = n_series
+        self.tree = np.zeros((size + 2) * n_series, dtype=np.int64)
+        self.base = np.arange(n_series, dtype=np.int64)
+
+    def add(self, ranks: np.ndarray, delta: np.ndarray):
+        """Add delta (0 to skip a series) at each series' rank"""
+        position = ranks
+        for _ in range(self.levels):
+            slot = np.where(position <= self.size, position, self.size + 1)
+            self.tree[slot * self.stride + self.base] += delta
+            position = position + (position & -position)
+
+    def count_le(self, ranks: np.ndarray) -> np.ndarray:
+        """Number of values with rank <= ranks, shaped (..., series)"""
+        position = ranks
+        total = np.zeros(ranks.shape, dtype=np.int64)
+        for _ in range(self.levels):
+            total += self.tree[position * self.stride + self.base]
+            position = position & (position - 1)
+        return total
+
+    def kth(self, k: np.ndarray) -> np.ndarray:
+        """Rank of the k-th smallest value (1-based k), shaped (..., series)"""
+        position = np.zeros(k.shape, dtype=np.int64)
+        remaining = k.astype(np.int64)
+        step = 1 << (self.levels - 1)
+        while step:
+            candidate = position + step
+            counts = self.tree[
+                np.minimum(candidate, self.size + 1) * self.stride + self.base
+            ]
+            take = (candidate <= self.size) & (counts < remaining)
+            position = np.where(take, candidate, position)
+            remaining = np.where(take, remaining - counts, remaining)
+            step >>= 1
+        # Past the last value when fewer than k values are stored
+        return np.minimum(position + 1, self.size)
+
+
+class _SortedWindow:
+    """
+    Sorted list of the values in one series' window.
+
+    Positions are found by binary search; inserts and deletes shift the
+    list with a C-level memmove, which for windows of a few thousand
+    values is far cheaper than per-step NumPy calls on a single series.
+    """
+
+    def __init__(self):
+        self.values: List[float] = []
+
+    def add(self, value: float):
+        insort(self.values, value)
+
+    def remove(self, value: float):
+        del self.values[bisect_left(self.values, value)]
+
+    def percentile_rank(self, value: float) -> float:
+        below = bisect_left(self.values, value)
+        ties = bisect_right(self.values, value) - below
+        return (below + (ties + 1) / 2) / len(self.values)
+
+    def quantile(self, level: float) -> float:
+        h = (len(self.values) - 1) * level
+        low = int(np.floor(h))
+        high = int(np.ceil(h))
+        low_value = self.values[low]
+        return low_value + (h - low) * (self.values[high] - low_value)
+
+
+class OrderStatisticsCalculator:
+    """
+    Rolling order statistics (quantiles, median, percentile rank).
+
+    The window slides one bar at a time: the entering value is added to
+    and the leaving value removed from a Fenwick tree of value counts, and
+    quantiles and ranks are read back with O(log n) tree walks. The time
+    loop is shared by every series of a panel, so a 2000-ticker panel
+    costs one pass of a few vectorized operations per date. A single
+    series uses a sorted window with binary search instead, as per-step
+    NumPy calls would dominate its cost.
+    """
+
+    @staticmethod
+    def rolling_order_statistics(
+        values,
+        window: int,
+        quantiles: Iterable[float] = (0.5,),
+        min_periods: Optional[int] = None,
+        percentile_rank: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Rolling quantiles and percentile rank of every series
+
+        Args:
+            values: (dates,) or (dates x series) values, NaN allowed
+            window: Window length in bars (ending at each date)
+            quantiles: Quantile levels in [0, 1], linearly interpolated as
+                in pandas
+            min_periods: Valid values needed for a result (default: window)
+            percentile_rank: Also rank the current value in its window
+
+        Returns:
+            Dictionary of arrays over (dates [x series]): 'count',
+            'percentile_rank' (average rank of the current value / count,
+            as pandas rolling().rank(pct=True); NaN when not requested) and
+            'quantiles' with a trailing axis per quantile level
+        """
+        x = np.asarray(values, dtype=np.float64)
+        levels = np.asarray(list(quantiles), dtype=np.float64)
+        min_periods = window if min_periods is None else max(min_periods, 1)
+        if x.ndim == 1:
+            return OrderStatisticsCalculator._rolling_single(
+                x, window, levels, min_periods, percentile_rank
+            )
+        n_dates, n_series = x.shape
+
+        # Ordinal ranks per series plus the first/last rank of tied values
+        valid = ~np.isnan(x)
+        order = np.argsort(x, axis=0, kind="stable")
+        ordered = np.take_along_axis(x, order, axis=0)
+        positions = np.arange(1, n_dates + 1)[:, None]
+        new_value = np.ones(x.shape, dtype=bool)
+        new_value[1:] = ordered[1:] != ordered[:-1]
+        first = np.maximum.accumulate(np.where(new_value, positions, 0), axis=0)
+        last_value = np.ones(x.shape, dtype=bool)
+        last_value[:-1] = new_value[1:]
+        last = np.minimum.accumulate(
+            np.where(last_value, positions, n_dates + 1)[::-1], axis=0
+        )[::-1]
+
+        rank = np.empty(x.shape, dtype=np.int64)
+        tie_first = np.empty(x.shape, dtype=np.int64)
+        tie_last = np.empty(x.shape, dtype=np.int64)
+        np.put_along_axis(rank, order, np.broadcast_to(positions, x.shape), axis=0)
+        np.put_along_axis(tie_first, order, first, axis=0)
+        np.put_along_axis(tie_last, order, last, axis=0)
+
+        tree = _FenwickPanel(n_series, n_dates)
+        count = np.zeros(n_series, dtype=np.int64)
+        columns = np.arange(n_series)
+        result = {
+            "count": np.zeros(x.shape),
+            "percentile_rank": np.full(x.shape, np.nan),
+            "quantiles": np.full(x.shape + (len(levels),), np.nan),
+        }
+
+        for t in range(n_dates):
+            entering = valid[t]
+            tree.add(rank[t], entering.astype(np.int64))
+            count += entering
+            if t >= window:
+                leaving = valid[t - window]
+                tree.add(rank[t - window], -leaving.astype(np.int64))
+                count -= leaving
+            result["count"][t] = count
+
+            ready = count >= min_periods
+            if not ready.any():
+                continue
+            safe_count = np.maximum(count, 1)
+
+            if percentile_rank:
+                below, below_or_tied = tree.count_le(
+                    np.stack([tie_first[t] - 1, tie_last[t]])
+                )
+                percentile = (below + (below_or_tied - below + 1) / 2) / safe_count
+                result["percentile_rank"][t] = np.where(
+                    ready & entering, percentile, np.nan
+                )
+
+            if len(levels):
+                # Pandas' linear interpolation between the order statistics
+                # around h = (count - 1) * level, for all levels in one walk
+                h = (safe_count - 1) * levels[:, None]
+                low = np.floor(h).astype(np.int64)
+                high = np.ceil(h).astype(np.int64)
+                bounds = tree.kth(np.concatenate([low, high]) + 1) - 1
+                values = ordered[bounds, columns]
+                low_value, high_value = values[: len(levels)], values[len(levels) :]
+                quantile = low_value + (h - low) * (high_value - low_value)
+                result["quantiles"][t] = np.where(ready, quantile, np.nan).T
+
+        return result
+
+    @staticmethod
+    def _rolling_single(
+        x: np.ndarray,
+        window: int,
+        levels: np.ndarray,
+        min_periods: int,
+        percentile_rank: bool,
+    ) -> Dict[str, np.ndarray]:
+        """rolling_order_statistics() of one series with a sorted window"""
+        n_dates = len(x)
+        result = {
+            "count": np.zeros(n_dates),
+            "percentile_rank": np.full(n_dates, np.nan),
+            "quantiles": np.full((n_dates, len(levels)), np.nan),
+        }
+        sorted_window = _SortedWindow()
+        values = x.tolist()
+        valid = ~np.isnan(x)
+
+        for t in range(n_dates):
+            if valid[t]:
+                sorted_window.add(values[t])
+            if t >= window and valid[t - window]:
+                sorted_window.remove(values[t - window])
+            count = len(sorted_window.values)
+            result["count"][t] = count
+
+            if count < min_periods:
+                continue
+            if percentile_rank and valid[t]:
+                result["percentile_rank"][t] = sorted_window.percentile_rank(values[t])
+            for i, level in enumerate(levels):
+                result["quantiles"][t, i] = sorted_window.quantile(level)
+
+        return result
+
+    @staticmethod
+    def rolling_quantile_panel(
+        panel: pd.DataFrame,
+        window: int,
+        quantiles: Iterable[float] = (0.5,),
+        min_periods: Optional[int] = None,
+    ) -> Dict[float, pd.DataFrame]:
+        """
+        Rolling quantiles of every column of a panel
+
+        Args:
+            panel: Date x ticker values (e.g. rolling volatility)
+            window: Window length in bars
+            quantiles: Quantile levels in [0, 1]
+            min_periods: Valid values needed for a result (default: window)
+
+        Returns:
+            Dictionary of quantile level to date x ticker DataFrame
+        """
+        quantiles = list(quantiles)
+        stats = OrderStatisticsCalculator.rolling_order_statistics(
+            panel.to_numpy(dtype=np.float64),
+            window,
+            quantiles,
+            min_periods,
+            percentile_rank=False,
+        )
+        return {
+            level: pd.DataFrame(
+                stats["quantiles"][..., i], index=panel.index, columns=panel.columns
+            )
+            for i, level in enumerate(quantiles)
+        }
+
+    @staticmethod
+    def rolling_percentile_rank_panel(
+        panel: pd.DataFrame, window: int, min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Percentile rank (0-100) of each value within its trailing window
+
+        Args:
+            panel: Date x ticker values (e.g. rolling volatility)
+            window: Window length in bars
+            min_periods: Valid values needed for a result (default: window)
+
+        Returns:
+            Date x ticker percentile ranks
+        """
+        stats = OrderStatisticsCalculator.rolling_order_statistics(
+            panel.to_numpy(dtype=np.float64), window, (), min_periods
+        )
+        return pd.DataFrame(
+            stats["percentile_rank"] * 100, index=panel.index, columns=panel.columns
+        )
+
+    @staticmethod
+    def regime_label(percentile: float) -> str:
+        """Regime name of a volatility percentile (0-100)"""
+        for upper, label in VOLATILITY_REGIME_BANDS:
+            if percentile <= upper:
+                return label
+        return VOLATILITY_REGIME_BANDS[-1][1]
+
+    @staticmethod
+    def calculate_volatility_regime(
+        rolling_volatility: pd.Series, window: int = TRADING_DAYS_PER_YEAR
+    ) -> Optional[VolatilityRegime]:
+        """
+        Current rolling volatility against its own trailing distribution
+
+        Args:
+            rolling_volatility: Rolling annualized volatility (%)
+            window: Trailing window of the distribution in bars
+
+        Returns:
+            VolatilityRegime, or None before a full window is available
+        """
+        rolling_volatility = rolling_volatility.dropna()
+        low, high = VOLATILITY_REGIME_QUANTILES
+        stats = OrderStatisticsCalculator.rolling_order_statistics(
+            rolling_volatility.to_numpy(dtype=np.float64), window, (low, 0.5, high)
+        )
+        if len(rolling_volatility) == 0 or np.isnan(stats["percentile_rank"][-1]):
+            return None
+
+        percentile = float(stats["percentile_rank"][-1] * 100)
+        quantiles = stats["quantiles"][-1]
+        return VolatilityRegime(
+            label=OrderStatisticsCalculator.regime_label(percentile),
+            current_volatility=float(rolling_volatility.iloc[-1]),
+            percentile=percentile,
+            median=float(quantiles[1]),
+            low_band=float(quantiles[0]),
+            high_band=float(quantiles[2]),
+            window=window,
+            rolling_percentile=pd.Series(
+                stats["percentile_rank"] * 100, index=rolling_volatility.index
+            ),
+        )
@@ -0,0 +1,347 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 21:52:18
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 21:52:18
+# @ Description: Universe-scale metrics as lazy Polars queries (needs polars)
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    TRADING_DAYS_PER_YEAR,
+    POLARS_STREAMING,
+)
+from volatility_analyzer.kernels import _ZERO_VARIANCE_TOLERANCE
+
+
+def _import_polars():
+    """Import polars, explaining how to install it when missing"""
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError(
+            "The polars backend requires polars (pip install polars)"
+        ) from e
+    return pl
+
+
+class PolarsMetricsCalculator:
+    """
+    Volatility and beta of a whole universe as lazy Polars queries.
+
+    Prices are one long (Date, Ticker, Close) table and every metric is an
+    expression over it grouped or windowed by ticker, so a universe is a
+    single query plan that Polars runs on all cores and, when scanned from
+    Parquet, streams in batches instead of materializing per-ticker
+    frames. Results match MetricsCalculator on the same prices.
+    """
+
+    @staticmethod
+    def price_table(closes: Dict[str, pd.Series]):
+        """
+        Long price table from close series
+
+        Args:
+            closes: Close prices keyed by ticker
+
+        Returns:
+            Polars DataFrame with columns Date, Ticker and Close
+        """
+        pl = _import_polars()
+        return pl.concat(
+            [
+                pl.DataFrame(
+                    {
+                        "Date": series.index,
+                        "Ticker": ticker,
+                        "Close": series.to_numpy(dtype=np.float64),
+                    }
+                )
+                for ticker, series in closes.items()
+            ]
+        )
+
+    @staticmethod
+    def scan_prices(source):
+        """
+        Lazy view of a long (Date, Ticker, Close) price table
+
+        Args:
+            source: Parquet file path or glob, Polars DataFrame or LazyFrame
+
+        Returns:
+            Polars LazyFrame
+        """
+        pl = _import_polars()
+        if isinstance(source, pl.LazyFrame):
+            return source
+        if isinstance(source, pl.DataFrame):
+            return source.lazy()
+        return pl.scan_parquet(source)
+
+    @staticmethod
+    def pairs(ticker_items: Iterable[Tuple[str, str]]):
+        """
+        Lazy (Ticker, Benchmark_Ticker) table of the pairs to analyze
+
+        Args:
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+
+        Returns:
+            Polars LazyFrame of unique pairs
+        """
+        pl = _import_polars()
+        ticker_items = list(ticker_items)
+        tickers, benchmarks = zip(*ticker_items) if ticker_items else ((), ())
+        return (
+            pl.DataFrame(
+                {"Ticker": list(tickers), "Benchmark_Ticker": list(benchmarks)},
+                schema={"Ticker": pl.String, "Benchmark_Ticker": pl.String},
+            )
+            .lazy()
+            .unique()
+        )
+
+    @staticmethod
+    def returns(prices):
+        """
+        Per-bar returns of every ticker
+
+        Mirrors MetricsCalculator.calculate_returns: duplicate dates keep
+        their first close and a missing close voids the returns on both
+        sides of it.
+
+        Args:
+            prices: Long price table or anything scan_prices() accepts
+
+        Returns:
+            LazyFrame with columns Date, Ticker and Return, sorted by
+            ticker and date
+        """
+        pl = _import_polars()
+        return (
+            PolarsMetricsCalculator.scan_prices(prices)
+            .select(
+                "Date", "Ticker", pl.col("Close").cast(pl.Float64).fill_nan(None)
+            )
+            .unique(subset=["Ticker", "Date"], keep="first", maintain_order=True)
+            .sort("Ticker", "Date", maintain_order=True)
+            .with_columns(Return=pl.col("Close").pct_change().over("Ticker"))
+            .drop_nulls("Return")
+            .select("Date", "Ticker", "Return")
+        )
+
+    @staticmethod
+    def aligned_returns(returns, pairs):
+        """
+        Stock returns next to their benchmark's returns on shared dates
+
+        Args:
+            returns: LazyFrame from returns()
+            pairs: LazyFrame from pairs()
+
+        Returns:
+            LazyFrame with columns Date, Ticker, Benchmark_Ticker, Stock and
+            Benchmark, sorted by pair and date
+        """
+        benchmark = returns.rename(
+            {"Ticker": "Benchmark_Ticker", "Return": "Benchmark"}
+        ).join(pairs.select("Benchmark_Ticker"), on="Benchmark_Ticker", how="semi")
+        # Joining the pairs first (left) keeps the optimizer from reordering
+        # the joins into a date-only join of every stock with every ticker
+        return (
+            returns.rename({"Return": "Stock"})
+            .join(pairs, on="Ticker", how="left")
+            .join(benchmark, on=["Benchmark_Ticker", "Date"], how="inner")
+            .sort("Ticker", "Benchmark_Ticker", "Date")
+        )
+
+    @staticmethod
+    def rolling_volatility(
+        returns,
+        window_days: int = 30,
+        trading_days: int = TRADING_DAYS_PER_YEAR,
+    ):
+        """
+        Rolling annualized volatility of every ticker
+
+        Args:
+            returns: LazyFrame from returns()
+            window_days: Rolling window in periods
+            trading_days: Periods per year for annualization
+
+        Returns:
+            LazyFrame with columns Date, Ticker and Rolling_Volatility (%)
+        """
+        pl = _import_polars()
+        rolling_std = pl.col("Return").rolling_std(window_days).over("Ticker")
+        return returns.select(
+            "Date",
+            "Ticker",
+            (rolling_std * np.sqrt(trading_days) * 100)
+            .fill_null(np.nan)
+            .alias("Rolling_Volatility"),
+        )
+
+    @staticmethod
+    def rolling_beta(aligned, window_days: int = 60):
+        """
+        Rolling beta and R-squared of every pair
+
+        Window sums of returns centered on each pair's mean give the
+        covariances, as in kernels.rolling_beta; each row uses the
+        `window_days` returns before it.
+
+        Args:
+            aligned: LazyFrame from aligned_returns()
+            window_days: Rolling window in periods
+
+        Returns:
+            LazyFrame with columns Date, Ticker, Benchmark_Ticker,
+            Rolling_Beta and Rolling_R2
+        """
+        pl = _import_polars()
+        pair = ["Ticker", "Benchmark_Ticker"]
+        col = pl.col
+
+        def window_sum(expr):
+            return expr.rolling_sum(window_days).over(pair)
+
+        sums = aligned.with_columns(
+            dx=col("Benchmark") - col("Benchmark").mean().over(pair),
+            dy=col("Stock") - col("Stock").mean().over(pair),
+        ).with_columns(
+            sx=window_sum(col("dx")),
+            sy=window_sum(col("dy")),
+            sxx=window_sum(col("dx") * col("dx")),
+            syy=window_sum(col("dy") * col("dy")),
+            sxy=window_sum(col("dx") * col("dy")),
+        )
+        moments = sums.with_columns(
+            var_x=col("sxx") - col("sx") * col("sx") / window_days,
+            var_y=col("syy") - col("sy") * col("sy") / window_days,
+            cov=col("sxy") - col("sx") * col("sy") / window_days,
+        )
+
+        usable = col("var_x") > _ZERO_VARIANCE_TOLERANCE * col("sxx")
+        product = col("var_x") * col("var_y")
+        beta = pl.when(usable).then(col("cov") / col("var_x")).otherwise(np.nan)
+        correlation = (
+            pl.when(usable & (product > 0))
+            .then(col("cov") / product.sqrt())
+            .otherwise(np.nan)
+        )
+        def prior_window(expr):
+            return expr.shift(1).over(pair).fill_null(np.nan)
+
+        return moments.select(
+            "Date",
+            *pair,
+            prior_window(beta).alias("Rolling_Beta"),
+            prior_window(correlation**2).alias("Rolling_R2"),
+        )
+
+    @staticmethod
+    def summary(returns, pairs, trading_days: int = TRADING_DAYS_PER_YEAR):
+        """
+        Full-period comparison metrics of every pair
+
+        Volatilities and mean returns use each ticker's own returns; beta
+        and R-squared use the dates shared with the benchmark, as in
+        MetricsCalculator.calculate_beta.
+
+        Args:
+            returns: LazyFrame from returns()
+            pairs: LazyFrame from pairs()
+            trading_days: Periods per year for annualization
+
+        Returns:
+            LazyFrame with one row per pair and the result record columns
+            Ticker, Benchmark_Ticker, Stock_Volatility_Annual,
+            Benchmark_Volatility_Annual, Beta, R_Squared, Volatility_Ratio,
+            Data_Points, Stock_Returns_Mean and Benchmark_Returns_Mean
+        """
+        pl = _import_polars()
+        col = pl.col
+
+        per_ticker = returns.group_by("Ticker").agg(
+            Volatility_Annual=col("Return").std() * np.sqrt(trading_days) * 100,
+            Returns_Mean=col("Return").mean() * 100,
+        )
+
+        def prefixed(prefix, ticker_column):
+            return per_ticker.rename(
+                {
+                    "Ticker": ticker_column,
+                    "Volatility_Annual": f"{prefix}_Volatility_Annual",
+                    "Returns_Mean": f"{prefix}_Returns_Mean",
+                }
+            )
+
+        pair = ["Ticker", "Benchmark_Ticker"]
+        fit = (
+            PolarsMetricsCalculator.aligned_returns(returns, pairs)
+            .group_by(pair)
+            .agg(
+                covariance=pl.cov("Stock", "Benchmark"),
+                variance=col("Benchmark").var(),
+                correlation=pl.corr("Stock", "Benchmark"),
+                Data_Points=pl.len(),
+            )
+            .with_columns(
+                Beta=pl.when(col("variance") != 0)
+                .then(col("covariance") / col("variance"))
+                .otherwise(np.nan)
+                .fill_null(np.nan)
+            )
+        )
+
+        return (
+            pairs.join(fit, on=pair, how="left")
+            .join(prefixed("Stock", "Ticker"), on="Ticker", how="left")
+            .join(
+                prefixed("Benchmark", "Benchmark_Ticker"),
+                on="Benchmark_Ticker",
+                how="left",
+            )
+            .with_columns(
+                R_Squared=pl.when(col("Beta").is_nan())
+                .then(np.nan)
+                .otherwise(col("correlation") ** 2),
+                Volatility_Ratio=col("Stock_Volatility_Annual")
+                / col("Benchmark_Volatility_Annual"),
+                Data_Points=col("Data_Points").fill_null(0),
+            )
+            .select(
+                *pair,
+                "Stock_Volatility_Annual",
+                "Benchmark_Volatility_Annual",
+                "Beta",
+                "R_Squared",
+                "Volatility_Ratio",
+                "Data_Points",
+                "Stock_Returns_Mean",
+                "Benchmark_Returns_Mean",
+            )
+            .with_columns(pl.selectors.float().fill_null(np.nan))
+            .sort(pair)
+        )
+
+    @staticmethod
+    def collect(query, streaming: bool = POLARS_STREAMING):
+        """
+        Run a lazy query
+
+        Args:
+            query: Polars LazyFrame
+            streaming: Run with the streaming engine, which processes the
+                input in batches instead of loading it whole
+
+        Returns:
+            Polars DataFrame
+        """
+        return query.collect(engine="streaming" if streaming else "auto")
@@ -0,0 +1,316 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 10:02:11
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 10:02:11
+# @ Description: Incremental writers for streaming analysis results to disk
+"""
+
+import csv
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from volatility_analyzer.config import DEFAULT_PARQUET_ROW_GROUP_SIZE
+from volatility_analyzer.data_models import column_dtype
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SUPPORTED_FORMATS = ("jsonl", "csv", "parquet", "arrow")
+
+_SUFFIX_TO_FORMAT = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+
+class ResultWriter:
+    """
+    Base class for writers that append one result row at a time.
+
+    The columns are fixed when the writer is created (or by the first row
+    when none are given), so rows lacking some of them are written with
+    empty values; a row with a column outside them raises ValueError
+    instead of losing the column.
+    """
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None):
+        """
+        Initialize result writer
+
+        Args:
+            path: Output file path
+            columns: Every column rows may hold, e.g. record_columns()
+                (default: the columns of the first row)
+        """
+        self.path = path
+        self.columns: Optional[List[str]] = list(columns) if columns else None
+        self.rows_written = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, row: Dict):
+        """Write a single result row"""
+        if self.columns is None:
+            self.columns = list(row)
+        elif not row.keys() <= set(self.columns):
+            extra = [column for column in row if column not in self.columns]
+            raise ValueError(f"Row has columns the output does not hold: {extra}")
+        self._write_row(row)
+        self.rows_written += 1
+
+    def _write_row(self, row: Dict):
+        raise NotImplementedError
+
+    def close(self):
+        """Flush and close the underlying file"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """Writes one JSON object per line, flushed after every row"""
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None):
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write_row(self, row: Dict):
+        self._file.write(json.dumps(row, default=str) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """Writes CSV rows under a header of the writer's columns"""
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None):
+        super().__init__(path, columns)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write_row(self, row: Dict):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns)
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def _import_pyarrow(purpose: str):
+    """Import pyarrow, explaining which output needs it when missing"""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(f"{purpose} requires pyarrow (pip install pyarrow)") from e
+    return pa
+
+
+def _arrow_schema(pa, columns: Sequence[str]):
+    """Nullable Arrow schema of result columns, typed as records_to_frame()"""
+    types = {"string": pa.string(), "int64": pa.int64(), "float64": pa.float64()}
+    return pa.schema(
+        [pa.field(column, types[column_dtype(column)]) for column in columns]
+    )
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    Writes Parquet row groups of a bounded size.
+
+    Rows are buffered until `row_group_size` is reached, so memory stays
+    constant while the file grows one row group at a time. Every row group
+    has the same explicit schema, whatever values its rows happen to hold.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = DEFAULT_PARQUET_ROW_GROUP_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(path, columns)
+        self._pa = _import_pyarrow("Parquet output")
+        import pyarrow.parquet as pq
+
+        self._pq = pq
+        self.row_group_size = row_group_size
+        self._buffer: List[Dict] = []
+        self._schema = None
+        self._writer = None
+
+    def _write_row(self, row: Dict):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush_buffer()
+
+    def _table(self):
+        """Buffered rows as a table of the writer's schema"""
+        if self._schema is None:
+            self._schema = _arrow_schema(self._pa, self.columns)
+        return self._pa.Table.from_pylist(self._buffer, schema=self._schema)
+
+    def _flush_buffer(self):
+        if not self._buffer:
+            return
+
+        table = self._table()
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self):
+        self._flush_buffer()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowResultWriter(ParquetResultWriter):
+    """Writes an Arrow IPC (Feather v2) file one record batch at a time"""
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = DEFAULT_PARQUET_ROW_GROUP_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        ResultWriter.__init__(self, path, columns)
+        self._pa = _import_pyarrow("Arrow output")
+        self.row_group_size = row_group_size
+        self._buffer: List[Dict] = []
+        self._schema = None
+        self._writer = None
+
+    def _flush_buffer(self):
+        if not self._buffer:
+            return
+
+        table = self._table()
+        if self._writer is None:
+            self._writer = self._pa.ipc.new_file(self.path, table.schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+
+def infer_format(path: str) -> str:
+    """
+    Infer output format from a file extension
+
+    Args:
+        path: Output file path
+
+    Returns:
+        One of SUPPORTED_FORMATS
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in _SUFFIX_TO_FORMAT:
+        raise ValueError(
+            f"Cannot infer output format from '{path}', "
+            f"use one of {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return _SUFFIX_TO_FORMAT[suffix]
+
+
+def create_result_writer(
+    path: str, fmt: Optional[str] = None, columns: Optional[Sequence[str]] = None
+) -> ResultWriter:
+    """
+    Create a result writer for the given path
+
+    Args:
+        path: Output file path
+        fmt: Output format (inferred from the extension when None)
+        columns: Every column rows may hold, e.g. from
+            VolatilityAnalyzer.record_columns() (default: the first row's)
+
+    Returns:
+        ResultWriter instance
+    """
+    fmt = (fmt or infer_format(path)).lower()
+
+    if fmt == "jsonl":
+        return JsonlResultWriter(path, columns)
+    if fmt == "csv":
+        return CsvResultWriter(path, columns)
+    if fmt == "parquet":
+        return ParquetResultWriter(path, columns=columns)
+    if fmt == "arrow":
+        return ArrowResultWriter(path, columns=columns)
+
+    raise ValueError(
+        f"Unsupported output format '{fmt}', use one of {', '.join(SUPPORTED_FORMATS)}"
+    )
+
+
+def write_table(df: pd.DataFrame, path: str, fmt: Optional[str] = None):
+    """
+    Write a complete results table, keeping column dtypes
+
+    Args:
+        df: Typed results DataFrame
+        path: Output file path
+        fmt: Output format (inferred from the extension when None)
+    """
+    fmt = (fmt or infer_format(path)).lower()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    if fmt == "parquet":
+        _import_pyarrow("Parquet output")
+        df.to_parquet(path, index=False)
+    elif fmt == "arrow":
+        _import_pyarrow("Arrow output")
+        df.reset_index(drop=True).to_feather(path)
+    elif fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "jsonl":
+        df.to_json(path, orient="records", lines=True)
+    else:
+        raise ValueError(
+            f"Unsupported output format '{fmt}', "
+            f"use one of {', '.join(SUPPORTED_FORMATS)}"
+        )
+
+
+def read_table(path: str, fmt: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a results file written by a result writer or write_table
+
+    Args:
+        path: Results file path
+        fmt: File format (inferred from the extension when None)
+
+    Returns:
+        Results DataFrame
+    """
+    fmt = (fmt or infer_format(path)).lower()
+
+    if fmt == "parquet":
+        return pd.read_parquet(path)
+    if fmt == "arrow":
+        return pd.read_feather(path)
+    if fmt == "csv":
+        return pd.read_csv(path)
+    return pd.read_json(path, lines=True)
@@ -0,0 +1,288 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 23:02:41
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 23:02:41
+# @ Description: Categorized results table with sorted indexes for fast screens
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.config import (
+    VOLATILITY_THRESHOLDS,
+    BETA_THRESHOLDS,
+    VOLATILITY_TOP_CATEGORY,
+    BETA_TOP_CATEGORY,
+)
+from volatility_analyzer.result_writers import read_table
+
+# Record column -> (upper thresholds, category above the last, category column)
+CATEGORY_SCHEMES = {
+    "Stock_Volatility_Annual": (
+        VOLATILITY_THRESHOLDS,
+        VOLATILITY_TOP_CATEGORY,
+        "Volatility_Category",
+    ),
+    "Beta": (BETA_THRESHOLDS, BETA_TOP_CATEGORY, "Beta_Category"),
+}
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+def _sorted_thresholds(
+    thresholds: Dict[str, float], top_category: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Ascending bounds and the len(bounds) + 1 category labels they split"""
+    names = list(thresholds)
+    bounds = np.array([thresholds[name] for name in names], dtype=np.float64)
+    order = np.argsort(bounds, kind="stable")
+    labels = np.array([names[i] for i in order] + [top_category], dtype=object)
+    return bounds[order], labels
+
+
+def categorize(
+    values, thresholds: Dict[str, float], top_category: str
+) -> np.ndarray:
+    """
+    Category of every value in one vectorized step
+
+    A value falls in the first category whose threshold exceeds it, so
+    with thresholds {"low": 15, "moderate": 25} 15 is "moderate" and 25
+    is the top category.
+
+    Args:
+        values: Values to categorize
+        thresholds: Upper bound (exclusive) of every category
+        top_category: Category of values at or above every threshold
+
+    Returns:
+        Object array of category labels, None for NaN
+    """
+    bounds, labels = _sorted_thresholds(thresholds, top_category)
+    values = np.asarray(values, dtype=np.float64)
+    categories = labels[np.searchsorted(bounds, values, side="right")]
+    categories[np.isnan(values)] = None
+    return categories
+
+
+def category_range(
+    category: str, thresholds: Dict[str, float], top_category: str
+) -> Range:
+    """
+    Value range [low, high) of one category
+
+    Args:
+        category: Category label
+        thresholds: Upper bound (exclusive) of every category
+        top_category: Category of values at or above every threshold
+
+    Returns:
+        Tuple of (low, high); None for an open end
+    """
+    bounds, labels = _sorted_thresholds(thresholds, top_category)
+    matches = np.flatnonzero(labels == category)
+    if not len(matches):
+        raise ValueError(
+            f"Unknown category '{category}', use one of {', '.join(labels)}"
+        )
+    position = int(matches[0])
+    low = float(bounds[position - 1]) if position > 0 else None
+    high = float(bounds[position]) if position < len(bounds) else None
+    return low, high
+
+
+class _SortedColumn:
+    """One numeric column with its non-missing values in sorted order"""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        valid = np.flatnonzero(~np.isnan(values))
+        self.order = valid[np.argsort(values[valid], kind="stable")]
+        self.sorted = values[self.order]
+
+    def _span(self, low: Optional[float], high: Optional[float]) -> slice:
+        """Positions in sorted order of the values in [low, high)"""
+        start = 0 if low is None else np.searchsorted(self.sorted, low, "left")
+        end = len(self.sorted)
+        if high is not None:
+            end = np.searchsorted(self.sorted, high, "left")
+        return slice(int(start), int(max(start, end)))
+
+    def count(self, ranges: List[Range]) -> int:
+        spans = [self._span(*r) for r in ranges]
+        return sum(span.stop - span.start for span in spans)
+
+    def rows(self, ranges: List[Range]) -> np.ndarray:
+        return np.concatenate(
+            [self.order[self._span(*r)] for r in ranges] or [self.order[:0]]
+        )
+
+    def contains(self, rows: np.ndarray, ranges: List[Range]) -> np.ndarray:
+        """Mask of the given rows whose value lies in any of the ranges"""
+        values = self.values[rows]
+        keep = np.zeros(len(rows), dtype=bool)
+        for low, high in ranges:
+            inside = np.ones(len(rows), dtype=bool)
+            if low is not None:
+                inside &= values >= low
+            if high is not None:
+                inside &= values < high
+            keep |= inside
+        return keep
+
+
+class ScreeningIndex:
+    """
+    Results table prepared for many interactive screens.
+
+    Volatility and beta categories from VOLATILITY_THRESHOLDS and
+    BETA_THRESHOLDS are assigned to every row at once. Each numeric column
+    queried is sorted once (on first use); a range or category condition
+    is then two binary searches into it. A screen takes the rows of its
+    most selective condition and checks the others on those rows only,
+    so repeated screens cost O(log n) plus the size of that candidate set
+    instead of a scan of the whole table.
+    """
+
+    def __init__(self, results: pd.DataFrame):
+        """
+        Initialize index
+
+        Args:
+            results: Typed results table (e.g. from records_to_frame() or
+                read_table()); category columns are added to a copy
+        """
+        self.table = results.reset_index(drop=True).copy()
+        for column, (thresholds, top, category_column) in CATEGORY_SCHEMES.items():
+            if column in self.table:
+                self.table[category_column] = categorize(
+                    self.table[column], thresholds, top
+                )
+        self._columns: Dict[str, _SortedColumn] = {}
+
+    @classmethod
+    def from_file(cls, path: str, fmt: Optional[str] = None) -> "ScreeningIndex":
+        """Index of a results table written by screen, shard merge or watch"""
+        return cls(read_table(path, fmt))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _column(self, column: str) -> _SortedColumn:
+        if column not in self._columns:
+            if column not in self.table:
+                raise KeyError(f"No column '{column}' in the results table")
+            values = pd.to_numeric(self.table[column], errors="coerce")
+            self._columns[column] = _SortedColumn(
+                values.to_numpy(dtype=np.float64)
+            )
+        return self._columns[column]
+
+    def _conditions(
+        self,
+        volatility: Union[str, Iterable[str], None],
+        beta: Union[str, Iterable[str], None],
+        ranges: Dict[str, Range],
+    ) -> Dict[str, List[Range]]:
+        """Every condition as value ranges [low, high) per column"""
+        conditions = {column: [bounds] for column, bounds in ranges.items()}
+        for column, categories in (
+            ("Stock_Volatility_Annual", volatility),
+            ("Beta", beta),
+        ):
+            if categories is None:
+                continue
+            if isinstance(categories, str):
+                categories = [categories]
+            thresholds, top, _ = CATEGORY_SCHEMES[column]
+            category_ranges = [category_range(c, thresholds, top) for c in categories]
+            if column in conditions:
+                # A column with both a range and categories must satisfy both
+                low, high = conditions[column][0]
+                category_ranges = [
+                    _intersect((low, high), r) for r in category_ranges
+                ]
+            conditions[column] = category_ranges
+        return conditions
+
+    def rows(
+        self,
+        volatility: Union[str, Iterable[str], None] = None,
+        beta: Union[str, Iterable[str], None] = None,
+        **ranges: Range,
+    ) -> np.ndarray:
+        """
+        Row positions matching every condition
+
+        Args:
+            volatility: Volatility category or categories (e.g. "high")
+            beta: Beta category or categories (e.g. "defensive")
+            **ranges: Column name -> (low, high) range, low inclusive and
+                high exclusive, None for an open end; e.g. R_Squared=(0.5,
+                None)
+
+        Returns:
+            Sorted array of matching row positions in `table`
+        """
+        conditions = self._conditions(volatility, beta, ranges)
+        if not conditions:
+            return np.arange(len(self.table))
+
+        # Start from the most selective condition, found by binary search
+        counts = {
+            column: self._column(column).count(column_ranges)
+            for column, column_ranges in conditions.items()
+        }
+        first = min(counts, key=counts.get)
+        candidates = self._column(first).rows(conditions.pop(first))
+
+        for column, column_ranges in conditions.items():
+            if not len(candidates):
+                break
+            keep = self._column(column).contains(candidates, column_ranges)
+            candidates = candidates[keep]
+
+        return np.sort(candidates)
+
+    def screen(
+        self,
+        volatility: Union[str, Iterable[str], None] = None,
+        beta: Union[str, Iterable[str], None] = None,
+        sort_by: Optional[str] = None,
+        ascending: bool = False,
+        **ranges: Range,
+    ) -> pd.DataFrame:
+        """
+        Rows matching every condition
+
+        Args:
+            volatility: Volatility category or categories (e.g. "high")
+            beta: Beta category or categories (e.g. "defensive")
+            sort_by: Column to sort the matches by (table order when None)
+            ascending: Sort direction
+            **ranges: Column name -> (low, high) range, low inclusive and
+                high exclusive, None for an open end
+
+        Returns:
+            Matching rows of the categorized table
+        """
+        matches = self.table.iloc[self.rows(volatility, beta, **ranges)]
+        if sort_by is not None:
+            matches = matches.sort_values(sort_by, ascending=ascending)
+        return matches
+
+    def category_counts(self) -> pd.DataFrame:
+        """Number of rows in every volatility x beta category pair"""
+        return pd.crosstab(
+            self.table["Volatility_Category"], self.table["Beta_Category"]
+        )
+
+
+def _intersect(first: Range, second: Range) -> Range:
+    """Intersection of two [low, high) ranges (may be empty)"""
+    lows = [v for v in (first[0], second[0]) if v is not None]
+    highs = [v for v in (first[1], second[1]) if v is not None]
+    return (max(lows) if lows else None, min(highs) if highs else None)
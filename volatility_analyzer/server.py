@@ -0,0 +1,336 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 11:20:05
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 11:20:05
+# @ Description: Long-running HTTP analysis service with a warm in-memory cache
+"""
+
+import json
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from volatility_analyzer.caching import LRUByteCache, SingleFlight
+from volatility_analyzer.config import (
+    DEFAULT_SERVER_MEMORY_BUDGET_MB,
+    DEFAULT_SCREEN_WORKERS,
+)
+from volatility_analyzer.data_models import AnalysisReport
+from volatility_analyzer.logging_config import get_logger
+from volatility_analyzer.volatility_analyzer import VolatilityAnalyzer
+
+logger = get_logger(__name__)
+
+# (start, end) analysis window a request works on
+Window = Tuple[datetime, datetime]
+
+
+def _clean_float(value: Any) -> Any:
+    """Map NaN/inf to None so payloads stay valid JSON"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class AnalysisService:
+    """
+    Keeps price data, benchmark returns and reports warm between requests.
+
+    Every cached item is loaded through a single-flight gate, so identical
+    concurrent requests share one computation, and stored in one LRU cache
+    bounded by a memory budget.
+    """
+
+    def __init__(
+        self,
+        analyzer: VolatilityAnalyzer,
+        memory_budget_mb: int = DEFAULT_SERVER_MEMORY_BUDGET_MB,
+        max_workers: int = DEFAULT_SCREEN_WORKERS,
+        roll_dates: bool = True,
+    ):
+        """
+        Initialize analysis service
+
+        Args:
+            analyzer: Analyzer used to fetch data and build reports
+            memory_budget_mb: Memory budget of the warm cache in MB
+            max_workers: Concurrent analyses for batch comparisons
+            roll_dates: Whether to move the analysis window forward each day
+        """
+        self.analyzer = analyzer
+        self.cache = LRUByteCache(memory_budget_mb * 1024 * 1024)
+        self.single_flight = SingleFlight()
+        self.roll_dates = roll_dates
+        self._window_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self):
+        """Release worker threads"""
+        self._executor.shutdown(wait=False)
+
+    def _window(self) -> Window:
+        """
+        Current analysis window, rolled forward once the day changes
+
+        A request takes this snapshot once and passes it to every loader,
+        so its cache keys and its data always describe the same window,
+        even when another request rolls the window meanwhile.
+        """
+        with self._window_lock:
+            analyzer = self.analyzer
+            if self.roll_dates and analyzer.end_date.date() < datetime.now().date():
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=365 * analyzer.years_of_data)
+                analyzer.set_date_range(start_date, end_date)
+            return analyzer.start_date, analyzer.end_date
+
+    @staticmethod
+    def _window_key(window: Window) -> Tuple[str, str]:
+        return str(window[0].date()), str(window[1].date())
+
+    def _cached(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Serve a key from cache or load it once across concurrent callers"""
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        def load():
+            if key in self.cache:
+                return self.cache.get(key)
+            loaded = loader()
+            self.cache.put(key, loaded)
+            return loaded
+
+        return self.single_flight.do(key, load)
+
+    def _stock_data(self, ticker: str, window: Window) -> Tuple[str, pd.DataFrame]:
+        """Cached (name, price data) for a stock"""
+        fetcher = self.analyzer.data_fetcher
+
+        def load():
+            data = fetcher.fetch_stock_data(ticker, *window)
+            return fetcher.get_stock_name(ticker), data
+
+        return self._cached(("prices", ticker) + self._window_key(window), load)
+
+    def _benchmark_returns(
+        self, benchmark_ticker: str, window: Window
+    ) -> Tuple[str, str, pd.Series]:
+        """Cached (actual ticker, name, returns) for a benchmark"""
+        fetcher = self.analyzer.data_fetcher
+
+        def load():
+            data, actual = fetcher.fetch_benchmark_data(benchmark_ticker, *window)
+            returns = self.analyzer.metrics_calculator.calculate_returns(data)
+            return actual, fetcher.get_stock_name(actual), returns
+
+        key = ("benchmark", benchmark_ticker) + self._window_key(window)
+        return self._cached(key, load)
+
+    def get_report(
+        self, ticker: str, benchmark_ticker: str, window: Optional[Window] = None
+    ) -> AnalysisReport:
+        """
+        Get a (cached) analysis report
+
+        Args:
+            ticker: Stock ticker symbol
+            benchmark_ticker: Benchmark ticker symbol
+            window: Analysis window of the request (default: the current one)
+
+        Returns:
+            AnalysisReport object
+        """
+        window = window or self._window()
+
+        def load():
+            stock_name, stock_data = self._stock_data(ticker, window)
+            actual, benchmark_name, benchmark_returns = self._benchmark_returns(
+                benchmark_ticker, window
+            )
+            stock_returns = self.analyzer.metrics_calculator.calculate_returns(
+                stock_data
+            )
+            return self.analyzer.build_report(
+                ticker,
+                stock_name,
+                stock_returns,
+                actual,
+                benchmark_name,
+                benchmark_returns,
+                period=window,
+            )
+
+        key = ("report", ticker, benchmark_ticker) + self._window_key(window)
+        return self._cached(key, load)
+
+    def analyze(
+        self, ticker: str, benchmark_ticker: str, window: Optional[Window] = None
+    ) -> Dict:
+        """Summary metrics for one stock as a numeric record"""
+        report = self.get_report(ticker, benchmark_ticker, window)
+        return {k: _clean_float(v) for k, v in report.to_record().items()}
+
+    def rolling(self, ticker: str, benchmark_ticker: str) -> Dict:
+        """Rolling volatility, beta and R-squared series for one stock"""
+        window = self._window()
+
+        def load():
+            report = self.get_report(ticker, benchmark_ticker, window)
+            frame = pd.concat(
+                [report.rolling_volatility.rename("Rolling_Volatility"),
+                 report.rolling_metrics],
+                axis=1,
+            )
+            return {
+                "Ticker": ticker,
+                "Benchmark_Ticker": report.benchmark_metrics.ticker,
+                "Dates": [str(d.date()) for d in frame.index],
+                **{
+                    col: [_clean_float(float(v)) for v in frame[col]]
+                    for col in frame.columns
+                },
+            }
+
+        key = ("rolling", ticker, benchmark_ticker) + self._window_key(window)
+        return self._cached(key, load)
+
+    def compare(self, ticker_dict: Dict[str, str]) -> Dict:
+        """
+        Summary metrics for several stocks, sorted by volatility
+
+        Args:
+            ticker_dict: Dictionary mapping stock tickers to benchmark tickers
+
+        Returns:
+            Dictionary with result rows and per-ticker errors
+        """
+
+        # One window for the whole comparison
+        window = self._window()
+
+        def run(item):
+            ticker, benchmark = item
+            try:
+                return self.analyze(ticker, benchmark, window), None
+            except Exception as e:
+                return None, (ticker, str(e))
+
+        rows: List[Dict] = []
+        errors: Dict[str, str] = {}
+        for row, error in self._executor.map(run, ticker_dict.items()):
+            if row is not None:
+                rows.append(row)
+            else:
+                errors[error[0]] = error[1]
+
+        def volatility(row: Dict) -> float:
+            value = row["Stock_Volatility_Annual"]
+            return float("-inf") if value is None else value
+
+        rows.sort(key=volatility, reverse=True)
+        return {"results": rows, "errors": errors}
+
+    def stats(self) -> Dict:
+        """Cache and coalescing counters"""
+        return {
+            **self.cache.stats(),
+            "coalesced": self.single_flight.coalesced,
+            "price_cache": self.analyzer.data_fetcher.cache_stats(),
+        }
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over an AnalysisService"""
+
+    service: AnalysisService = None
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _ticker_params(self, query: Dict[str, List[str]]) -> Tuple[str, str]:
+        ticker = query.get("ticker", [None])[0]
+        benchmark = query.get("benchmark", [None])[0]
+        if not ticker or not benchmark:
+            raise ValueError("'ticker' and 'benchmark' query parameters are required")
+        return ticker, benchmark
+
+    def _handle(self, fn: Callable[[], Dict]):
+        try:
+            self._send_json(200, fn())
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            logger.warning(f"Request {self.path} failed: {e}")
+            self._send_json(500, {"error": str(e)})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif url.path == "/stats":
+            self._send_json(200, self.service.stats())
+        elif url.path == "/analyze":
+            self._handle(lambda: self.service.analyze(*self._ticker_params(query)))
+        elif url.path == "/rolling":
+            self._handle(lambda: self.service.rolling(*self._ticker_params(query)))
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/compare":
+            self._send_json(404, {"error": f"Unknown endpoint {url.path}"})
+            return
+
+        def compare():
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON body: {e}")
+            tickers = body.get("tickers")
+            if not isinstance(tickers, dict) or not tickers:
+                raise ValueError("Body must contain a 'tickers' ticker->benchmark map")
+            return self.service.compare(tickers)
+
+        self._handle(compare)
+
+
+def create_server(
+    service: AnalysisService, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) an HTTP server for the service
+
+    Args:
+        service: AnalysisService answering requests
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        ThreadingHTTPServer ready for serve_forever()
+    """
+    handler = type("BoundAnalysisRequestHandler", (AnalysisRequestHandler,), {})
+    handler.service = service
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,486 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 16:05:12
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 16:05:12
+# @ Description: Deterministic sharding of batch analyses across processes and nodes
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import socket
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from volatility_analyzer.config import (
+    DEFAULT_INTERVAL,
+    DEFAULT_NUM_SHARDS,
+    DEFAULT_SHARD_FORMAT,
+    DEFAULT_SCREEN_WORKERS,
+    SHARD_LEASE_SECONDS,
+)
+from volatility_analyzer.batch_journal import BatchJournal
+from volatility_analyzer.logging_config import get_logger
+from volatility_analyzer.result_writers import (
+    SUPPORTED_FORMATS,
+    create_result_writer,
+    read_table,
+)
+from volatility_analyzer.volatility_analyzer import VolatilityAnalyzer
+
+logger = get_logger(__name__)
+
+_MANIFEST = "manifest.json"
+
+
+def shard_for_ticker(ticker: str, num_shards: int) -> int:
+    """
+    Shard index of a ticker
+
+    Uses a content hash rather than hash(), so every process and node
+    assigns a ticker to the same shard regardless of PYTHONHASHSEED.
+
+    Args:
+        ticker: Stock ticker symbol
+        num_shards: Total number of shards
+
+    Returns:
+        Shard index in [0, num_shards)
+    """
+    digest = hashlib.md5(ticker.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process of this host is still running"""
+    if os.name == "nt":
+        return True  # os.kill would terminate it; rely on the lease instead
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def filter_shard(
+    ticker_items: Iterable[Tuple[str, str]], shard_index: int, num_shards: int
+) -> Iterator[Tuple[str, str]]:
+    """Lazily keep the (ticker, benchmark) pairs that belong to a shard"""
+    for ticker, benchmark in ticker_items:
+        if shard_for_ticker(ticker, num_shards) == shard_index:
+            yield ticker, benchmark
+
+
+class ShardCoordinator:
+    """
+    Coordinates shard runs through a shared output directory.
+
+    Every node or process points at the same directory (a local disk or a
+    shared filesystem). A shard is claimed by exclusively creating its lock
+    file, written to a temporary file and renamed into place, then marked
+    done. The owner touches the lock after every result, so the lease
+    measures inactivity rather than runtime; a lock of a process of this
+    host that is no longer running is stale at once. Each shard keeps a batch
+    journal, so a shard whose worker died is resumed rather than recomputed
+    once its lease expires. No coordinator process is needed: the
+    filesystem is the only shared state.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        num_shards: int = DEFAULT_NUM_SHARDS,
+        fmt: str = DEFAULT_SHARD_FORMAT,
+        lease_seconds: float = SHARD_LEASE_SECONDS,
+    ):
+        """
+        Initialize shard coordinator
+
+        Args:
+            output_dir: Shared directory holding shard outputs and markers
+            num_shards: Total number of shards
+            fmt: Output format of each shard (one of SUPPORTED_FORMATS)
+            lease_seconds: Seconds without progress after which an unfinished
+                claim may be taken over
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported shard format '{fmt}', "
+                f"use one of {', '.join(SUPPORTED_FORMATS)}"
+            )
+
+        self.output_dir = output_dir
+        self.num_shards = num_shards
+        self.fmt = fmt
+        self.lease_seconds = lease_seconds
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._check_manifest()
+
+    def _check_manifest(self):
+        """Record the layout once and refuse to mix incompatible runs"""
+        path = os.path.join(self.output_dir, _MANIFEST)
+        manifest = {"num_shards": self.num_shards, "format": self.fmt}
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            with open(path, "r", encoding="utf-8") as f:
+                existing = json.load(f)
+            if existing != manifest:
+                raise ValueError(
+                    f"{self.output_dir} was created with {existing}, not {manifest}"
+                )
+            return
+
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    def _shard_name(self, shard_index: int) -> str:
+        return f"shard-{shard_index:05d}-of-{self.num_shards:05d}"
+
+    def shard_path(self, shard_index: int) -> str:
+        """Output file of a shard"""
+        return os.path.join(
+            self.output_dir, f"{self._shard_name(shard_index)}.{self.fmt}"
+        )
+
+    def _marker(self, shard_index: int, suffix: str) -> str:
+        name = f"{self._shard_name(shard_index)}.{suffix}"
+        return os.path.join(self.output_dir, name)
+
+    def is_done(self, shard_index: int) -> bool:
+        """Whether a shard's output is complete"""
+        return os.path.exists(self._marker(shard_index, "done"))
+
+    def pending_shards(self) -> List[int]:
+        """Shards without a completed output"""
+        return [i for i in range(self.num_shards) if not self.is_done(i)]
+
+    def _lock_is_stale(self, lock_path: str, mtime: float) -> bool:
+        """Whether a lock's lease expired or its local owner has exited"""
+        if time.time() - mtime >= self.lease_seconds:
+            return True
+        try:
+            with open(lock_path, "r", encoding="utf-8") as f:
+                owner = json.load(f)
+        except (OSError, ValueError):
+            return False  # Gone, or still being written by its owner
+        if owner.get("host") != socket.gethostname():
+            return False
+        pid = owner.get("pid")
+        return isinstance(pid, int) and not _pid_alive(pid)
+
+    def _break_lock(self, lock_path: str, lock: os.stat_result) -> bool:
+        """
+        Remove a lock judged stale, unless it was renewed or replaced since
+
+        Only the process that exclusively creates the takeover sentinel of
+        this lock generation (inode and mtime) may remove it, and it checks
+        the lock again first. A lock its owner renewed, or that another
+        process took over meanwhile, is left alone.
+
+        Returns:
+            True if the lock is gone and may be claimed
+        """
+        generation = f"{lock.st_ino}-{lock.st_mtime_ns}"
+        sentinel = f"{lock_path}.takeover-{generation}"
+        try:
+            fd = os.open(sentinel, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            # A takeover that crashed midway must not block the shard forever
+            try:
+                if time.time() - os.path.getmtime(sentinel) >= self.lease_seconds:
+                    os.remove(sentinel)
+            except FileNotFoundError:
+                pass
+            return False
+        os.close(fd)
+
+        try:
+            try:
+                current = os.stat(lock_path)
+            except FileNotFoundError:
+                return True  # Claimed with O_EXCL, like any unclaimed shard
+            if f"{current.st_ino}-{current.st_mtime_ns}" != generation:
+                return False
+            os.remove(lock_path)
+            return True
+        finally:
+            os.remove(sentinel)
+
+    def claim(self, shard_index: int) -> bool:
+        """
+        Try to take ownership of a shard
+
+        Args:
+            shard_index: Shard to claim
+
+        Returns:
+            True if this process now owns the shard
+        """
+        if self.is_done(shard_index):
+            return False
+
+        lock_path = self._marker(shard_index, "lock")
+        try:
+            lock = os.stat(lock_path)
+        except FileNotFoundError:
+            lock = None
+
+        if lock is not None:
+            if not self._lock_is_stale(lock_path, lock.st_mtime):
+                return False
+            if not self._break_lock(lock_path, lock):
+                return False
+            logger.warning(f"Taking over stale claim on shard {shard_index}")
+
+        try:
+            fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"host": socket.gethostname(), "pid": os.getpid()}, f)
+        return True
+
+    def _renew_claim(self, shard_index: int):
+        """Refresh the lock's mtime so a running shard's lease does not expire"""
+        try:
+            os.utime(self._marker(shard_index, "lock"))
+        except FileNotFoundError:
+            pass
+
+    def _mark_done(self, shard_index: int, stats: Dict):
+        done_path = self._marker(shard_index, "done")
+        tmp_path = f"{done_path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, done_path)
+
+        try:
+            os.remove(self._marker(shard_index, "lock"))
+        except FileNotFoundError:
+            pass
+
+    def run_shard(
+        self,
+        analyzer: VolatilityAnalyzer,
+        ticker_items: Iterable[Tuple[str, str]],
+        shard_index: int,
+        max_workers: int = DEFAULT_SCREEN_WORKERS,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> Dict:
+        """
+        Analyze the tickers of one shard and write its output
+
+        The caller should hold the claim on the shard, which is renewed
+        after every result. `ticker_items` may be the whole universe; pairs
+        of other shards are skipped lazily.
+
+        Args:
+            analyzer: Analyzer running the analyses
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            shard_index: Shard to run
+            max_workers: Concurrent analyses within the shard
+            interval: Bar interval passed to analyze_stock
+
+        Returns:
+            Dictionary with succeeded/failed counts and the output path
+        """
+        if not 0 <= shard_index < self.num_shards:
+            raise ValueError(f"Shard index must be in [0, {self.num_shards})")
+
+        self._renew_claim(shard_index)
+        journal = BatchJournal(self._marker(shard_index, "journal"))
+        output_path = self.shard_path(shard_index)
+        tmp_path = f"{output_path}.tmp-{os.getpid()}"
+
+        stats = {"shard": shard_index, "succeeded": 0, "failed": 0}
+        start = time.perf_counter()
+        with create_result_writer(
+            tmp_path, self.fmt, columns=analyzer.record_columns()
+        ) as writer:
+            for result in analyzer.iter_stock_results(
+                filter_shard(ticker_items, shard_index, self.num_shards),
+                max_workers=max_workers,
+                journal=journal,
+                interval=interval,
+            ):
+                if result.ok:
+                    writer.write(result.to_row())
+                    stats["succeeded"] += 1
+                else:
+                    logger.warning(f"Error analyzing {result.ticker}: {result.error}")
+                    stats["failed"] += 1
+                self._renew_claim(shard_index)
+
+        if stats["succeeded"]:
+            os.replace(tmp_path, output_path)
+        else:
+            # Writers create no file (Parquet) or a header-less one for no rows
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            output_path = None
+
+        stats["output"] = output_path
+        stats["seconds"] = round(time.perf_counter() - start, 3)
+        self._mark_done(shard_index, stats)
+        logger.info(
+            f"Shard {shard_index}: {stats['succeeded']} ok, {stats['failed']} failed"
+        )
+        return stats
+
+    def run_available(
+        self,
+        analyzer: VolatilityAnalyzer,
+        ticker_items_factory: Callable[[], Iterable[Tuple[str, str]]],
+        shard_indices: Optional[Iterable[int]] = None,
+        max_workers: int = DEFAULT_SCREEN_WORKERS,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> List[Dict]:
+        """
+        Claim and run shards until none is left unclaimed
+
+        Args:
+            analyzer: Analyzer running the analyses
+            ticker_items_factory: Returns a fresh iterable of ticker pairs,
+                called once per shard so inputs can be streamed from disk
+            shard_indices: Shards to consider (defaults to all)
+            max_workers: Concurrent analyses within a shard
+            interval: Bar interval passed to analyze_stock
+
+        Returns:
+            Stats of the shards run by this process
+        """
+        shard_indices = (
+            range(self.num_shards) if shard_indices is None else shard_indices
+        )
+        completed = []
+        for shard_index in shard_indices:
+            if not self.claim(shard_index):
+                continue
+            completed.append(
+                self.run_shard(
+                    analyzer,
+                    ticker_items_factory(),
+                    shard_index,
+                    max_workers=max_workers,
+                    interval=interval,
+                )
+            )
+        return completed
+
+    def merge(self, allow_partial: bool = False) -> pd.DataFrame:
+        """
+        Assemble the result rows of all shards
+
+        Args:
+            allow_partial: Merge completed shards even if some are pending
+
+        Returns:
+            DataFrame with one row per successfully analyzed ticker
+        """
+        pending = self.pending_shards()
+        if pending and not allow_partial:
+            raise RuntimeError(
+                f"{len(pending)} of {self.num_shards} shards are not complete: "
+                f"{pending[:10]}"
+            )
+
+        frames = []
+        for shard_index in range(self.num_shards):
+            path = self.shard_path(shard_index)
+            if self.is_done(shard_index) and os.path.exists(path):
+                frames.append(read_table(path, self.fmt))
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def merge_comparison(self, allow_partial: bool = False) -> Optional[pd.DataFrame]:
+        """Comparison table over all shards, sorted by volatility"""
+        rows = self.merge(allow_partial=allow_partial)
+        if rows.empty:
+            return None
+        return VolatilityAnalyzer.build_comparison_table(rows.to_dict("records"))
+
+
+def _local_shard_worker(
+    output_dir: str,
+    num_shards: int,
+    fmt: str,
+    ticker_items: List[Tuple[str, str]],
+    analyzer_factory: Callable[[], VolatilityAnalyzer],
+    max_workers: int,
+    interval: str,
+) -> List[Dict]:
+    coordinator = ShardCoordinator(output_dir, num_shards, fmt)
+    return coordinator.run_available(
+        analyzer_factory(),
+        lambda: ticker_items,
+        max_workers=max_workers,
+        interval=interval,
+    )
+
+
+def run_shards_locally(
+    ticker_items: Iterable[Tuple[str, str]],
+    output_dir: str,
+    num_shards: int = DEFAULT_NUM_SHARDS,
+    processes: int = 2,
+    fmt: str = DEFAULT_SHARD_FORMAT,
+    analyzer_factory: Callable[[], VolatilityAnalyzer] = VolatilityAnalyzer,
+    max_workers: int = 1,
+    interval: str = DEFAULT_INTERVAL,
+) -> List[Dict]:
+    """
+    Run every shard with several local processes
+
+    Each process behaves like an independent node: it claims shards from
+    `output_dir` until none are left. Merge the outputs afterwards with
+    ShardCoordinator.merge or merge_comparison.
+
+    Args:
+        ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+        output_dir: Directory for shard outputs and markers
+        num_shards: Total number of shards
+        processes: Number of worker processes
+        fmt: Output format of each shard
+        analyzer_factory: Picklable callable creating each process's analyzer
+        max_workers: Concurrent analyses within a shard
+        interval: Bar interval passed to analyze_stock
+
+    Returns:
+        Stats of the shards run by all processes
+    """
+    # Checks the manifest before any worker starts
+    ShardCoordinator(output_dir, num_shards, fmt)
+    ticker_items = list(ticker_items)
+    args = (
+        output_dir,
+        num_shards,
+        fmt,
+        ticker_items,
+        analyzer_factory,
+        max_workers,
+        interval,
+    )
+
+    if processes <= 1:
+        return _local_shard_worker(*args)
+
+    completed = []
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        for stats in pool.starmap(_local_shard_worker, [args] * processes):
+            logger.info(f"Worker ran shards {[s['shard'] for s in stats]}")
+            completed.extend(stats)
+    return completed
@@ -0,0 +1,207 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 16:48:37
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 16:48:37
+# @ Description: Returns panel published once in shared memory for worker processes
+"""
+
+import os
+import sys
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from volatility_analyzer.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PanelSpec:
+    """Picklable handle that lets a worker attach to a published panel"""
+
+    n_dates: int
+    tickers: Tuple[str, ...]
+    benchmarks: Tuple[str, ...]
+    shm_name: Optional[str] = None  # Shared memory block name
+    path: Optional[str] = None  # Memory-mapped file path
+    tz: Optional[str] = None  # Time zone of the dates
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the backing block in bytes"""
+        return 8 * self.n_dates * (1 + len(self.tickers) + len(self.benchmarks))
+
+
+class SharedReturnsPanel:
+    """
+    Date-aligned stock and benchmark returns in one shared block.
+
+    The block holds the dates (int64 ns), then one contiguous float64 row
+    of returns per stock and per benchmark, NaN where a series has no
+    observation. The publishing process creates the block once; workers
+    attach by name (shared memory) or path (memory-mapped file) and read
+    NumPy views of it, so nothing is copied or pickled per worker and
+    memory stays flat as workers are added.
+    """
+
+    def __init__(self, spec: PanelSpec, buffer, shm=None, owner: bool = False):
+        self.spec = spec
+        self._shm = shm
+        self._owner = owner
+
+        n_dates = spec.n_dates
+        n_stocks = len(spec.tickers)
+        flat = np.frombuffer(buffer, dtype=np.float64, count=spec.nbytes // 8)
+        self._dates = flat[:n_dates].view(np.int64)
+        self.stock_matrix = flat[n_dates : n_dates * (1 + n_stocks)].reshape(
+            n_stocks, n_dates
+        )
+        self.benchmark_matrix = flat[n_dates * (1 + n_stocks) :].reshape(
+            len(spec.benchmarks), n_dates
+        )
+        self._stock_rows = {t: i for i, t in enumerate(spec.tickers)}
+        self._benchmark_rows = {b: i for i, b in enumerate(spec.benchmarks)}
+        self._index = None
+
+    @classmethod
+    def create(
+        cls,
+        stock_returns: Dict[str, pd.Series],
+        benchmark_returns: Dict[str, pd.Series],
+        path: Optional[str] = None,
+    ) -> "SharedReturnsPanel":
+        """
+        Publish returns into a new shared block
+
+        Series are written one at a time into the block, so callers may
+        drop their own copies as soon as this returns.
+
+        Args:
+            stock_returns: Mapping of stock ticker to returns
+            benchmark_returns: Mapping of benchmark ticker to returns
+            path: Back the panel with a memory-mapped file instead of
+                shared memory (e.g. when /dev/shm is small)
+
+        Returns:
+            Owning SharedReturnsPanel; call unlink() when done
+        """
+        series = list(stock_returns.values()) + list(benchmark_returns.values())
+        if not series:
+            raise ValueError("No returns to publish")
+
+        index = series[0].index
+        for s in series[1:]:
+            index = index.union(s.index)
+
+        spec = PanelSpec(
+            n_dates=len(index),
+            tickers=tuple(stock_returns),
+            benchmarks=tuple(benchmark_returns),
+            tz=str(index.tz) if index.tz is not None else None,
+        )
+        if path is not None:
+            buffer = np.memmap(path, dtype=np.uint8, mode="w+", shape=(spec.nbytes,))
+            spec = replace(spec, path=path)
+            panel = cls(spec, buffer, owner=True)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(spec.nbytes, 1))
+            spec = replace(spec, shm_name=shm.name)
+            panel = cls(spec, shm.buf, shm=shm, owner=True)
+
+        panel._dates[:] = index.as_unit("ns").asi8
+        for row, s in zip(panel.stock_matrix, stock_returns.values()):
+            row[:] = s.reindex(index).to_numpy(dtype=np.float64)
+        for row, s in zip(panel.benchmark_matrix, benchmark_returns.values()):
+            row[:] = s.reindex(index).to_numpy(dtype=np.float64)
+
+        logger.info(
+            f"Published {len(spec.tickers)} x {spec.n_dates} returns panel "
+            f"({spec.nbytes / 1024 / 1024:.1f} MB)"
+        )
+        return panel
+
+    @classmethod
+    def attach(cls, spec: PanelSpec) -> "SharedReturnsPanel":
+        """
+        Attach to a published panel without copying it
+
+        Args:
+            spec: Handle returned by the publisher's `spec`
+
+        Returns:
+            Read-only SharedReturnsPanel view
+        """
+        if spec.path is not None:
+            buffer = np.memmap(
+                spec.path, dtype=np.uint8, mode="r", shape=(spec.nbytes,)
+            )
+            return cls(spec, buffer)
+
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=spec.shm_name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=spec.shm_name)
+        return cls(spec, shm.buf, shm=shm)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """Dates of the panel columns"""
+        if self._index is None:
+            index = pd.DatetimeIndex(self._dates.view("datetime64[ns]"))
+            if self.spec.tz is not None:
+                index = index.tz_localize("UTC").tz_convert(self.spec.tz)
+            self._index = index
+        return self._index
+
+    def _series(self, row: np.ndarray, name: str) -> pd.Series:
+        valid = ~np.isnan(row)
+        return pd.Series(row[valid], index=self.index[valid], name=name)
+
+    def stock_returns(self, ticker: str) -> pd.Series:
+        """Returns of one stock on the dates it traded"""
+        return self._series(self.stock_matrix[self._stock_rows[ticker]], ticker)
+
+    def benchmark_returns(self, benchmark_ticker: str) -> pd.Series:
+        """Returns of one benchmark on the dates it traded"""
+        row = self.benchmark_matrix[self._benchmark_rows[benchmark_ticker]]
+        return self._series(row, benchmark_ticker)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Date x ticker stock returns (a view, not a copy)"""
+        return pd.DataFrame(
+            self.stock_matrix.T,
+            index=self.index,
+            columns=list(self.spec.tickers),
+            copy=False,
+        )
+
+    def close(self):
+        """Detach this process's views (frames from to_frame() must be released)"""
+        self.stock_matrix = self.benchmark_matrix = self._dates = None
+        self._index = None
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Release the backing block (publisher only)"""
+        self.close()
+        if not self._owner:
+            return
+        if self._shm is not None:
+            self._shm.unlink()
+        elif self.spec.path is not None and os.path.exists(self.spec.path):
+            os.remove(self.spec.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
@@ -0,0 +1,301 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 23:24:37
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 23:24:37
+# @ Description: Date-partitioned store of daily metric snapshots (needs pyarrow)
+"""
+
+import os
+import uuid
+from datetime import date
+from typing import Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from volatility_analyzer.config import (
+    SNAPSHOT_AS_OF_BATCH_PARTITIONS,
+    SNAPSHOT_PARTITION_PREFIX,
+)
+from volatility_analyzer.result_writers import _import_pyarrow
+
+# Record columns kept in every snapshot
+SNAPSHOT_METRICS = (
+    "Stock_Volatility_Annual",
+    "Beta",
+    "R_Squared",
+    "Volatility_Ratio",
+)
+
+
+def _as_date(value) -> date:
+    return pd.Timestamp(value).date()
+
+
+class SnapshotStore:
+    """
+    Append-only history of the comparison metrics, one partition per day.
+
+    Every append writes a new Parquet file under `date=YYYY-MM-DD/` of its
+    snapshot date and never touches existing files, so concurrent runs
+    cannot corrupt each other. Within a date the latest write of a ticker
+    wins. compact() folds a partition's files into one file sorted by
+    ticker, whose row-group statistics let ticker filters skip data.
+
+    Queries list the partition directories, pick the dates they need by
+    name and read only those files, only the requested columns and only
+    the rows of the requested tickers.
+    """
+
+    def __init__(self, root: str):
+        """
+        Initialize store
+
+        Args:
+            root: Store directory (created on first append)
+        """
+        self.root = root
+        self._pa = _import_pyarrow("The snapshot store")
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        self._ds = ds
+        self._pq = pq
+
+    def _partition_path(self, snapshot_date: date) -> str:
+        return os.path.join(
+            self.root, f"{SNAPSHOT_PARTITION_PREFIX}{snapshot_date.isoformat()}"
+        )
+
+    def _files(self, snapshot_date: date) -> List[str]:
+        directory = self._partition_path(snapshot_date)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".parquet")
+        )
+
+    def partitions(self, start=None, end=None) -> List[date]:
+        """
+        Snapshot dates in the store
+
+        Args:
+            start: First date to include (None = earliest)
+            end: Last date to include (None = latest)
+
+        Returns:
+            Sorted list of dates
+        """
+        if not os.path.isdir(self.root):
+            return []
+        start = _as_date(start) if start is not None else date.min
+        end = _as_date(end) if end is not None else date.max
+
+        dates = []
+        for name in os.listdir(self.root):
+            if not name.startswith(SNAPSHOT_PARTITION_PREFIX):
+                continue
+            try:
+                snapshot_date = date.fromisoformat(
+                    name[len(SNAPSHOT_PARTITION_PREFIX):]
+                )
+            except ValueError:
+                continue
+            if start <= snapshot_date <= end:
+                dates.append(snapshot_date)
+        return sorted(dates)
+
+    def append(self, results: pd.DataFrame, snapshot_date=None) -> Optional[str]:
+        """
+        Add a snapshot of comparison results
+
+        Args:
+            results: Results table with a Ticker column and the
+                SNAPSHOT_METRICS columns (records_to_frame() of result
+                records or a comparison table)
+            snapshot_date: Date the metrics are as of (default: today)
+
+        Returns:
+            Path of the file written, None when there are no rows
+        """
+        if results.empty:
+            return None
+        snapshot_date = _as_date(
+            snapshot_date if snapshot_date is not None else date.today()
+        )
+
+        snapshot = pd.DataFrame(
+            {
+                "Ticker": results["Ticker"].astype(str).to_numpy(),
+                **{
+                    column: pd.to_numeric(results[column], errors="coerce")
+                    .astype("float64")
+                    .to_numpy()
+                    for column in SNAPSHOT_METRICS
+                },
+            }
+        )
+        written_at = pd.Timestamp.now(tz="UTC")
+        snapshot.insert(0, "Snapshot_Date", snapshot_date)
+        snapshot["Written_At"] = written_at
+        return self._write_partition_file(
+            snapshot.sort_values("Ticker", kind="stable"),
+            snapshot_date,
+            f"part-{written_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}",
+        )
+
+    def _write_partition_file(
+        self, snapshot: pd.DataFrame, snapshot_date: date, name: str
+    ) -> str:
+        """Write a partition file atomically (readers never see a partial file)"""
+        directory = self._partition_path(snapshot_date)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}.parquet")
+        tmp_path = os.path.join(directory, f".{name}.tmp-{os.getpid()}")
+        table = self._pa.Table.from_pandas(snapshot, preserve_index=False)
+        self._pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def compact(self, start=None, end=None) -> int:
+        """
+        Fold each partition's files into one file
+
+        Duplicate tickers keep their latest write. The merged file is in
+        place before the old files are removed, and readers drop the
+        duplicates of a half-finished compaction, so queries stay correct
+        throughout.
+
+        Args:
+            start: First date to compact (None = earliest)
+            end: Last date to compact (None = latest)
+
+        Returns:
+            Number of partitions compacted
+        """
+        compacted = 0
+        for snapshot_date in self.partitions(start, end):
+            files = self._files(snapshot_date)
+            if len(files) < 2:
+                continue
+            snapshot = self._latest(self._read(files))
+            self._write_partition_file(
+                snapshot.sort_values("Ticker", kind="stable"),
+                snapshot_date,
+                f"compacted-{pd.Timestamp.now(tz='UTC'):%Y%m%dT%H%M%S%f}",
+            )
+            for path in files:
+                os.remove(path)
+            compacted += 1
+        return compacted
+
+    def _read(
+        self,
+        files: Sequence[str],
+        tickers: Optional[Iterable[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Rows of the given files, only the requested tickers and columns"""
+        wanted = ["Snapshot_Date", "Ticker", *(columns or SNAPSHOT_METRICS)]
+        wanted.append("Written_At")
+        if not files:
+            return pd.DataFrame(columns=wanted)
+
+        dataset = self._ds.dataset(list(files), format="parquet")
+        row_filter = None
+        if tickers is not None:
+            row_filter = self._ds.field("Ticker").isin(list(tickers))
+        table = dataset.to_table(columns=wanted, filter=row_filter)
+        return table.to_pandas(date_as_object=False)
+
+    @staticmethod
+    def _latest(rows: pd.DataFrame) -> pd.DataFrame:
+        """Latest write of every (date, ticker)"""
+        return (
+            rows.sort_values("Written_At", kind="stable")
+            .drop_duplicates(["Snapshot_Date", "Ticker"], keep="last")
+            .reset_index(drop=True)
+        )
+
+    def history(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        start=None,
+        end=None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Metric history of some tickers
+
+        Args:
+            tickers: Tickers to read (None = all)
+            start: First snapshot date (None = earliest)
+            end: Last snapshot date (None = latest)
+            columns: Metric columns to read (default: SNAPSHOT_METRICS)
+
+        Returns:
+            DataFrame with Snapshot_Date, Ticker and the metric columns, one
+            row per ticker and date, sorted by ticker and date
+        """
+        files = [
+            path
+            for snapshot_date in self.partitions(start, end)
+            for path in self._files(snapshot_date)
+        ]
+        rows = self._latest(self._read(files, tickers, columns))
+        return (
+            rows.drop(columns="Written_At")
+            .sort_values(["Ticker", "Snapshot_Date"])
+            .reset_index(drop=True)
+        )
+
+    def as_of(
+        self,
+        as_of_date=None,
+        tickers: Optional[Iterable[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Latest snapshot of every ticker on or before a date
+
+        With tickers given, partitions are read newest first and the
+        lookup stops as soon as every ticker has been found.
+
+        Args:
+            as_of_date: Point in time (None = latest)
+            tickers: Tickers to look up (None = every ticker ever stored)
+            columns: Metric columns to read (default: SNAPSHOT_METRICS)
+
+        Returns:
+            DataFrame with Snapshot_Date (of the snapshot used), Ticker and
+            the metric columns, one row per ticker found, sorted by ticker
+        """
+        dates = self.partitions(end=as_of_date)[::-1]
+        remaining = set(tickers) if tickers is not None else None
+
+        found = []
+        for offset in range(0, len(dates), SNAPSHOT_AS_OF_BATCH_PARTITIONS):
+            if remaining is not None and not remaining:
+                break
+            batch = dates[offset:offset + SNAPSHOT_AS_OF_BATCH_PARTITIONS]
+            files = [path for d in batch for path in self._files(d)]
+            rows = self._read(files, remaining, columns)
+            if rows.empty:
+                continue
+            found.append(rows)
+            if remaining is not None:
+                remaining.difference_update(rows["Ticker"])
+
+        if not found:
+            return self._read([], columns=columns).drop(columns="Written_At")
+        rows = pd.concat(found, ignore_index=True).sort_values(
+            ["Snapshot_Date", "Written_At"], kind="stable"
+        )
+        return (
+            rows.drop_duplicates("Ticker", keep="last")
+            .drop(columns="Written_At")
+            .sort_values("Ticker")
+            .reset_index(drop=True)
+        )
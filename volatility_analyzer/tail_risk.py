@@ -0,0 +1,275 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 15:20:34
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 15:20:34
+# @ Description: Value-at-Risk and Expected Shortfall calculations
+"""
+
+from statistics import NormalDist
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from volatility_analyzer.config import (
+    DEFAULT_VAR_CONFIDENCE,
+    DEFAULT_VAR_HORIZON_DAYS,
+    DEFAULT_MC_SIMULATIONS,
+    MC_MAX_BATCH_MB,
+)
+from volatility_analyzer.data_models import TailRiskMetrics
+
+VAR_METHODS = ("historical", "parametric", "monte_carlo")
+
+
+class TailRiskCalculator:
+    """
+    Calculate VaR and Expected Shortfall from returns.
+
+    Losses are reported as positive percentages of position value over the
+    horizon, e.g. VaR = 2.1 means a 2.1% loss is exceeded with probability
+    1 - confidence. Multi-day horizons scale historical and parametric
+    figures by sqrt(horizon); Monte Carlo simulates compounded paths.
+    """
+
+    @staticmethod
+    def _as_matrix(returns) -> Tuple[np.ndarray, bool]:
+        """Returns as a 2D (observations x series) array"""
+        values = np.asarray(returns, dtype=np.float64)
+        single = values.ndim == 1
+        return (values[:, None] if single else values), single
+
+    @staticmethod
+    def historical(
+        returns, confidence: float = DEFAULT_VAR_CONFIDENCE, horizon_days: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Historical-simulation VaR and ES
+
+        Args:
+            returns: 1D returns or 2D (date x ticker) returns, NaN allowed
+            confidence: Confidence level
+            horizon_days: Holding period in days
+
+        Returns:
+            Tuple of (VaR, ES) in percent, scalar-shaped for 1D input
+        """
+        values, single = TailRiskCalculator._as_matrix(returns)
+        alpha = 1 - confidence
+        quantile = np.nanquantile(values, alpha, axis=0)
+
+        tail = np.where(values <= quantile, values, np.nan)
+        with np.errstate(invalid="ignore"):
+            shortfall = np.nanmean(tail, axis=0)
+
+        scale = np.sqrt(horizon_days) * 100
+        var, es = -quantile * scale, -shortfall * scale
+        return (var[0], es[0]) if single else (var, es)
+
+    @staticmethod
+    def parametric(
+        returns, confidence: float = DEFAULT_VAR_CONFIDENCE, horizon_days: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gaussian (variance-covariance) VaR and ES
+
+        Args:
+            returns: 1D returns or 2D (date x ticker) returns, NaN allowed
+            confidence: Confidence level
+            horizon_days: Holding period in days
+
+        Returns:
+            Tuple of (VaR, ES) in percent
+        """
+        values, single = TailRiskCalculator._as_matrix(returns)
+        alpha = 1 - confidence
+        mean = np.nanmean(values, axis=0) * horizon_days
+        std = np.nanstd(values, axis=0, ddof=1) * np.sqrt(horizon_days)
+
+        normal = NormalDist()
+        z = normal.inv_cdf(alpha)
+        var = -(mean + z * std) * 100
+        es = -(mean - std * normal.pdf(z) / alpha) * 100
+        return (var[0], es[0]) if single else (var, es)
+
+    @staticmethod
+    def monte_carlo(
+        returns,
+        confidence: float = DEFAULT_VAR_CONFIDENCE,
+        horizon_days: int = DEFAULT_VAR_HORIZON_DAYS,
+        n_simulations: int = DEFAULT_MC_SIMULATIONS,
+        rng: Optional[np.random.Generator] = None,
+        max_batch_mb: float = MC_MAX_BATCH_MB,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Monte Carlo VaR and ES from simulated compounded return paths
+
+        Daily returns are drawn from a normal fitted to each series and
+        compounded over the horizon. Paths are simulated as
+        (simulations x horizon x series) arrays in batches that stay under
+        `max_batch_mb`; only the terminal return of each path is kept.
+
+        Args:
+            returns: 1D returns or 2D (date x ticker) returns, NaN allowed
+            confidence: Confidence level
+            horizon_days: Holding period in days
+            n_simulations: Number of simulated paths per series
+            rng: Seeded numpy Generator
+            max_batch_mb: Memory cap for one simulated batch
+
+        Returns:
+            Tuple of (VaR, ES) in percent
+        """
+        rng = rng or np.random.default_rng()
+        values, single = TailRiskCalculator._as_matrix(returns)
+        n_series = values.shape[1]
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+
+        path_bytes = horizon_days * n_series * 8
+        batch = max(1, int(max_batch_mb * 1024 * 1024 // path_bytes))
+
+        terminal = np.empty((n_simulations, n_series))
+        for start in range(0, n_simulations, batch):
+            rows = min(batch, n_simulations - start)
+            draws = rng.standard_normal((rows, horizon_days, n_series))
+            draws *= std
+            draws += mean
+            np.log1p(draws, out=draws)
+            terminal[start : start + rows] = np.expm1(draws.sum(axis=1))
+
+        return TailRiskCalculator.historical(
+            terminal[:, 0] if single else terminal, confidence
+        )
+
+    @staticmethod
+    def rolling(
+        returns: pd.Series,
+        window: int,
+        confidence: float = DEFAULT_VAR_CONFIDENCE,
+        method: str = "historical",
+    ) -> pd.DataFrame:
+        """
+        Rolling-window VaR and ES
+
+        Historical figures partition zero-copy sliding windows of the
+        returns, so every window is processed in one vectorized call.
+
+        Args:
+            returns: Series of returns
+            window: Window length in observations
+            confidence: Confidence level
+            method: "historical" or "parametric"
+
+        Returns:
+            DataFrame with 'VaR' and 'ES' columns (percent) aligned to returns
+        """
+        values = returns.to_numpy(dtype=np.float64)
+        result = pd.DataFrame(index=returns.index, columns=["VaR", "ES"], dtype=float)
+        if len(values) < window:
+            return result
+
+        windows = sliding_window_view(values, window)
+        alpha = 1 - confidence
+
+        if method == "historical":
+            k = max(1, int(np.floor(alpha * window)))
+            smallest = np.partition(windows, k - 1, axis=1)[:, :k]
+            quantile = np.quantile(windows, alpha, axis=1)
+            var, es = -quantile * 100, -smallest.mean(axis=1) * 100
+        elif method == "parametric":
+            var, es = TailRiskCalculator.parametric(windows.T, confidence)
+        else:
+            raise ValueError(f"Unsupported rolling VaR method '{method}'")
+
+        result.iloc[window - 1 :, 0] = var
+        result.iloc[window - 1 :, 1] = es
+        return result
+
+    @staticmethod
+    def panel(
+        returns_panel: pd.DataFrame,
+        confidence: float = DEFAULT_VAR_CONFIDENCE,
+        horizon_days: int = DEFAULT_VAR_HORIZON_DAYS,
+        methods=VAR_METHODS,
+        n_simulations: int = DEFAULT_MC_SIMULATIONS,
+        rng: Optional[np.random.Generator] = None,
+    ) -> pd.DataFrame:
+        """
+        VaR and ES for every column of a date x ticker returns panel
+
+        Args:
+            returns_panel: DataFrame of returns, one column per ticker
+            confidence: Confidence level
+            horizon_days: Holding period in days
+            methods: Methods to compute
+            n_simulations: Monte Carlo paths per ticker
+            rng: Seeded numpy Generator for Monte Carlo
+
+        Returns:
+            DataFrame indexed by ticker with '<method>_VaR'/'<method>_ES' columns
+        """
+        columns = {}
+        for method in methods:
+            if method == "monte_carlo":
+                var, es = TailRiskCalculator.monte_carlo(
+                    returns_panel.values,
+                    confidence,
+                    horizon_days,
+                    n_simulations=n_simulations,
+                    rng=rng,
+                )
+            elif method == "historical":
+                var, es = TailRiskCalculator.historical(
+                    returns_panel.values, confidence, horizon_days
+                )
+            elif method == "parametric":
+                var, es = TailRiskCalculator.parametric(
+                    returns_panel.values, confidence, horizon_days
+                )
+            else:
+                raise ValueError(f"Unsupported VaR method '{method}'")
+            columns[f"{method}_VaR"] = var
+            columns[f"{method}_ES"] = es
+
+        return pd.DataFrame(columns, index=returns_panel.columns)
+
+    @staticmethod
+    def calculate_tail_risk(
+        returns: pd.Series,
+        confidence: float = DEFAULT_VAR_CONFIDENCE,
+        horizon_days: int = DEFAULT_VAR_HORIZON_DAYS,
+        n_simulations: int = DEFAULT_MC_SIMULATIONS,
+        rng: Optional[np.random.Generator] = None,
+    ) -> TailRiskMetrics:
+        """
+        VaR and ES of one return series by all three methods
+
+        Args:
+            returns: Series of returns
+            confidence: Confidence level
+            horizon_days: Holding period in days
+            n_simulations: Monte Carlo paths
+            rng: Seeded numpy Generator for Monte Carlo
+
+        Returns:
+            TailRiskMetrics object
+        """
+        historical = TailRiskCalculator.historical(returns, confidence, horizon_days)
+        parametric = TailRiskCalculator.parametric(returns, confidence, horizon_days)
+        monte_carlo = TailRiskCalculator.monte_carlo(
+            returns, confidence, horizon_days, n_simulations=n_simulations, rng=rng
+        )
+
+        return TailRiskMetrics(
+            confidence=confidence,
+            horizon_days=horizon_days,
+            historical_var=float(historical[0]),
+            historical_es=float(historical[1]),
+            parametric_var=float(parametric[0]),
+            parametric_es=float(parametric[1]),
+            monte_carlo_var=float(monte_carlo[0]),
+            monte_carlo_es=float(monte_carlo[1]),
+        )
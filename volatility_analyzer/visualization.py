@@ -10,6 +10,12 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from typing import List
+from volatility_analyzer.config import (
+    COMPARISON_BAR_MAX_TICKERS,
+    LARGE_COMPARISON_TOP_N,
+    LARGE_COMPARISON_HEXBIN_GRIDSIZE,
+    LARGE_COMPARISON_HISTOGRAM_BINS,
+)
 from volatility_analyzer.data_models import AnalysisReport
 
 
@@ -34,7 +40,7 @@ class AnalysisVisualizer:
             stock_returns: Stock returns
             benchmark_returns: Benchmark returns
         """
-        fig, axes = plt.subplots(3, 2, figsize=(15, 12))
+        fig, axes = plt.subplots(4, 2, figsize=(15, 16))
         fig.suptitle(
             f"Volatility & Beta Analysis: {report.stock_metrics.name} vs {report.benchmark_metrics.name}",
             fontsize=16,
@@ -80,6 +86,14 @@ class AnalysisVisualizer:
         # Plot 6: R-squared over time
         AnalysisVisualizer._plot_r_squared(axes[2, 1], report.rolling_metrics)
 
+        # Plots 7-8: Drawdowns from the running peak and rolling max drawdown
+        if report.drawdown is not None:
+            AnalysisVisualizer._plot_underwater(axes[3, 0], report.drawdown)
+            AnalysisVisualizer._plot_rolling_drawdown(axes[3, 1], report.drawdown)
+        else:
+            axes[3, 0].set_visible(False)
+            axes[3, 1].set_visible(False)
+
         plt.tight_layout(rect=[0, 0.03, 1, 0.95], h_pad=3.0)
         plt.show()
 
@@ -233,16 +247,77 @@ class AnalysisVisualizer:
         ax.grid(True, alpha=0.3)
 
     @staticmethod
-    def plot_comparison(comparison_df: pd.DataFrame):
+    def _plot_underwater(ax, drawdown):
+        """Plot the loss from the running peak with the max drawdown marked"""
+        underwater = -drawdown.drawdown
+        ax.fill_between(underwater.index, underwater, 0, color="red", alpha=0.3)
+        ax.plot(underwater.index, underwater, color="darkred", linewidth=1)
+        trough = pd.Timestamp(drawdown.trough_date)
+        ax.axvspan(
+            pd.Timestamp(drawdown.peak_date),
+            pd.Timestamp(drawdown.recovery_date) if drawdown.recovery_date else trough,
+            color="gray",
+            alpha=0.15,
+            label=f"Max Drawdown: {drawdown.max_drawdown:.1f}%",
+        )
+        ax.set_title("Drawdown from Running Peak")
+        ax.set_ylabel("Drawdown (%)")
+        ax.legend(loc="lower left")
+        ax.grid(True, alpha=0.3)
+
+    @staticmethod
+    def _plot_rolling_drawdown(ax, drawdown):
+        """Plot rolling maximum drawdown over time"""
+        rolling = -drawdown.rolling_max_drawdown
+        ax.plot(rolling.index, rolling, color="purple", linewidth=1.5)
+        ax.axhline(
+            y=-drawdown.max_drawdown,
+            color="black",
+            linestyle="--",
+            label=f"Full Period: {drawdown.max_drawdown:.1f}%",
+        )
+        ax.set_title(f"{drawdown.window}-Period Rolling Max Drawdown")
+        ax.set_ylabel("Max Drawdown (%)")
+        ax.legend(loc="lower left")
+        ax.grid(True, alpha=0.3)
+
+    @staticmethod
+    def _threshold_colors(values, bounds, colors) -> np.ndarray:
+        """
+        Color of every value by the band it falls in
+
+        Args:
+            values: Values to color
+            bounds: Ascending upper band bounds (inclusive)
+            colors: One color per band, len(bounds) + 1
+
+        Returns:
+            Array of colors; NaN gets the first band's color
+        """
+        values = np.asarray(values, dtype=np.float64)
+        bands = np.searchsorted(np.asarray(bounds, dtype=np.float64), values)
+        bands[np.isnan(values)] = 0
+        return np.asarray(colors)[bands]
+
+    @staticmethod
+    def plot_comparison(
+        comparison_df: pd.DataFrame, max_bars: int = COMPARISON_BAR_MAX_TICKERS
+    ):
         """
         Plot comparison of multiple stocks
 
         Args:
             comparison_df: DataFrame with comparison data
+            max_bars: Largest universe drawn as one bar per ticker; larger
+                ones use plot_large_comparison()
         """
+        if len(comparison_df) > max_bars:
+            AnalysisVisualizer.plot_large_comparison(comparison_df)
+            return
+
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
-        stocks = comparison_df["Ticker"].str.replace(".NS", "").str.replace(".BO", "")
+        stocks = AnalysisVisualizer._short_tickers(comparison_df["Ticker"])
 
         # Plot 1: Volatility comparison
         AnalysisVisualizer._plot_volatility_comparison(
@@ -264,12 +339,156 @@ class AnalysisVisualizer:
         plt.tight_layout()
         plt.show()
 
+    @staticmethod
+    def _short_tickers(tickers: pd.Series) -> pd.Series:
+        """Tickers without their exchange suffix"""
+        return tickers.str.replace(".NS", "").str.replace(".BO", "")
+
+    @staticmethod
+    def plot_large_comparison(
+        comparison_df: pd.DataFrame, top_n: int = LARGE_COMPARISON_TOP_N
+    ):
+        """
+        Plot a comparison of hundreds to thousands of stocks
+
+        Every panel draws a fixed number of artists (hexagon bins, step
+        histograms, top_n bars), so rendering time barely grows with the
+        number of stocks.
+
+        Args:
+            comparison_df: DataFrame with comparison data
+            top_n: Stocks shown in each of the most and least volatile panels
+        """
+        df = comparison_df.dropna(subset=["Stock_Volatility_Annual", "Beta"])
+        ranked = df.sort_values("Stock_Volatility_Annual", ascending=False)
+        top, bottom = ranked.head(top_n), ranked.tail(top_n)[::-1]
+        median = df["Stock_Volatility_Annual"].median()
+
+        fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+
+        # Plot 1: Volatility vs beta density with the extremes marked
+        AnalysisVisualizer._plot_volatility_beta_density(axes[0, 0], df, top, bottom)
+
+        # Plots 2-4: Distributions across the universe
+        AnalysisVisualizer._plot_distribution(
+            axes[0, 1],
+            df["Stock_Volatility_Annual"],
+            "Annualized Volatility (%)",
+            "Volatility Distribution",
+            f"Median: {median:.1f}%",
+        )
+        betas = df["Beta"]
+        AnalysisVisualizer._plot_distribution(
+            axes[0, 2],
+            betas,
+            "Beta",
+            "Beta Distribution",
+            f"Median: {betas.median():.2f}",
+        )
+        axes[0, 2].axvline(x=1.0, color="black", linestyle=":", label="Market")
+        axes[0, 2].legend()
+        r2_values = df["R_Squared"] * 100
+        AnalysisVisualizer._plot_distribution(
+            axes[1, 0],
+            r2_values,
+            "R-squared (%)",
+            "Goodness of Fit Distribution",
+            f"Median: {r2_values.median():.1f}%",
+        )
+
+        # Plots 5-6: Most and least volatile stocks
+        AnalysisVisualizer._plot_highlight(
+            axes[1, 1], top, median, f"{len(top)} Most Volatile"
+        )
+        AnalysisVisualizer._plot_highlight(
+            axes[1, 2], bottom, median, f"{len(bottom)} Least Volatile"
+        )
+
+        plt.suptitle(
+            f"Volatility & Beta Across {len(df)} Stocks",
+            fontsize=16,
+            fontweight="bold",
+        )
+        plt.tight_layout()
+        plt.show()
+
+    @staticmethod
+    def _plot_volatility_beta_density(ax, df, top, bottom):
+        """Hexbin density of volatility against beta"""
+        hexbin = ax.hexbin(
+            df["Beta"],
+            df["Stock_Volatility_Annual"],
+            gridsize=LARGE_COMPARISON_HEXBIN_GRIDSIZE,
+            bins="log",
+            mincnt=1,
+            cmap="viridis",
+        )
+        plt.colorbar(hexbin, ax=ax, label="Stocks")
+        ax.scatter(
+            top["Beta"],
+            top["Stock_Volatility_Annual"],
+            facecolors="none",
+            edgecolors="red",
+            label="Most volatile",
+        )
+        ax.scatter(
+            bottom["Beta"],
+            bottom["Stock_Volatility_Annual"],
+            facecolors="none",
+            edgecolors="green",
+            label="Least volatile",
+        )
+        ax.axvline(x=1.0, color="black", linestyle="--", alpha=0.5)
+        ax.set_xlabel("Beta")
+        ax.set_ylabel("Annualized Volatility (%)")
+        ax.set_title("Volatility vs Beta")
+        ax.legend(loc="upper left")
+
+    @staticmethod
+    def _plot_distribution(ax, values, xlabel, title, median_label):
+        """Step histogram of one metric with its median"""
+        values = values.dropna()
+        ax.hist(
+            values,
+            bins=LARGE_COMPARISON_HISTOGRAM_BINS,
+            histtype="stepfilled",
+            alpha=0.6,
+            edgecolor="black",
+        )
+        ax.axvline(
+            x=values.median(), color="blue", linestyle="--", label=median_label
+        )
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel("Stocks")
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    @staticmethod
+    def _plot_highlight(ax, df, median, title):
+        """Volatility bars of a few highlighted stocks"""
+        volatilities = df["Stock_Volatility_Annual"]
+        colors = AnalysisVisualizer._threshold_colors(
+            volatilities, [median], ["green", "red"]
+        )
+        bars = ax.barh(
+            AnalysisVisualizer._short_tickers(df["Ticker"]), volatilities, color=colors
+        )
+        ax.bar_label(bars, fmt="%.1f%%", padding=3)
+        ax.margins(x=0.15)
+        ax.invert_yaxis()
+        ax.axvline(x=median, color="blue", linestyle="--")
+        ax.set_xlabel("Annualized Volatility (%)")
+        ax.set_title(f"{title} (median {median:.1f}%)")
+
     @staticmethod
     def _plot_volatility_comparison(ax, stocks, df):
         """Plot volatility comparison bars"""
-        volatilities = df["Volatility_Pct"]
+        volatilities = df["Stock_Volatility_Annual"]
         median = volatilities.median()
-        colors = ["red" if v > median else "green" for v in volatilities]
+        colors = AnalysisVisualizer._threshold_colors(
+            volatilities, [median], ["green", "red"]
+        )
         bars = ax.barh(stocks, volatilities, color=colors)
         ax.set_xlabel("Annualized Volatility (%)")
         ax.set_title("Volatility Comparison")
@@ -278,64 +497,45 @@ class AnalysisVisualizer:
         )
         ax.legend()
 
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(
-                width + 0.5,
-                bar.get_y() + bar.get_height() / 2,
-                f"{width:.1f}%",
-                va="center",
-            )
+        ax.bar_label(bars, fmt="%.1f%%", padding=3)
 
     @staticmethod
     def _plot_beta_comparison(ax, stocks, df):
         """Plot beta comparison bars"""
         betas = df["Beta"]
-        colors = ["red" if b > 1.2 else "orange" if b > 0.8 else "green" for b in betas]
+        colors = AnalysisVisualizer._threshold_colors(
+            betas, [0.8, 1.2], ["green", "orange", "red"]
+        )
         bars = ax.barh(stocks, betas, color=colors)
         ax.set_xlabel("Beta")
         ax.set_title("Beta Comparison")
         ax.axvline(x=1.0, color="black", linestyle="--", label="Beta = 1 (Market)")
         ax.legend()
 
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(
-                width + 0.02,
-                bar.get_y() + bar.get_height() / 2,
-                f"{width:.2f}",
-                va="center",
-            )
+        ax.bar_label(bars, fmt="%.2f", padding=3)
 
     @staticmethod
     def _plot_volatility_ratio(ax, stocks, df):
         """Plot volatility ratio bars"""
         ratios = df["Volatility_Ratio"]
-        colors = [
-            "red" if r > 1.5 else "orange" if r > 1.0 else "green" for r in ratios
-        ]
+        colors = AnalysisVisualizer._threshold_colors(
+            ratios, [1.0, 1.5], ["green", "orange", "red"]
+        )
         bars = ax.barh(stocks, ratios, color=colors)
         ax.set_xlabel("Volatility Ratio (Stock/Benchmark)")
         ax.set_title("Relative Volatility (vs Benchmark)")
         ax.axvline(x=1.0, color="black", linestyle="--", label="Same as Benchmark")
         ax.legend()
 
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(
-                width + 0.02,
-                bar.get_y() + bar.get_height() / 2,
-                f"{width:.2f}x",
-                va="center",
-            )
+        ax.bar_label(bars, fmt="%.2fx", padding=3)
 
     @staticmethod
     def _plot_r_squared_comparison(ax, stocks, df):
         """Plot R-squared comparison bars"""
         r2_values = df["R_Squared"] * 100
-        colors = [
-            "green" if r > 50 else "orange" if r > 25 else "red" for r in r2_values
-        ]
+        colors = AnalysisVisualizer._threshold_colors(
+            r2_values, [25, 50], ["red", "orange", "green"]
+        )
         bars = ax.barh(stocks, r2_values, color=colors)
         ax.set_xlabel("R-squared (%)")
         ax.set_title("Goodness of Fit (R-squared)")
@@ -343,11 +543,4 @@ class AnalysisVisualizer:
         ax.axvline(x=50, color="blue", linestyle="--", label="50% explained by market")
         ax.legend()
 
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(
-                width + 1,
-                bar.get_y() + bar.get_height() / 2,
-                f"{width:.1f}%",
-                va="center",
-            )
+        ax.bar_label(bars, fmt="%.1f%%", padding=3)
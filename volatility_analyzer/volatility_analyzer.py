@@ -6,22 +6,103 @@
 # @ Description: Main volatility analyzer orchestrating all components
 """
 
+import zlib
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    as_completed,
+    wait,
+)
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import numpy as np
 import pandas as pd
 
 from volatility_analyzer.config import (
+    DEFAULT_INTERVAL,
+    DEFAULT_FREQUENCY,
+    FREQUENCY_ROLLING_WINDOWS,
+    PERIODS_PER_YEAR,
+    INTRADAY_CHUNK_DAYS,
+    INTRADAY_MAX_LOOKBACK_DAYS,
     DEFAULT_YEARS_OF_DATA,
     DEFAULT_CACHE_DIR,
+    COMPARISON_BACKENDS,
+    DEFAULT_COMPARISON_BACKEND,
     DEFAULT_ROLLING_VOLATILITY_WINDOW,
     DEFAULT_ROLLING_BETA_WINDOW,
+    MARKET_FACTOR,
+    ROLLING_DRAWDOWN_WINDOW_YEARS,
+    TRADING_DAYS_PER_YEAR,
+    VOLATILITY_REGIME_LOOKBACK_YEARS,
 )
 
 # from benchmark_selector import BenchmarkSelector
+from volatility_analyzer.batch_journal import BatchJournal
 from volatility_analyzer.data_fetcher import DataFetcher
+from volatility_analyzer.group_aggregation import GroupAggregator
+from volatility_analyzer.intraday import SessionStatsAccumulator
+from volatility_analyzer.memory import MemoryBudget, MemoryTracker
+from volatility_analyzer.snapshot_store import SnapshotStore
+from volatility_analyzer.shared_panel import PanelSpec, SharedReturnsPanel
+from volatility_analyzer.tail_risk import TailRiskCalculator
 from volatility_analyzer.metrics_calculator import MetricsCalculator
+from volatility_analyzer.polars_backend import PolarsMetricsCalculator
 from volatility_analyzer.visualization import AnalysisVisualizer
-from volatility_analyzer.data_models import AnalysisReport
+from volatility_analyzer.data_models import (
+    AnalysisReport,
+    BatchResult,
+    format_frame,
+    record_columns,
+    records_to_frame,
+)
+from volatility_analyzer.result_writers import write_table
+
+# Per-process state of panel workers, set by _init_panel_worker
+_panel_worker_state: Dict = {}
+
+
+def _init_panel_worker(spec: PanelSpec, analyzer_kwargs: Dict, start_date, end_date):
+    """Attach a worker process to the published returns panel"""
+    analyzer = VolatilityAnalyzer(verbose=False, **analyzer_kwargs)
+    analyzer.set_date_range(start_date, end_date)
+    _panel_worker_state["analyzer"] = analyzer
+    _panel_worker_state["panel"] = SharedReturnsPanel.attach(spec)
+
+
+def _run_panel_worker(
+    ticker: str, stock_name: str, benchmark_ticker: str, benchmark_name: str
+) -> Dict:
+    """Analyze one stock from the shared panel, returning its result row"""
+    analyzer = _panel_worker_state["analyzer"]
+    panel = _panel_worker_state["panel"]
+    factor_returns = None
+    if analyzer.factor_tickers:
+        factor_returns = pd.DataFrame(
+            {f: panel.benchmark_returns(f) for f in analyzer.factor_tickers}
+        )
+    report = analyzer.build_report(
+        ticker,
+        stock_name,
+        panel.stock_returns(ticker),
+        benchmark_ticker,
+        benchmark_name,
+        panel.benchmark_returns(benchmark_ticker),
+        factor_returns=factor_returns,
+    )
+    return report.to_record()
 
 
 class VolatilityAnalyzer:
@@ -34,6 +115,12 @@ class VolatilityAnalyzer:
         self,
         years_of_data: int = DEFAULT_YEARS_OF_DATA,
         cache_dir: str = DEFAULT_CACHE_DIR,
+        verbose: bool = True,
+        data_fetcher: Optional[DataFetcher] = None,
+        bootstrap_resamples: int = 0,
+        random_seed: Optional[int] = None,
+        factor_tickers: Sequence[str] = (),
+        memory_tracker: Optional[MemoryTracker] = None,
     ):
         """
         Initialize the volatility analyzer
@@ -41,18 +128,52 @@ class VolatilityAnalyzer:
         Args:
             years_of_data: Number of years of historical data
             cache_dir: Directory for caching downloaded data
+            verbose: Whether to print progress messages to stdout
+            data_fetcher: Pre-configured DataFetcher (e.g. with an offline
+                downloader); created from cache_dir when None
+            bootstrap_resamples: Block-bootstrap resamples for confidence
+                intervals on beta, R-squared and volatility (0 = disabled)
+            random_seed: Seed for reproducible bootstrap intervals and
+                Monte Carlo VaR
+            factor_tickers: Extra factor tickers (e.g. a sector index)
+                regressed on alongside the benchmark for daily analyses
+            memory_tracker: Accounts the memory of every analysis stage
+                (fetch, returns, alignment, rolling, ..., plot); read its
+                report() afterwards
         """
         self.years_of_data = years_of_data
+        self.cache_dir = cache_dir
+        self.verbose = verbose
+        self.bootstrap_resamples = bootstrap_resamples
+        self.random_seed = random_seed
+        self.factor_tickers = tuple(factor_tickers)
+        self.memory_tracker = memory_tracker
         self.end_date = datetime.now()
         self.start_date = self.end_date - timedelta(days=365 * years_of_data)
 
         # Initialize components
-        self.data_fetcher = DataFetcher(cache_dir)
+        self.data_fetcher = data_fetcher or DataFetcher(cache_dir)
         self.metrics_calculator = MetricsCalculator()
         self.visualizer = AnalysisVisualizer()
 
+    def _print(self, *args):
+        """Print progress message when running in verbose mode"""
+        if self.verbose:
+            print(*args)
+
+    def _stage(self, name: str):
+        """Memory accounting of one analysis stage (no-op when not tracked)"""
+        if self.memory_tracker is None:
+            return nullcontext()
+        return self.memory_tracker.stage(name)
+
     def analyze_stock(
-        self, ticker: str, benchmark_ticker: str, plot_results: bool = True
+        self,
+        ticker: str,
+        benchmark_ticker: str,
+        plot_results: bool = True,
+        interval: str = DEFAULT_INTERVAL,
+        frequency: str = DEFAULT_FREQUENCY,
     ) -> Tuple[AnalysisReport, pd.DataFrame, pd.DataFrame]:
         """
         Perform complete volatility and beta analysis for a stock
@@ -61,18 +182,84 @@ class VolatilityAnalyzer:
             ticker: Stock ticker symbol
             benchmark_ticker: Benchmark ticker (required)
             plot_results: Whether to create visualization plots
+            interval: Bar interval ("1d" or intraday such as "5m", "1h")
+            frequency: Return frequency resampled from daily closes
+                ("D", "W" or "M")
 
         Returns:
-            Tuple of (AnalysisReport, stock_data, benchmark_data)
+            Tuple of (AnalysisReport, stock_data, benchmark_data); for
+            intraday intervals the data frames hold one close per session
         """
         # Step 1: Select benchmark
         if benchmark_ticker is None:
             raise RuntimeError("Benchmark stock not provided.")
 
-        print(f"\nAnalyzing {ticker} vs {benchmark_ticker}")
-        print(f"Period: {self.start_date.date()} to {self.end_date.date()}")
+        if self.metrics_calculator.is_intraday(interval):
+            if frequency != DEFAULT_FREQUENCY:
+                raise ValueError("Resampled frequencies require daily (1d) data")
+            self._check_intraday_options(interval)
+            with self._stage("intraday"):
+                return self._analyze_intraday(
+                    ticker, benchmark_ticker, interval, plot_results
+                )
 
         # Step 2: Fetch data
+        with self._stage("fetch"):
+            (
+                stock_data,
+                benchmark_data,
+                actual_benchmark,
+                stock_name,
+                benchmark_name,
+            ) = self._load_daily_data(ticker, benchmark_ticker)
+            factor_returns = self._load_factor_returns(frequency)
+
+        # Step 3: Calculate returns
+        with self._stage("returns"):
+            stock_returns = self.metrics_calculator.calculate_returns(
+                self.metrics_calculator.resample_prices(stock_data, frequency)
+            )
+            benchmark_returns = self.metrics_calculator.calculate_returns(
+                self.metrics_calculator.resample_prices(benchmark_data, frequency)
+            )
+
+        # Step 4-6: Calculate metrics and create analysis report
+        report = self.build_report(
+            ticker,
+            stock_name,
+            stock_returns,
+            actual_benchmark,
+            benchmark_name,
+            benchmark_returns,
+            frequency=frequency,
+            factor_returns=factor_returns,
+        )
+
+        # Step 7: Log report
+        report.log_report()
+
+        # Step 8: Visualize if requested
+        if plot_results:
+            with self._stage("plot"):
+                self.visualizer.plot_single_stock_analysis(
+                    report, stock_data, benchmark_data, stock_returns, benchmark_returns
+                )
+
+        return report, stock_data, benchmark_data
+
+    def _load_daily_data(
+        self, ticker: str, benchmark_ticker: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, str, str, str]:
+        """
+        Fetch daily prices and names for a stock and its benchmark
+
+        Returns:
+            Tuple of (stock_data, benchmark_data, actual benchmark ticker,
+            stock name, benchmark name)
+        """
+        self._print(f"\nAnalyzing {ticker} vs {benchmark_ticker}")
+        self._print(f"Period: {self.start_date.date()} to {self.end_date.date()}")
+
         stock_data = self.data_fetcher.fetch_stock_data(
             ticker, self.start_date, self.end_date
         )
@@ -84,59 +271,798 @@ class VolatilityAnalyzer:
         stock_name = self.data_fetcher.get_stock_name(ticker)
         benchmark_name = self.data_fetcher.get_stock_name(actual_benchmark)
 
-        print(f"Stock: {stock_name}")
-        print(f"Benchmark: {benchmark_name}")
+        self._print(f"Stock: {stock_name}")
+        self._print(f"Benchmark: {benchmark_name}")
 
-        # Step 3: Calculate returns
-        stock_returns = self.metrics_calculator.calculate_returns(stock_data)
-        benchmark_returns = self.metrics_calculator.calculate_returns(benchmark_data)
+        return stock_data, benchmark_data, actual_benchmark, stock_name, benchmark_name
+
+    def _load_factor_prices(self) -> Dict[str, pd.DataFrame]:
+        """Daily prices of the extra factor tickers"""
+        return {
+            factor: self.data_fetcher.fetch_stock_data(
+                factor, self.start_date, self.end_date
+            )
+            for factor in self.factor_tickers
+        }
+
+    def _factor_returns(
+        self, factor_prices: Dict[str, pd.DataFrame], frequency: str
+    ) -> Optional[pd.DataFrame]:
+        """Returns of loaded factor prices at a frequency, one column per factor"""
+        if not factor_prices:
+            return None
+        return pd.DataFrame(
+            {
+                factor: self.metrics_calculator.calculate_returns(
+                    self.metrics_calculator.resample_prices(data, frequency)
+                )
+                for factor, data in factor_prices.items()
+            }
+        )
+
+    def _load_factor_returns(
+        self, frequency: str = DEFAULT_FREQUENCY
+    ) -> Optional[pd.DataFrame]:
+        """Returns of the extra factor tickers, one column per factor"""
+        return self._factor_returns(self._load_factor_prices(), frequency)
+
+    def analyze_stock_frequencies(
+        self,
+        ticker: str,
+        benchmark_ticker: str,
+        frequencies: Sequence[str] = ("D", "W", "M"),
+    ) -> Dict[str, AnalysisReport]:
+        """
+        Analyze a stock at several return frequencies from one data load
+
+        Daily closes (of the stock, benchmark and factors) are fetched once
+        and resampled in memory for every requested frequency, with period
+        returns compounded from daily ones.
 
-        # Step 4: Calculate metrics
-        stock_metrics = self.metrics_calculator.calculate_stock_metrics(
-            ticker, stock_name, stock_returns
+        Args:
+            ticker: Stock ticker symbol
+            benchmark_ticker: Benchmark ticker symbol
+            frequencies: Frequencies to compute ("D", "W", "M")
+
+        Returns:
+            Dictionary mapping frequency to AnalysisReport
+        """
+        stock_data, benchmark_data, actual_benchmark, stock_name, benchmark_name = (
+            self._load_daily_data(ticker, benchmark_ticker)
         )
-        benchmark_metrics = self.metrics_calculator.calculate_benchmark_metrics(
-            actual_benchmark, benchmark_name, benchmark_returns
+        factor_prices = self._load_factor_prices()
+
+        reports = {}
+        for frequency in frequencies:
+            stock_returns = self.metrics_calculator.calculate_returns(
+                self.metrics_calculator.resample_prices(stock_data, frequency)
+            )
+            benchmark_returns = self.metrics_calculator.calculate_returns(
+                self.metrics_calculator.resample_prices(benchmark_data, frequency)
+            )
+            reports[frequency] = self.build_report(
+                ticker,
+                stock_name,
+                stock_returns,
+                actual_benchmark,
+                benchmark_name,
+                benchmark_returns,
+                frequency=frequency,
+                factor_returns=self._factor_returns(factor_prices, frequency),
+            )
+            reports[frequency].log_report()
+
+        return reports
+
+    def _intraday_windows(self, interval: str):
+        """Day-aligned fetch windows covering the servable intraday range"""
+        lookback_start = self.end_date - timedelta(
+            days=INTRADAY_MAX_LOOKBACK_DAYS[interval]
         )
-        beta_analysis = self.metrics_calculator.calculate_beta(
-            stock_returns, benchmark_returns
+        start_date = max(self.start_date, lookback_start)
+        if start_date > self.start_date:
+            self._print(
+                f"{interval} bars only reach back to {start_date.date()}, "
+                "clamping analysis window"
+            )
+
+        window_start = datetime.combine(start_date.date(), datetime.min.time())
+        while window_start < self.end_date:
+            window_end = min(
+                window_start + timedelta(days=INTRADAY_CHUNK_DAYS), self.end_date
+            )
+            yield window_start, window_end
+            window_start = window_start + timedelta(days=INTRADAY_CHUNK_DAYS)
+
+    def _check_intraday_options(self, interval: str):
+        """Reject options the session-based intraday analysis does not compute"""
+        if self.metrics_calculator.is_intraday(interval) and (
+            self.bootstrap_resamples > 0 or self.factor_tickers
+        ):
+            raise ValueError(
+                "Bootstrap intervals and extra factors require daily (1d) data"
+            )
+
+    def _analyze_intraday(
+        self, ticker: str, benchmark_ticker: str, interval: str, plot_results: bool
+    ) -> Tuple[AnalysisReport, pd.DataFrame, pd.DataFrame]:
+        """
+        Chunked intraday analysis
+
+        Bars are fetched and reduced one window at a time into per-session
+        statistics, so memory is bounded by one chunk plus a few numbers per
+        session regardless of how many bars the period contains. Bootstrap
+        intervals, tail risk and factor regressions need the bar returns
+        themselves and are left out of intraday reports.
+        """
+        self._print(f"\nAnalyzing {ticker} vs {benchmark_ticker} ({interval} bars)")
+
+        # Resolve the benchmark (and any fallback) once on cheap daily data
+        _, actual_benchmark = self.data_fetcher.fetch_benchmark_data(
+            benchmark_ticker, self.start_date, self.end_date
         )
+        stock_name = self.data_fetcher.get_stock_name(ticker)
+        benchmark_name = self.data_fetcher.get_stock_name(actual_benchmark)
 
-        # Step 5: Calculate rolling metrics
-        rolling_vol = self.metrics_calculator.calculate_rolling_volatility(
-            stock_returns, window_days=DEFAULT_ROLLING_VOLATILITY_WINDOW
+        accumulator = SessionStatsAccumulator(
+            self.metrics_calculator.annualization_factor(interval)
         )
-        rolling_metrics = self.metrics_calculator.calculate_rolling_beta(
-            stock_returns, benchmark_returns, window_days=DEFAULT_ROLLING_BETA_WINDOW
+        stock_closes, benchmark_closes = [], []
+
+        for window_start, window_end in self._intraday_windows(interval):
+            chunks = []
+            for symbol in (ticker, actual_benchmark):
+                data = self.data_fetcher.fetch_stock_data(
+                    symbol, window_start, window_end, interval=interval
+                )
+                # Keep only sessions inside this window so none is counted twice
+                session_dates = pd.Index(data.index.date)
+                next_window = window_start + timedelta(days=INTRADAY_CHUNK_DAYS)
+                chunks.append(
+                    data[
+                        (session_dates >= window_start.date())
+                        & (session_dates < next_window.date())
+                    ]
+                )
+
+            stock_chunk, benchmark_chunk = chunks
+            if stock_chunk.empty or benchmark_chunk.empty:
+                continue
+
+            accumulator.add(
+                self.metrics_calculator.calculate_returns(stock_chunk, interval),
+                self.metrics_calculator.calculate_returns(benchmark_chunk, interval),
+            )
+            stock_closes.append(self._session_closes(stock_chunk))
+            benchmark_closes.append(self._session_closes(benchmark_chunk))
+
+        if not stock_closes:
+            raise ValueError(f"No {interval} data for {ticker} in analysis window")
+
+        self._print(f"Stock: {stock_name}")
+        self._print(f"Benchmark: {benchmark_name}")
+
+        stock_data = pd.concat(stock_closes)
+        benchmark_data = pd.concat(benchmark_closes)
+
+        sessions = accumulator.sessions
+        self._print(f"Sessions: {len(sessions)}, aligned bars: {accumulator.aligned_bars}")
+
+        beta_analysis = accumulator.beta_analysis()
+        stock_metrics = accumulator.stock_metrics(ticker, stock_name)
+        benchmark_metrics = accumulator.benchmark_metrics(
+            actual_benchmark, benchmark_name
         )
 
-        # Step 6: Create analysis report
+        rolling_vol = accumulator.rolling_volatility(DEFAULT_ROLLING_VOLATILITY_WINDOW)
+
         report = AnalysisReport(
             stock_metrics=stock_metrics,
             benchmark_metrics=benchmark_metrics,
             beta_analysis=beta_analysis,
-            period_start=str(self.start_date.date()),
-            period_end=str(self.end_date.date()),
-            data_points=len(beta_analysis.aligned_data),
+            period_start=str(sessions.index[0].date()),
+            period_end=str(sessions.index[-1].date()),
+            data_points=accumulator.aligned_bars,
             volatility_ratio=stock_metrics.volatility_annual
             / benchmark_metrics.volatility_annual,
             rolling_volatility=rolling_vol,
-            rolling_metrics=rolling_metrics,
+            rolling_metrics=accumulator.rolling_beta(DEFAULT_ROLLING_BETA_WINDOW),
+            interval=interval,
+            # Drawdowns are measured on session closes
+            drawdown=self.metrics_calculator.calculate_drawdown(
+                self.metrics_calculator.calculate_returns(stock_data),
+                window_days=TRADING_DAYS_PER_YEAR * ROLLING_DRAWDOWN_WINDOW_YEARS,
+            ),
+            volatility_regime=self.metrics_calculator.calculate_volatility_regime(
+                rolling_vol,
+                window_days=TRADING_DAYS_PER_YEAR * VOLATILITY_REGIME_LOOKBACK_YEARS,
+            ),
         )
-
-        # Step 7: Log report
         report.log_report()
 
-        # Step 8: Visualize if requested
         if plot_results:
             self.visualizer.plot_single_stock_analysis(
-                report, stock_data, benchmark_data, stock_returns, benchmark_returns
+                report,
+                stock_data,
+                benchmark_data,
+                beta_analysis.aligned_data["Stock"],
+                beta_analysis.aligned_data["Benchmark"],
             )
 
         return report, stock_data, benchmark_data
 
+    @staticmethod
+    def _session_closes(price_data: pd.DataFrame) -> pd.DataFrame:
+        """Last close of every session in an intraday frame"""
+        closes = price_data["Close"]
+        return closes.groupby(closes.index.normalize()).last().to_frame("Close")
+
+    def build_report(
+        self,
+        ticker: str,
+        stock_name: str,
+        stock_returns: pd.Series,
+        benchmark_ticker: str,
+        benchmark_name: str,
+        benchmark_returns: pd.Series,
+        frequency: str = DEFAULT_FREQUENCY,
+        factor_returns: Optional[pd.DataFrame] = None,
+        period: Optional[Tuple[datetime, datetime]] = None,
+    ) -> AnalysisReport:
+        """
+        Calculate all metrics for already loaded returns
+
+        Args:
+            ticker: Stock ticker symbol
+            stock_name: Stock display name
+            stock_returns: Stock returns at the given frequency
+            benchmark_ticker: Benchmark ticker symbol actually used
+            benchmark_name: Benchmark display name
+            benchmark_returns: Benchmark returns at the given frequency
+            frequency: Return frequency ("D", "W" or "M"), which selects
+                annualization and rolling window lengths
+            factor_returns: Extra factor returns (one column per factor)
+                regressed on together with the benchmark
+            period: (start, end) window the returns were loaded for
+                (default: the analyzer's date range)
+
+        Returns:
+            AnalysisReport object
+        """
+        period_start, period_end = period or (self.start_date, self.end_date)
+        periods_per_year = PERIODS_PER_YEAR[frequency]
+        if frequency == DEFAULT_FREQUENCY:
+            vol_window = DEFAULT_ROLLING_VOLATILITY_WINDOW
+            beta_window = DEFAULT_ROLLING_BETA_WINDOW
+        else:
+            vol_window, beta_window = FREQUENCY_ROLLING_WINDOWS[frequency]
+
+        # Calculate point-in-time metrics
+        with self._stage("alignment"):
+            stock_metrics = self.metrics_calculator.calculate_stock_metrics(
+                ticker, stock_name, stock_returns, periods_per_year
+            )
+            benchmark_metrics = self.metrics_calculator.calculate_benchmark_metrics(
+                benchmark_ticker, benchmark_name, benchmark_returns, periods_per_year
+            )
+            beta_analysis = self.metrics_calculator.calculate_beta(
+                stock_returns, benchmark_returns
+            )
+
+        # Calculate rolling metrics
+        with self._stage("rolling"):
+            rolling_vol = self.metrics_calculator.calculate_rolling_volatility(
+                stock_returns, window_days=vol_window, trading_days=periods_per_year
+            )
+            rolling_metrics = self.metrics_calculator.calculate_rolling_beta(
+                stock_returns, benchmark_returns, window_days=beta_window
+            )
+            volatility_regime = self.metrics_calculator.calculate_volatility_regime(
+                rolling_vol,
+                window_days=round(periods_per_year * VOLATILITY_REGIME_LOOKBACK_YEARS),
+            )
+
+        confidence_intervals = None
+        if self.bootstrap_resamples > 0:
+            with self._stage("bootstrap"):
+                calculator = self.metrics_calculator
+                confidence_intervals = calculator.calculate_bootstrap_intervals(
+                    beta_analysis.aligned_data,
+                    n_resamples=self.bootstrap_resamples,
+                    trading_days=periods_per_year,
+                    rng=self._rng_for(ticker, frequency, "bootstrap"),
+                )
+
+        with self._stage("tail_risk"):
+            tail_risk = TailRiskCalculator.calculate_tail_risk(
+                stock_returns, rng=self._rng_for(ticker, frequency, "monte_carlo")
+            )
+
+        with self._stage("factor_regression"):
+            factors = benchmark_returns.rename(MARKET_FACTOR).to_frame()
+            if factor_returns is not None:
+                factors = factors.join(factor_returns, how="outer")
+            factor_regression = self.metrics_calculator.calculate_factor_regression(
+                stock_returns,
+                factors,
+                window_days=beta_window,
+                trading_days=periods_per_year,
+            )
+
+        with self._stage("drawdown"):
+            drawdown = self.metrics_calculator.calculate_drawdown(
+                stock_returns,
+                window_days=round(periods_per_year * ROLLING_DRAWDOWN_WINDOW_YEARS),
+            )
+
+        return AnalysisReport(
+            stock_metrics=stock_metrics,
+            benchmark_metrics=benchmark_metrics,
+            beta_analysis=beta_analysis,
+            period_start=str(period_start.date()),
+            period_end=str(period_end.date()),
+            data_points=len(beta_analysis.aligned_data),
+            volatility_ratio=stock_metrics.volatility_annual
+            / benchmark_metrics.volatility_annual,
+            rolling_volatility=rolling_vol,
+            rolling_metrics=rolling_metrics,
+            frequency=frequency,
+            confidence_intervals=confidence_intervals,
+            tail_risk=tail_risk,
+            factor_regression=factor_regression,
+            drawdown=drawdown,
+            volatility_regime=volatility_regime,
+        )
+
+    def _rng_for(self, ticker: str, frequency: str, purpose: str) -> np.random.Generator:
+        """
+        Random generator for one ticker's resampling or simulation
+
+        Seeded from (random_seed, ticker, frequency, purpose) so results do
+        not depend on the order in which concurrent workers reach tickers.
+        """
+        if self.random_seed is None:
+            return np.random.default_rng()
+        key = zlib.crc32(f"{ticker}|{frequency}|{purpose}".encode("utf-8"))
+        return np.random.default_rng([self.random_seed, key])
+
+    def batch_settings(
+        self, interval: str = DEFAULT_INTERVAL, comparison_only: bool = False
+    ) -> Dict:
+        """
+        Settings a journaled batch row was computed with
+
+        A journal entry is only reused by a run with equal settings, so a
+        resumed row never lacks (or carries extra) factor or bootstrap
+        columns, nor comes from another interval or date window.
+
+        Args:
+            interval: Bar interval of the batch
+            comparison_only: Rows hold only the comparison metrics
+                (the Polars backend)
+
+        Returns:
+            JSON-serializable settings
+        """
+        return {
+            "interval": interval,
+            "frequency": DEFAULT_FREQUENCY,
+            "period": [str(self.start_date.date()), str(self.end_date.date())],
+            "factors": list(self.factor_tickers),
+            "bootstrap_resamples": self.bootstrap_resamples,
+            "random_seed": self.random_seed,
+            "metrics": "comparison" if comparison_only else "full",
+        }
+
+    def _resume_from_journal(
+        self,
+        journal: Optional[BatchJournal],
+        ticker: str,
+        benchmark: str,
+        settings: Dict,
+    ) -> Optional[BatchResult]:
+        """Journaled result of a pair, projected onto record_columns()"""
+        if journal is None:
+            return None
+        row = journal.completed_row(ticker, benchmark, settings)
+        if row is None:
+            return None
+        row = {column: row.get(column) for column in self.record_columns()}
+        return BatchResult(ticker=ticker, benchmark_ticker=benchmark, row=row)
+
+    def _analyze_for_batch(
+        self,
+        ticker: str,
+        benchmark: str,
+        journal: Optional[BatchJournal] = None,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> BatchResult:
+        """Analyze one ticker, capturing failures instead of raising"""
+        settings = self.batch_settings(interval)
+        resumed = self._resume_from_journal(journal, ticker, benchmark, settings)
+        if resumed is not None:
+            self._print(f"\nSkipping {ticker} (completed in journal)")
+            return resumed
+
+        self._print(f"\nAnalyzing {ticker}...")
+        try:
+            report, _, _ = self.analyze_stock(
+                ticker,
+                benchmark_ticker=benchmark,
+                plot_results=False,
+                interval=interval,
+            )
+            result = BatchResult(ticker=ticker, benchmark_ticker=benchmark, report=report)
+        except Exception as e:
+            self._print(f"Error analyzing {ticker}: {e}")
+            result = BatchResult(ticker=ticker, benchmark_ticker=benchmark, error=str(e))
+
+        if journal is not None:
+            journal.record(result, settings)
+        return result
+
+    def iter_stock_results(
+        self,
+        ticker_items: Iterable[Tuple[str, str]],
+        max_workers: int = 1,
+        max_in_flight: Optional[int] = None,
+        journal: Optional[BatchJournal] = None,
+        interval: str = DEFAULT_INTERVAL,
+        memory_budget_mb: Optional[float] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Analyze stocks lazily, yielding each result as soon as it is ready
+
+        The input iterable is consumed only as fast as results are produced,
+        so at most `max_in_flight` analyses are held in memory at any time.
+        With more than one worker, results are yielded in completion order.
+
+        Args:
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            max_workers: Number of worker threads (1 = run inline, in order)
+            max_in_flight: Maximum submitted but unconsumed analyses
+                (defaults to twice the number of workers)
+            journal: Journal recording each outcome; tickers it lists as
+                completed are restored instead of re-analyzed
+            interval: Bar interval passed to analyze_stock
+            memory_budget_mb: Process memory budget; analyses in flight are
+                reduced (down to one) while memory nears it and restored as
+                it falls (see MemoryBudget)
+
+        Yields:
+            BatchResult for every input pair
+        """
+        if max_workers <= 1:
+            for ticker, benchmark in ticker_items:
+                yield self._analyze_for_batch(ticker, benchmark, journal, interval)
+            return
+
+        max_in_flight = max(max_in_flight or 2 * max_workers, max_workers)
+        budget = (
+            MemoryBudget(memory_budget_mb, max_in_flight)
+            if memory_budget_mb is not None
+            else None
+        )
+        items = iter(ticker_items)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = deque()
+            exhausted = False
+
+            while True:
+                limit = budget.update(len(in_flight)) if budget else max_in_flight
+                while not exhausted and len(in_flight) < limit:
+                    try:
+                        ticker, benchmark = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    in_flight.append(
+                        executor.submit(
+                            self._analyze_for_batch,
+                            ticker,
+                            benchmark,
+                            journal,
+                            interval,
+                        )
+                    )
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield future.result()
+
+    def _load_panel_returns(
+        self,
+        ticker_items: Iterable[Tuple[str, str]],
+        max_threads: int,
+        prices_to_series: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+    ):
+        """
+        Fetch daily returns of every stock, benchmark and factor once
+
+        Args:
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            max_threads: Concurrent fetches
+            prices_to_series: Series kept from each fetched price frame
+                (daily returns by default)
+
+        Returns:
+            Tuple of (stock returns, benchmark and factor returns, names,
+            actual benchmark per requested benchmark, errors per stock)
+        """
+        ticker_items = list(ticker_items)
+        fetcher = self.data_fetcher
+        prices_to_series = prices_to_series or self.metrics_calculator.calculate_returns
+
+        def load_benchmark(benchmark):
+            data, actual = fetcher.fetch_benchmark_data(
+                benchmark, self.start_date, self.end_date
+            )
+            return actual, prices_to_series(data), fetcher.get_stock_name(actual)
+
+        def load_stock(ticker):
+            data = fetcher.fetch_stock_data(ticker, self.start_date, self.end_date)
+            return prices_to_series(data), fetcher.get_stock_name(ticker)
+
+        def capture(fn, key):
+            try:
+                return key, fn(key), None
+            except Exception as e:
+                return key, None, str(e)
+
+        stock_returns, benchmark_returns, names = {}, {}, {}
+        actual_benchmarks, errors = {}, {}
+
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            for factor, loaded, error in executor.map(
+                lambda f: capture(load_stock, f), self.factor_tickers
+            ):
+                if loaded is None:
+                    raise RuntimeError(f"Could not load factor {factor}: {error}")
+                benchmark_returns[factor] = loaded[0]
+
+            benchmarks = {b for _, b in ticker_items}
+            for benchmark, loaded, error in executor.map(
+                lambda b: capture(load_benchmark, b), benchmarks
+            ):
+                if loaded is None:
+                    errors[benchmark] = error
+                    continue
+                actual, returns, name = loaded
+                actual_benchmarks[benchmark] = actual
+                benchmark_returns[actual] = returns
+                names[actual] = name
+
+            for ticker, loaded, error in executor.map(
+                lambda t: capture(load_stock, t), {t for t, _ in ticker_items}
+            ):
+                if loaded is None:
+                    errors[ticker] = error
+                    continue
+                stock_returns[ticker], names[ticker] = loaded
+
+        return stock_returns, benchmark_returns, names, actual_benchmarks, errors
+
+    def iter_panel_results(
+        self,
+        ticker_items: Iterable[Tuple[str, str]],
+        processes: int,
+        journal: Optional[BatchJournal] = None,
+        panel_path: Optional[str] = None,
+        mp_context=None,
+    ) -> Iterator[BatchResult]:
+        """
+        Analyze daily data in worker processes sharing one returns panel
+
+        Prices are fetched once in this process and the aligned returns of
+        all stocks and benchmarks are published to shared memory. Worker
+        processes attach to the panel by name and read it in place, so
+        nothing but ticker names and result rows crosses process boundaries.
+        Results are yielded in completion order and carry result rows only.
+
+        Args:
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            processes: Number of worker processes
+            journal: Journal recording each outcome; tickers it lists as
+                completed are restored instead of re-analyzed
+            panel_path: Back the panel with a memory-mapped file at this
+                path instead of shared memory
+            mp_context: multiprocessing context for the workers
+
+        Yields:
+            BatchResult for every input pair
+        """
+        settings = self.batch_settings()
+        pending = []
+        for ticker, benchmark in ticker_items:
+            resumed = self._resume_from_journal(journal, ticker, benchmark, settings)
+            if resumed is not None:
+                yield resumed
+            else:
+                pending.append((ticker, benchmark))
+        if not pending:
+            return
+
+        def finish(result: BatchResult) -> BatchResult:
+            if journal is not None:
+                journal.record(result, settings)
+            return result
+
+        self._print(f"\nLoading returns of {len(pending)} stocks...")
+        with self._stage("panel_load"):
+            stock_returns, benchmark_returns, names, actual_benchmarks, errors = (
+                self._load_panel_returns(pending, max_threads=processes)
+            )
+
+        tasks = []
+        for ticker, benchmark in pending:
+            error = errors.get(benchmark) or errors.get(ticker)
+            if error is not None:
+                yield finish(
+                    BatchResult(ticker=ticker, benchmark_ticker=benchmark, error=error)
+                )
+            else:
+                tasks.append((ticker, benchmark))
+        if not tasks:
+            return
+
+        with self._stage("panel_publish"):
+            panel = SharedReturnsPanel.create(
+                stock_returns, benchmark_returns, path=panel_path
+            )
+        del stock_returns, benchmark_returns
+
+        analyzer_kwargs = {
+            "years_of_data": self.years_of_data,
+            "cache_dir": self.cache_dir,
+            "bootstrap_resamples": self.bootstrap_resamples,
+            "random_seed": self.random_seed,
+            "factor_tickers": self.factor_tickers,
+        }
+        with panel, ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=mp_context,
+            initializer=_init_panel_worker,
+            initargs=(panel.spec, analyzer_kwargs, self.start_date, self.end_date),
+        ) as executor:
+            futures = {}
+            for ticker, benchmark in tasks:
+                actual = actual_benchmarks[benchmark]
+                future = executor.submit(
+                    _run_panel_worker, ticker, names[ticker], actual, names[actual]
+                )
+                futures[future] = (ticker, benchmark)
+
+            for future in as_completed(futures):
+                ticker, benchmark = futures.pop(future)
+                try:
+                    result = BatchResult(
+                        ticker=ticker, benchmark_ticker=benchmark, row=future.result()
+                    )
+                except Exception as e:
+                    self._print(f"Error analyzing {ticker}: {e}")
+                    result = BatchResult(
+                        ticker=ticker, benchmark_ticker=benchmark, error=str(e)
+                    )
+                yield finish(result)
+
+    def iter_polars_results(
+        self,
+        ticker_items: Iterable[Tuple[str, str]],
+        max_threads: int = 1,
+        journal: Optional[BatchJournal] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Compute the comparison metrics of all stocks in one Polars query
+
+        Daily closes of every stock and benchmark are fetched once into a
+        long (Date, Ticker, Close) table; returns, volatilities, beta and
+        R-squared of all pairs then run as a single lazy, multi-threaded
+        query. Result rows carry the comparison columns of
+        AnalysisReport.to_record() (no tail risk, factor, drawdown or
+        regime metrics).
+
+        Args:
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            max_threads: Concurrent price fetches
+            journal: Journal recording each outcome; tickers it lists as
+                completed are restored instead of re-analyzed
+
+        Yields:
+            BatchResult for every input pair
+        """
+        settings = self.batch_settings(comparison_only=True)
+        pending = []
+        for ticker, benchmark in ticker_items:
+            resumed = self._resume_from_journal(journal, ticker, benchmark, settings)
+            if resumed is not None:
+                yield resumed
+            else:
+                pending.append((ticker, benchmark))
+        if not pending:
+            return
+
+        def finish(result: BatchResult) -> BatchResult:
+            if journal is not None:
+                journal.record(result, settings)
+            return result
+
+        self._print(f"\nLoading prices of {len(pending)} stocks...")
+        with self._stage("panel_load"):
+            closes, benchmark_closes, names, actual_benchmarks, errors = (
+                self._load_panel_returns(
+                    pending, max_threads, prices_to_series=lambda data: data["Close"]
+                )
+            )
+
+        tasks = []
+        for ticker, benchmark in pending:
+            error = errors.get(benchmark) or errors.get(ticker)
+            if error is not None:
+                yield finish(
+                    BatchResult(ticker=ticker, benchmark_ticker=benchmark, error=error)
+                )
+            else:
+                tasks.append((ticker, benchmark, actual_benchmarks[benchmark]))
+        if not tasks:
+            return
+
+        calculator = PolarsMetricsCalculator
+        with self._stage("polars_query"):
+            prices = calculator.price_table({**benchmark_closes, **closes})
+            del closes, benchmark_closes
+            summary = calculator.collect(
+                calculator.summary(
+                    calculator.returns(prices),
+                    calculator.pairs((ticker, actual) for ticker, _, actual in tasks),
+                )
+            )
+        metrics = {
+            (row.pop("Ticker"), row.pop("Benchmark_Ticker")): row
+            for row in summary.iter_rows(named=True)
+        }
+
+        period = f"{self.start_date.date()} to {self.end_date.date()}"
+        for ticker, benchmark, actual in tasks:
+            values = metrics[(ticker, actual)]
+            row = {
+                "Stock": names[ticker],
+                "Ticker": ticker,
+                "Benchmark": names[actual],
+                "Benchmark_Ticker": actual,
+                "Period": period,
+                "Stock_Volatility_Annual": values["Stock_Volatility_Annual"],
+                "Benchmark_Volatility_Annual": values["Benchmark_Volatility_Annual"],
+                "Beta": values["Beta"],
+                "R_Squared": values["R_Squared"],
+                "Volatility_Ratio": values["Volatility_Ratio"],
+                "Data_Points": int(values["Data_Points"]),
+                "Interval": DEFAULT_INTERVAL,
+                "Frequency": DEFAULT_FREQUENCY,
+                "Stock_Returns_Mean": values["Stock_Returns_Mean"],
+                "Benchmark_Returns_Mean": values["Benchmark_Returns_Mean"],
+            }
+            yield finish(
+                BatchResult(ticker=ticker, benchmark_ticker=benchmark, row=row)
+            )
+
     def compare_multiple_stocks(
-        self, ticker_dict: Dict[str, str], plot_comparison: bool = True
+        self,
+        ticker_dict: Dict[str, str],
+        plot_comparison: bool = True,
+        max_workers: int = 1,
+        journal_path: Optional[str] = None,
+        interval: str = DEFAULT_INTERVAL,
+        processes: int = 0,
+        export_path: Optional[str] = None,
+        backend: str = DEFAULT_COMPARISON_BACKEND,
+        group_aggregator: Optional[GroupAggregator] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        memory_budget_mb: Optional[float] = None,
     ) -> Optional[pd.DataFrame]:
         """
         Compare multiple stocks against their respective benchmarks
@@ -144,32 +1070,117 @@ class VolatilityAnalyzer:
         Args:
             ticker_dict: Dictionary mapping stock ticker symbols to their benchmark ticker symbols
             plot_comparison: Whether to create comparison plots
+            max_workers: Number of stocks analyzed concurrently
+            journal_path: Batch journal for checkpointing; a rerun with the
+                same journal skips completed tickers and retries failures
+            interval: Bar interval ("1d" or intraday such as "5m", "1h")
+            processes: Worker processes reading a shared returns panel
+                (daily data only); 0 analyzes in threads of this process
+            export_path: Also write the full typed results table here
+                (.parquet, .arrow, .csv or .jsonl)
+            backend: "pandas" builds a full report per stock; "polars"
+                computes only the comparison columns for all stocks in one
+                lazy Polars query (daily data only, needs polars)
+            group_aggregator: Aggregator fed with every result as it
+                arrives, e.g. by sector; read its to_frame() afterwards
+            snapshot_store: Store the metrics are appended to as a
+                snapshot dated at the end of the analysis period
+            memory_budget_mb: Process memory budget that lowers the number
+                of concurrent analyses as memory nears it (threaded pandas
+                analyses only)
 
         Returns:
-            DataFrame with comparison results
+            DataFrame with comparison results (numeric, percentages as floats)
         """
+        if backend not in COMPARISON_BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}', use one of "
+                f"{', '.join(COMPARISON_BACKENDS)}"
+            )
+        self._check_intraday_options(interval)
         results_list = []
 
-        print(f"\nComparing {len(ticker_dict)} stocks...")
-        print("-" * 80)
+        journal = BatchJournal(journal_path) if journal_path else None
 
-        for ticker, benchmark in ticker_dict.items():
-            print(f"\nAnalyzing {ticker}...")
-            try:
-                report, _, _ = self.analyze_stock(
-                    ticker, benchmark_ticker=benchmark, plot_results=False
+        self._print(f"\nComparing {len(ticker_dict)} stocks...")
+        if journal is not None and journal.completed_count:
+            self._print(f"Resuming from {journal_path}")
+        self._print("-" * 80)
+
+        if backend == "polars":
+            if self.metrics_calculator.is_intraday(interval) or processes > 0:
+                raise ValueError(
+                    "The polars backend supports daily (1d) data in this "
+                    "process only"
                 )
-                results_list.append(report.to_dict())
-            except Exception as e:
-                print(f"Error analyzing {ticker}: {e}")
-                continue
+            results = self.iter_polars_results(
+                ticker_dict.items(), max_threads=max_workers, journal=journal
+            )
+        elif processes > 0:
+            if self.metrics_calculator.is_intraday(interval):
+                raise ValueError("Worker processes support daily (1d) data only")
+            results = self.iter_panel_results(
+                ticker_dict.items(), processes, journal=journal
+            )
+        else:
+            results = self.iter_stock_results(
+                ticker_dict.items(),
+                max_workers=max_workers,
+                journal=journal,
+                interval=interval,
+                memory_budget_mb=memory_budget_mb,
+            )
+
+        for result in results:
+            if result.ok:
+                results_list.append(result.to_row())
+            if group_aggregator is not None:
+                group_aggregator.add(result)
 
         if not results_list:
-            print("No results to compare")
+            self._print("No results to compare")
             return None
 
-        # Create comparison dataframe
-        df = pd.DataFrame(results_list)
+        comparison_df = self._build_comparison_df(results_list)
+
+        if group_aggregator is not None:
+            self._print("\n" + "=" * 80)
+            self._print("GROUP SUMMARY")
+            self._print("=" * 80)
+            self._print(
+                format_frame(group_aggregator.to_frame()).to_string(index=False)
+            )
+
+        if export_path is not None:
+            write_table(records_to_frame(results_list), export_path)
+            self._print(f"Results written to {export_path}")
+
+        if snapshot_store is not None:
+            snapshot_store.append(
+                records_to_frame(results_list), snapshot_date=self.end_date
+            )
+            self._print(
+                f"Snapshot of {self.end_date.date()} added to {snapshot_store.root}"
+            )
+
+        # Visualize comparison
+        if plot_comparison and len(comparison_df) > 1:
+            self.visualizer.plot_comparison(comparison_df)
+
+        return comparison_df
+
+    @staticmethod
+    def build_comparison_table(results_list: list) -> pd.DataFrame:
+        """
+        Build the comparison table from result records
+
+        Args:
+            results_list: Records as produced by AnalysisReport.to_record()
+
+        Returns:
+            Typed DataFrame of comparison columns sorted by volatility
+        """
+        df = records_to_frame(results_list)
         comparison_cols = [
             "Stock",
             "Ticker",
@@ -180,26 +1191,106 @@ class VolatilityAnalyzer:
             "R_Squared",
             "Volatility_Ratio",
         ]
-        comparison_df = df[comparison_cols].copy()
-
-        # Convert volatility to float for sorting
-        comparison_df["Volatility_Pct"] = (
-            comparison_df["Stock_Volatility_Annual"].str.rstrip("%").astype(float)
+        return df[comparison_cols].sort_values(
+            "Stock_Volatility_Annual", ascending=False
         )
-        comparison_df = comparison_df.sort_values("Volatility_Pct", ascending=False)
 
-        # Print comparison summary
-        print("\n" + "=" * 80)
-        print("STOCK COMPARISON SUMMARY")
-        print("=" * 80)
-        print(comparison_df.to_string(index=False))
+    def _build_comparison_df(
+        self, results_list: list, title: str = "STOCK COMPARISON SUMMARY"
+    ) -> pd.DataFrame:
+        """Build, sort and print the comparison table from result records"""
+        comparison_df = self.build_comparison_table(results_list)
 
-        # Visualize comparison
-        if plot_comparison and len(comparison_df) > 1:
-            self.visualizer.plot_comparison(comparison_df)
+        # Print comparison summary
+        self._print("\n" + "=" * 80)
+        self._print(title)
+        self._print("=" * 80)
+        self._print(format_frame(comparison_df).to_string(index=False))
 
         return comparison_df
 
+    def compare_multiple_frequencies(
+        self,
+        ticker_dict: Dict[str, str],
+        frequencies: Sequence[str] = ("D", "W", "M"),
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Compare stocks at several return frequencies from one data load
+
+        Args:
+            ticker_dict: Dictionary mapping stock ticker symbols to their benchmark ticker symbols
+            frequencies: Frequencies to compute ("D", "W", "M")
+
+        Returns:
+            Dictionary mapping frequency to comparison DataFrame
+        """
+        results_by_frequency = {frequency: [] for frequency in frequencies}
+
+        self._print(f"\nComparing {len(ticker_dict)} stocks at {', '.join(frequencies)}...")
+        self._print("-" * 80)
+
+        for ticker, benchmark in ticker_dict.items():
+            try:
+                reports = self.analyze_stock_frequencies(ticker, benchmark, frequencies)
+            except Exception as e:
+                self._print(f"Error analyzing {ticker}: {e}")
+                continue
+
+            for frequency, report in reports.items():
+                results_by_frequency[frequency].append(report.to_record())
+
+        return {
+            frequency: self._build_comparison_df(
+                results, title=f"STOCK COMPARISON SUMMARY ({frequency})"
+            )
+            for frequency, results in results_by_frequency.items()
+            if results
+        }
+
+    def returns_panel(
+        self, tickers: Iterable[str], max_threads: int = 4
+    ) -> pd.DataFrame:
+        """
+        Daily returns of several stocks on a shared date index
+
+        The input of CorrelationCalculator for pairwise correlation and
+        clustering.
+
+        Args:
+            tickers: Stock ticker symbols
+            max_threads: Concurrent fetches
+
+        Returns:
+            Date x ticker returns, NaN where a stock has no return; stocks
+            that fail to load are left out
+        """
+        fetcher = self.data_fetcher
+
+        def load(ticker):
+            try:
+                data = fetcher.fetch_stock_data(ticker, self.start_date, self.end_date)
+                return ticker, self.metrics_calculator.calculate_returns(data)
+            except Exception as e:
+                self._print(f"Error loading {ticker}: {e}")
+                return ticker, None
+
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            loaded = [
+                (ticker, returns)
+                for ticker, returns in executor.map(load, dict.fromkeys(tickers))
+                if returns is not None and not returns.empty
+            ]
+        if not loaded:
+            return pd.DataFrame()
+        return pd.concat(dict(loaded), axis=1).sort_index()
+
+    def record_columns(self) -> List[str]:
+        """Every column of the result records this analyzer produces"""
+        return record_columns(
+            (MARKET_FACTOR, *self.factor_tickers),
+            bootstrap=self.bootstrap_resamples > 0,
+        )
+
     def clear_cache(self, ticker: Optional[str] = None):
         """
         Clear cached data
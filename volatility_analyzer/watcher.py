@@ -0,0 +1,339 @@
+"""
+# @ Author: Meet Patel
+# @ Create Time: 2026-10-19 18:31:09
+# @ Modified by: Meet Patel
+# @ Modified time: 2026-10-19 18:31:09
+# @ Description: Watch mode that reanalyzes only tickers whose data changed
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from volatility_analyzer.config import (
+    DEFAULT_INTERVAL,
+    DEFAULT_WATCH_POLL_SECONDS,
+    WATCH_PROBE_DAYS,
+)
+from volatility_analyzer.data_models import BatchResult, records_to_frame
+from volatility_analyzer.logging_config import get_logger
+from volatility_analyzer.result_writers import read_table, write_table
+from volatility_analyzer.volatility_analyzer import VolatilityAnalyzer
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """Fingerprint of the most recent bars of a ticker, one entry per day"""
+
+    days: Dict[str, List]  # Day -> [bars, sum of closes, last close]
+
+    @classmethod
+    def of(cls, data: pd.DataFrame) -> Optional["DataVersion"]:
+        """Version of a price frame, or None when it is empty"""
+        if data is None or data.empty:
+            return None
+        closes = data["Close"].dropna()
+        if closes.empty:
+            return None
+        return cls(
+            days={
+                str(day): [
+                    int(len(day_closes)),
+                    round(float(day_closes.sum()), 6),
+                    round(float(day_closes.iloc[-1]), 6),
+                ]
+                for day, day_closes in closes.groupby(closes.index.date)
+            }
+        )
+
+    def changed_since(self, old: Optional["DataVersion"]) -> bool:
+        """
+        Whether bars were added, revised or removed since an older version
+
+        Days that rolled out of the probe window are not a change.
+        """
+        if old is None:
+            return True
+        first = min(self.days)
+        revised = any(old.days.get(day) != value for day, value in self.days.items())
+        removed = any(day >= first and day not in self.days for day in old.days)
+        return revised or removed
+
+
+def _bar_closes(data: pd.DataFrame) -> Dict[str, float]:
+    """Close of every bar by timestamp, rounded as in DataVersion"""
+    closes = data["Close"].dropna()
+    return {str(ts): round(float(c), 6) for ts, c in closes.items()}
+
+
+def _changed_bars(old: Dict[str, float], new: Dict[str, float]) -> Set[str]:
+    """Timestamps of bars added, revised or removed between two probes"""
+    changed = {ts for ts, close in new.items() if old.get(ts) != close}
+    if new:
+        # Bars before the new probe window rolled out, they did not change
+        first = min(new)
+        changed.update(ts for ts in old if ts >= first and ts not in new)
+    return changed
+
+
+class UniverseWatcher:
+    """
+    Keeps analysis results of a ticker universe current at minimal cost.
+
+    Every poll fetches the last few days of each stock, benchmark and
+    factor in bulk downloads and compares their fingerprints with the
+    previous poll. A stock is reanalyzed when its own bars changed, or when
+    its benchmark or a factor has new or revised bars on dates the stock
+    has: a benchmark bar the stock lacks drops out of the aligned returns,
+    so the index's newest bar alone does not touch stocks that have not
+    traded it yet. The latest result of every other stock is kept as is.
+    Versions, the recent benchmark / factor closes and the latest results
+    are persisted, so a restarted watcher picks up where it stopped
+    instead of reanalyzing the universe.
+    """
+
+    def __init__(
+        self,
+        analyzer: VolatilityAnalyzer,
+        ticker_items: Iterable[Tuple[str, str]],
+        output_path: Optional[str] = None,
+        state_path: Optional[str] = None,
+        max_workers: int = 1,
+        interval: str = DEFAULT_INTERVAL,
+        probe_days: int = WATCH_PROBE_DAYS,
+        on_update: Optional[Callable[[List[BatchResult]], None]] = None,
+    ):
+        """
+        Initialize universe watcher
+
+        Args:
+            analyzer: Analyzer used to fetch data and run analyses
+            ticker_items: Iterable of (stock ticker, benchmark ticker) pairs
+            output_path: Latest results table, rewritten atomically when
+                anything changed (.parquet, .arrow, .csv or .jsonl)
+            state_path: JSON file persisting data versions between runs
+                (defaults to output_path + ".state.json")
+            max_workers: Concurrent analyses of changed tickers
+            interval: Bar interval passed to analyze_stock
+            probe_days: Recent days fetched to fingerprint a ticker
+            on_update: Called with the fresh results after each poll that
+                reanalyzed something
+        """
+        self.analyzer = analyzer
+        self.ticker_items = list(ticker_items)
+        self.output_path = output_path
+        if state_path is None and output_path is not None:
+            state_path = f"{output_path}.state.json"
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.interval = interval
+        self.probe_days = probe_days
+        self.on_update = on_update
+
+        self.versions: Dict[str, DataVersion] = {}
+        # Recent closes of benchmarks and factors, to date their changes
+        self.reference_closes: Dict[str, Dict[str, float]] = {}
+        self.results: Dict[str, Dict] = {}  # Latest record per stock ticker
+        self.errors: Dict[Tuple[str, str], str] = {}
+        self.polls = 0
+        self._load_state()
+
+    def _load_state(self):
+        """Restore versions and the published results of a previous run"""
+        if self.state_path and os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            for ticker, version in state.get("versions", {}).items():
+                try:
+                    self.versions[ticker] = DataVersion(**version)
+                except TypeError:
+                    continue  # Older state format: probe the ticker afresh
+            self.reference_closes = state.get("reference_closes", {})
+
+        if self.output_path and os.path.exists(self.output_path):
+            rows = read_table(self.output_path)
+            wanted = {ticker for ticker, _ in self.ticker_items}
+            for row in rows.to_dict("records"):
+                if row["Ticker"] in wanted:
+                    self.results[row["Ticker"]] = row
+
+        # A stock without a published result must run even if its data did
+        # not change since the versions were saved
+        for ticker, _ in self.ticker_items:
+            if ticker not in self.results:
+                self.versions.pop(ticker, None)
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        state = {
+            "versions": {t: asdict(v) for t, v in self.versions.items()},
+            "reference_closes": self.reference_closes,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _publish(self):
+        if not self.output_path or not self.results:
+            return
+        table = records_to_frame(
+            self.results.values(), columns=self.analyzer.record_columns()
+        )
+        suffix = os.path.splitext(self.output_path)[1]
+        tmp_path = f"{self.output_path}.tmp{suffix}"
+        write_table(table, tmp_path)
+        os.replace(tmp_path, self.output_path)
+
+    def _roll_dates(self):
+        """Move the analysis window so it ends now"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * self.analyzer.years_of_data)
+        self.analyzer.set_date_range(start_date, end_date)
+
+    def _probe(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Recent bars of every ticker, fetched in bulk"""
+        end_date = self.analyzer.end_date
+        # Whole days, so a day's fingerprint does not depend on the poll time
+        start_date = pd.Timestamp(end_date - timedelta(days=self.probe_days))
+        return self.analyzer.data_fetcher.fetch_recent_bars(
+            tickers, start_date.normalize(), end_date, interval=self.interval
+        )
+
+    def changed_tickers(self) -> Set[Tuple[str, str]]:
+        """
+        Probe every ticker and return the pairs whose inputs changed
+
+        Returns:
+            Set of (stock ticker, benchmark ticker) pairs to reanalyze
+        """
+        factors = self.analyzer.factor_tickers
+        references = list(
+            dict.fromkeys([*factors, *(b for _, b in self.ticker_items)])
+        )
+        tickers = list(
+            dict.fromkeys([*references, *(t for t, _ in self.ticker_items)])
+        )
+        frames = self._probe(tickers)
+
+        new_versions: Dict[str, DataVersion] = {}
+        changed: Set[str] = set()
+        for ticker in tickers:
+            version = DataVersion.of(frames.get(ticker))
+            if version is None:
+                # Unknown state: keep the old version and retry next poll
+                if ticker in self.versions:
+                    new_versions[ticker] = self.versions[ticker]
+                else:
+                    changed.add(ticker)
+                continue
+            new_versions[ticker] = version
+            if version.changed_since(self.versions.get(ticker)):
+                changed.add(ticker)
+
+        # Bars each changed benchmark / factor added or revised (None when
+        # unknown, which affects every stock using it)
+        changed_bars: Dict[str, Optional[Set[str]]] = {}
+        for reference in references:
+            closes = _bar_closes(frames[reference]) if reference in frames else None
+            previous = self.reference_closes.get(reference)
+            if reference in changed:
+                if closes is None or previous is None:
+                    changed_bars[reference] = None
+                else:
+                    changed_bars[reference] = _changed_bars(previous, closes)
+            if closes is not None:
+                self.reference_closes[reference] = closes
+
+        def touches(reference: str, ticker: str) -> bool:
+            if reference not in changed_bars:
+                return False
+            bars = changed_bars[reference]
+            if bars is None or ticker not in frames:
+                return True
+            return any(str(ts) in bars for ts in frames[ticker].index)
+
+        self.versions.update(new_versions)
+        return {
+            (t, b)
+            for t, b in self.ticker_items
+            if t in changed
+            or touches(b, t)
+            or any(touches(factor, t) for factor in factors)
+        }
+
+    def poll_once(self) -> List[BatchResult]:
+        """
+        Run one poll: probe, reanalyze changed tickers and publish
+
+        Returns:
+            Results of the tickers reanalyzed in this poll
+        """
+        self.polls += 1
+        self._roll_dates()
+        pending = self.changed_tickers()
+        # Retry earlier failures even if their data did not change
+        pending |= set(self.errors)
+
+        if not pending:
+            logger.info(f"Poll {self.polls}: no data changes")
+            self._save_state()
+            return []
+
+        start = time.perf_counter()
+        fresh = []
+        for result in self.analyzer.iter_stock_results(
+            [item for item in self.ticker_items if item in pending],
+            max_workers=self.max_workers,
+            interval=self.interval,
+        ):
+            key = (result.ticker, result.benchmark_ticker)
+            if result.ok:
+                self.results[result.ticker] = result.to_row()
+                self.errors.pop(key, None)
+            else:
+                self.errors[key] = result.error
+                logger.warning(f"Error analyzing {result.ticker}: {result.error}")
+            fresh.append(result)
+
+        self._publish()
+        self._save_state()
+        logger.info(
+            f"Poll {self.polls}: reanalyzed {len(fresh)} of "
+            f"{len(self.ticker_items)} tickers in {time.perf_counter() - start:.1f}s"
+        )
+        if self.on_update is not None:
+            self.on_update(fresh)
+        return fresh
+
+    def run(
+        self,
+        poll_seconds: float = DEFAULT_WATCH_POLL_SECONDS,
+        max_polls: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        """
+        Poll until stopped
+
+        Args:
+            poll_seconds: Seconds between the starts of consecutive polls
+            max_polls: Stop after this many polls (None = run forever)
+            stop_event: Event that ends the loop when set
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            if max_polls is not None and self.polls >= max_polls:
+                break
+            stop_event.wait(max(0.0, poll_seconds - (time.monotonic() - started)))